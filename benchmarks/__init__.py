@@ -0,0 +1 @@
+"""Benchmarks of the plumkdocs rendering pipeline on synthetic plum modules."""
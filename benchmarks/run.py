@@ -0,0 +1,173 @@
+"""Times the stages of `mod_to_string` on synthetic plum modules.
+
+Usage::
+
+    python -m benchmarks.run --overloads 10,100,1000 --output results.json
+
+Sizes are comma-separated lists and every combination is benchmarked, so that
+varying one of them gives the scaling curve of each stage. Results are written
+as JSON.
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import ModuleSpec, write_module
+
+STAGES = ["import", "scan", "extract", "parse_docs", "signature", "render", "mod_to_string"]
+
+_counter = itertools.count()
+
+
+def _reset():
+    # Each repetition starts from cold in-process caches
+    from plumkdocs import main
+    from plumkdocs.formatting import DefaultFormatter, TypeFormatter
+
+    main.build_cache.clear()
+    main.invalidate_module_index()
+    main.docstring_cache.clear()
+    main.type_formatter = TypeFormatter()
+    main.default_formatter = DefaultFormatter()
+
+
+def run_once(spec, directory):
+    """Times each stage once on a freshly written module, returns the stage ->
+    seconds mapping."""
+    from plumkdocs import main
+
+    _reset()
+    module_name = f"plumkdocs_bench_{next(_counter)}"
+    write_module(directory, module_name, spec)
+    importlib.invalidate_caches()
+    timings = {}
+
+    start = time.perf_counter()
+    mod = importlib.import_module(module_name)
+    timings["import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    operators = main._find_operators(mod)
+    timings["scan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    implementations = [main._extract_implementations(op) for op in operators]
+    timings["extract"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for function in implementations:
+        for implementation in function:
+            implementation.doc  # noqa: B018
+    timings["parse_docs"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for function in implementations:
+        for implementation in function:
+            implementation._signature  # noqa: B018
+    timings["signature"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for function in implementations:
+        main.renderer.render_overloads([i.ir for i in function])
+    timings["render"] = time.perf_counter() - start
+
+    # End to end, from a cold cache but with the module already imported
+    _reset()
+    start = time.perf_counter()
+    main.mod_to_string(module_name)
+    timings["mod_to_string"] = time.perf_counter() - start
+
+    sys.modules.pop(module_name, None)
+    return timings
+
+
+def run(spec, repeat=3, directory=None):
+    """Benchmarks `spec` `repeat` times, returns the statistics of each stage."""
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        sys.path.insert(0, tmp)
+        try:
+            runs = [run_once(spec, tmp) for _ in range(repeat)]
+        finally:
+            sys.path.remove(tmp)
+
+    stages = {}
+    for stage in STAGES:
+        samples = [r[stage] for r in runs]
+        stages[stage] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "samples": samples,
+        }
+    return {"spec": spec.as_dict(), "stages": stages}
+
+
+def environment():
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for package in ("plumkdocs", "plum-dispatch", "griffe", "markdown", "pygments", "jinja2"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "packages": versions,
+    }
+
+
+def _sizes(text):
+    return [int(x) for x in text.split(",")]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=_sizes, default=[10])
+    parser.add_argument("--overloads", type=_sizes, default=[10])
+    parser.add_argument("--params", type=_sizes, default=[3])
+    parser.add_argument("--doc-lines", type=_sizes, default=[5])
+    parser.add_argument("--annotation-depth", type=_sizes, default=[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="JSON file of the results, printed if not given")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Docstrings are parsed without their function, griffe warns about the types
+    logging.getLogger("griffe").setLevel(logging.ERROR)
+    sizes = {
+        "functions": args.functions,
+        "overloads": args.overloads,
+        "params": args.params,
+        "doc_lines": args.doc_lines,
+        "annotation_depth": args.annotation_depth,
+    }
+    results = []
+    for values in itertools.product(*sizes.values()):
+        spec = ModuleSpec(**dict(zip(sizes, values, strict=True)))
+        result = run(spec, args.repeat)
+        results.append(result)
+        summary = ", ".join(f"{s} {result['stages'][s]['median'] * 1e3:.1f}ms" for s in STAGES)
+        print(f"{spec}: {summary}", file=sys.stderr)
+
+    output = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Generation of synthetic plum modules of configurable size."""
+
+import os
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """Shape of a synthetic module.
+
+    Each of the `functions` dispatched functions gets `overloads` methods, told
+    apart by the annotation of their first parameter, with `params` parameters
+    each. Docstrings have `doc_lines` lines of text besides the parameters and
+    returns sections, and `annotation_depth` controls the nesting of the
+    `typing` annotations of the other parameters.
+    """
+
+    functions: int = 10
+    overloads: int = 10
+    params: int = 3
+    doc_lines: int = 5
+    annotation_depth: int = 1
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _annotation(depth, i):
+    # Nested `typing` annotation, e.g. `Union[Dict[str, C1], List[int]]` for depth 2
+    if depth <= 0:
+        return "int" if i % 2 else f"C{i % 8}"
+    inner = _annotation(depth - 1, i + 1)
+    if depth % 2:
+        return f"Union[{inner}, List[{_annotation(depth - 1, i + 2)}]]"
+    return f"Dict[str, {inner}]"
+
+
+def _docstring(spec, name, overload, indent="    "):
+    # Unique per overload, as docstrings are cached by their text
+    lines = [f"Overload {overload} of `{name}` generated for benchmarking.", ""]
+    lines += [
+        f"Line {k} of the description, with some *Markdown* in it." for k in range(spec.doc_lines)
+    ]
+    lines += ["", "Args:"]
+    lines += [f"    p{k}: Description of the parameter `p{k}`." for k in range(spec.params)]
+    lines += ["", "Returns:", "    int: The result."]
+    body = "\n".join(f"{indent}{line}" if line else "" for line in lines)
+    return f'{indent}"""{body.lstrip()}\n{indent}"""'
+
+
+def module_source(spec):
+    """Returns the source of a module with the shape given by `spec`."""
+    lines = [
+        "from typing import Dict, List, Union",
+        "",
+        "from plum import Dispatcher",
+        "",
+        "dispatch = Dispatcher()",
+        "",
+    ]
+    # Classes used to tell the overloads apart, and in the annotations
+    for k in range(max(spec.overloads, 8)):
+        lines += [f"class C{k}:", "    pass", ""]
+
+    for f in range(spec.functions):
+        name = f"function_{f}"
+        lines += [
+            "",
+            "@dispatch.abstract",
+            f"def {name}(p0):",
+            f'    """Base documentation of `{name}`."""',
+            "",
+        ]
+        for o in range(spec.overloads):
+            params = [f"p0: C{o}"]
+            params += [
+                f"p{k}: {_annotation(spec.annotation_depth, k + o)}"
+                for k in range(1, spec.params - 1)
+            ]
+            if spec.params > 1:
+                # Plum checks that defaults are instances of their annotation
+                params.append(f"p{spec.params - 1}: int = {spec.params - 1}")
+            lines += [
+                "",
+                "@dispatch",
+                f"def {name}({', '.join(params)}) -> int:",
+                _docstring(spec, name, o),
+                "    return 0",
+                "",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def write_module(directory, module_name, spec):
+    """Writes the module `module_name` with the shape `spec` in `directory`,
+    returns its path."""
+    path = os.path.join(directory, f"{module_name}.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(module_source(spec))
+    return path
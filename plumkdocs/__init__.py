@@ -1,3 +1,14 @@
-from .main import define_env, mod_to_string
+__all__ = ["mod_to_string", "mod_to_strings", "pkg_to_strings", "define_env", "on_post_build"]
 
-__all__ = ["mod_to_string", "define_env"]
+
+def __getattr__(name):
+    # The rendering machinery is only loaded when one of its functions is used
+    if name in __all__:
+        from . import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
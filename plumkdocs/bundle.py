@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import os
+
+log = logging.getLogger("mkdocs.plugins.plumkdocs")
+
+# Version of the bundle layout, bundles of another version are ignored
+FORMAT = 2
+
+
+def fingerprint(static=False):
+    """Identifies everything besides the documented code that the fragments
+    depend on: the versions of the rendering packages and the rendering
+    configuration of the current build."""
+    from . import main
+    from .disk_cache import _render_versions
+
+    h = hashlib.sha256()
+    h.update(f"{FORMAT}|{_render_versions()}|{static}|".encode())
+    h.update(main._render_fingerprint().encode())
+    return h.hexdigest()
+
+
+def _key(module, function=None):
+    # Module names cannot contain colons
+    return f"{module}:{function or ''}"
+
+
+def _package_key(module, package, include=None, exclude=None):
+    # Fragment of `module` in `pkg_to_strings(package, include, exclude)`, in
+    # which re-exported functions are dropped
+    return f"{module}:@{package}|{','.join(include or ())}|{','.join(exclude or ())}"
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def module_sources(module, files):
+    """Returns the file -> stat mapping recorded for a module: the files defining
+    its functions and the file of the module itself, so that adding a function
+    to it is noticed."""
+    import importlib.util
+
+    files = set(files)
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is not None and spec.origin is not None and os.path.isfile(spec.origin):
+        files.add(os.path.realpath(spec.origin))
+    return {path: _stat(path) for path in sorted(files)}
+
+
+def package_sources(modules):
+    """Returns the directory -> stat mapping recorded for a package walk: the
+    directories of the walked packages, so that adding a submodule is noticed."""
+    import importlib.util
+
+    directories = set()
+    for module in modules:
+        try:
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ValueError):
+            continue
+        if spec is not None and spec.submodule_search_locations:
+            directories.update(os.path.realpath(d) for d in spec.submodule_search_locations)
+    return {path: _stat(path) for path in sorted(directories)}
+
+
+class Bundle:
+    """Fragments rendered ahead of the build by the `plumkdocs` command.
+
+    The fragments are kept in a `FragmentStore`, which is memory-mapped so that
+    only the fragments served are read. The fragments of a module are only
+    served while the files they were rendered from are unchanged, as recorded
+    by their modification time and size. Modules which changed are rendered by
+    the build as usual.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.path = store.path
+        self.context = store.metadata["context"]
+        self.modules = store.metadata["modules"]
+        self.packages = store.metadata.get("packages", {})
+        self.hits = 0
+        self._fresh = {}
+
+    @classmethod
+    def load(cls, path):
+        from .store import FragmentStore
+
+        store = FragmentStore(path)
+        if store.metadata.get("format") != FORMAT:
+            store.close()
+            raise ValueError(f"unsupported bundle format {store.metadata.get('format')!r}")
+        return cls(store)
+
+    def fresh(self, module):
+        """Whether the fragments of `module` are up to date."""
+        fresh = self._fresh.get(module)
+        if fresh is None:
+            entry = self.modules.get(module)
+            fresh = entry is not None and all(
+                _stat(path) == stat for path, stat in entry["sources"].items()
+            )
+            self._fresh[module] = fresh
+        return fresh
+
+    def functions(self, module):
+        """Names of the plum functions of `module`, `None` if it is not fresh."""
+        if not self.fresh(module):
+            return None
+        return list(self.modules[module]["functions"])
+
+    def get(self, module, function=None):
+        """Returns the fragment of `mod_to_string(module, function)`, or `None`."""
+        if not self.fresh(module):
+            return None
+        text = self.store.get(_key(module, function))
+        if text is not None:
+            self.hits += 1
+        return text
+
+    def package(self, package, include=None, exclude=None):
+        """Returns the fragments of `pkg_to_strings(package, include, exclude)`,
+        or `None` unless all the walked modules are up to date."""
+        entry = self.packages.get(_package_key("", package, include, exclude))
+        if entry is None:
+            return None
+        if not all(self.fresh(module) for module in entry["walked"]) or any(
+            _stat(path) != stat for path, stat in entry["sources"].items()
+        ):
+            return None
+        fragments = {
+            module: self.store.get(_package_key(module, package, include, exclude))
+            for module in entry["modules"]
+        }
+        if None in fragments.values():
+            return None
+        self.hits += len(fragments)
+        return fragments
+
+    def close(self):
+        self.store.close()
+
+
+def write(path, context, modules, fragments, packages=None):
+    """Writes a bundle atomically.
+
+    `modules` maps each module to its `functions` and `sources`, and `fragments`
+    maps `(module, function)` to the rendered HTML, `function` being `None` for
+    the fragment of the whole module. `packages` maps each walked
+    `(package, include, exclude)` to its `walked` modules, the directories
+    they were found in as `sources`, and the module -> HTML `fragments` of
+    `pkg_to_strings`.
+    """
+    from . import store
+
+    entries = {_key(*key): text for key, text in fragments.items()}
+    walks = {}
+    for (package, include, exclude), walk in (packages or {}).items():
+        for module, text in walk["fragments"].items():
+            entries[_package_key(module, package, include, exclude)] = text
+        walks[_package_key("", package, include, exclude)] = {
+            "walked": walk["walked"],
+            "modules": list(walk["fragments"]),
+            "sources": walk["sources"],
+        }
+    store.write(
+        path,
+        entries,
+        {"format": FORMAT, "context": context, "modules": modules, "packages": walks},
+    )
+
+
+def resolve_path(options, config_file=None):
+    """Path of the bundle configured in mkdocs.yml, relative to mkdocs.yml."""
+    path = options.get("bundle")
+    if not path:
+        return None
+    path = os.path.expanduser(path)
+    if config_file and not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(os.path.abspath(config_file)), path)
+    return os.path.abspath(path)
+
+
+def from_options(options, config_file=None):
+    """Loads the bundle configured in mkdocs.yml, if it exists and was rendered
+    with the configuration of the current build."""
+    path = resolve_path(options, config_file)
+    if path is None or not os.path.isfile(path):
+        return None
+    try:
+        bundle = Bundle.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        log.warning("plumkdocs: ignoring the bundle %s: %s", path, e)
+        return None
+    if bundle.context != fingerprint(bool(options.get("static", False))):
+        log.info("plumkdocs: the bundle %s was rendered with another configuration", path)
+        bundle.close()
+        return None
+    return bundle
@@ -0,0 +1,237 @@
+"""Renders the documentation of plum functions to a bundle ahead of the build.
+
+Usage::
+
+    plumkdocs my_package.module my_package.other --jobs 4
+    plumkdocs my_package --recursive --exclude "my_package.tests" --jobs 4
+
+The options are read from the `extra: plumkdocs:` section of mkdocs.yml, so that
+the fragments are rendered as the build would. When `bundle` is set in
+mkdocs.yml, the bundle is written there and the macros serve their fragments
+from it while the documented files are unchanged.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+log = logging.getLogger("mkdocs.plugins.plumkdocs")
+
+DEFAULT_OUTPUT = "plumkdocs-bundle.bin"
+
+# Options of the build which do not apply to the rendering of the bundle
+_BUILD_OPTIONS = ("bundle", "prefetch", "incremental", "trace", "memory_report")
+
+
+class _Env:
+    # Stands in for the mkdocs-macros environment given to `define_env`
+    def __init__(self, options, config_file):
+        self.variables = {"plumkdocs": options}
+        self.conf = {"config_file_path": config_file}
+
+    def macro(self, func):
+        return func
+
+
+def load_options(config_file):
+    """Reads the plumkdocs options of mkdocs.yml, ignoring the tags of mkdocs and
+    its plugins (e.g. `!ENV` or `!!python/name`)."""
+    import yaml
+
+    class Loader(yaml.SafeLoader):
+        pass
+
+    Loader.add_multi_constructor("!", lambda loader, suffix, node: None)
+    Loader.add_multi_constructor("tag:yaml.org,2002:python/", lambda loader, suffix, node: None)
+    with open(config_file, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=Loader) or {}
+    return dict((config.get("extra") or {}).get("plumkdocs") or {})
+
+
+def configure(options, config_file=None):
+    """Sets up the rendering of this process as `define_env` does for a build."""
+    from . import main
+
+    options = {k: v for k, v in options.items() if k not in _BUILD_OPTIONS}
+    main.define_env(_Env(options, config_file))
+
+
+# Functions rendered by this process and their HTML, by identity, so that the
+# functions re-exported by several modules are rendered once
+_rendered = {}
+
+
+def render_module(module):
+    """Renders the fragments of a module: the one of the whole module and the one
+    of each of its plum functions. Returns the `(module, entry, fragments)` to
+    write in the bundle, and the HTML of the implementations of each function,
+    by `walker._function_key`."""
+    from . import bundle, main
+    from .walker import _function_key
+
+    operators = main._resolve_operators(module)
+    pending = [op for op in operators if id(op[1]) not in _rendered]
+    for (_, func), text in zip(pending, main._render_functions(pending), strict=True):
+        _rendered[id(func)] = (func, text)
+    texts = [_rendered[id(func)][1] for _, func in operators]
+    fragments = {(module, None): main._render_operators(operators, texts)}
+    for operator, text in zip(operators, texts, strict=True):
+        fragments[(module, operator[0])] = main._render_operators([operator], [text])
+    entry = {
+        "functions": [name for name, _ in operators],
+        "sources": bundle.module_sources(module, main._source_files(operators)),
+    }
+    implementations = {
+        _function_key(func): text for (_, func), text in zip(operators, texts, strict=True)
+    }
+    return module, entry, fragments, implementations
+
+
+def render_package(package, include, exclude, implementations):
+    """Renders the fragments of `pkg_to_strings(package, include, exclude)`,
+    reusing the `implementations` rendered with the modules."""
+    from . import bundle, main
+    from .walker import _function_key, discover, walk_modules
+
+    walked = walk_modules(package, include, exclude)
+    fragments = {}
+    for module, operators in discover(package, include, exclude):
+        missing = [op for op in operators if _function_key(op[1]) not in implementations]
+        for (_, func), text in zip(missing, main._render_functions(missing), strict=True):
+            implementations[_function_key(func)] = text
+        texts = [implementations[_function_key(func)] for _, func in operators]
+        fragments[module] = main._render_operators(operators, texts)
+    # Directories of all the packages, the filters may match their new submodules
+    sources = bundle.package_sources(walk_modules(package))
+    return {"walked": walked, "sources": sources, "fragments": fragments}
+
+
+def _init_worker(options, config_file, path):
+    sys.path[:] = path
+    configure(options, config_file)
+
+
+def prerender(modules, output, options=None, config_file=None, jobs=1, packages=()):
+    """Renders the modules and writes their bundle to `output`.
+
+    With several `jobs`, the modules are imported and rendered in a pool of
+    processes. `packages` are the `(package, include, exclude)` walks whose
+    `pkg_to_strings` fragments are also written. Returns the number of
+    fragments written.
+    """
+    from . import bundle, main
+
+    options = dict(options or {})
+    configure(options, config_file)
+    context = bundle.fingerprint(bool(options.get("static", False)))
+
+    try:
+        if jobs > 1 and len(modules) > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(options, config_file, list(sys.path)),
+            ) as pool:
+                results = list(pool.map(render_module, modules))
+        else:
+            results = [render_module(module) for module in modules]
+
+        entries = {}
+        fragments = {}
+        implementations = {}
+        for module, entry, module_fragments, module_implementations in results:
+            entries[module] = entry
+            fragments.update(module_fragments)
+            implementations.update(module_implementations)
+
+        walks = {}
+        for package, include, exclude in packages:
+            include = None if include is None else tuple(include)
+            exclude = None if exclude is None else tuple(exclude)
+            walks[(package, include, exclude)] = render_package(
+                package, include, exclude, implementations
+            )
+    finally:
+        for pool in (main.render_pool, main.isolation_pool):
+            if pool is not None:
+                pool.shutdown()
+
+    bundle.write(output, context, entries, fragments, walks)
+    return len(fragments) + sum(len(walk["fragments"]) for walk in walks.values())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="plumkdocs", description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="+", help="modules to render")
+    parser.add_argument(
+        "-r", "--recursive", action="store_true", help="also render the submodules of packages"
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        help="with --recursive, only render the modules matching this glob pattern",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        help="with --recursive, skip the modules matching this glob pattern",
+    )
+    parser.add_argument(
+        "-f", "--config-file", help="mkdocs.yml to read the options from (default: mkdocs.yml)"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help=f"bundle to write (default: the `bundle` option, or {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of processes")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Docstrings are parsed without their function, griffe warns about the types
+    logging.getLogger("griffe").setLevel(logging.ERROR)
+
+    from . import bundle
+
+    config_file = args.config_file
+    if config_file is None and os.path.isfile("mkdocs.yml"):
+        config_file = "mkdocs.yml"
+    options = load_options(config_file) if config_file else {}
+    output = args.output or bundle.resolve_path(options, config_file) or DEFAULT_OUTPUT
+
+    # Modules are imported as in a build run from the current directory
+    if "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    start = time.perf_counter()
+    modules = args.modules
+    packages = []
+    if args.recursive:
+        from .walker import walk_modules
+
+        modules = []
+        for package in args.modules:
+            modules += walk_modules(package, args.include, args.exclude)
+            # Also served to `package_implementations(package, include, exclude)`
+            packages.append((package, args.include, args.exclude))
+        modules = list(dict.fromkeys(modules))
+    count = prerender(modules, output, options, config_file, args.jobs, packages)
+    log.info(
+        "plumkdocs: %d fragments of %d modules written to %s in %.2fs",
+        count,
+        len(modules),
+        output,
+        time.perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import hashlib
+import inspect
+import marshal
+import os
+from functools import cache
+
+# Environment variable enabling the cache, takes precedence over mkdocs.yml
+ENV_VAR = "PLUMKDOCS_CACHE_DIR"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Packages whose version affects the rendered HTML
+_RENDER_PACKAGES = ("plumkdocs", "griffe", "pygments", "markdown")
+
+
+def create_temporary(directory, suffix=".tmp"):
+    """Creates a new file in `directory` and opens it for writing, as
+    `tempfile.mkstemp` does but with the permissions of the files created with
+    `open` (0o666 without the umask) rather than 0o600, so that the files moved
+    in place from it can be shared. Returns its descriptor and path."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        path = os.path.join(directory, f"tmp{os.urandom(8).hex()}{suffix}")
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+
+
+class DiskCache:
+    """Persistent store of rendered plum functions, keyed by content fingerprint.
+
+    Entries are plain files sharded in subdirectories by the first two characters
+    of the fingerprint. Writes go through a temporary file followed by an atomic
+    `os.replace`, so concurrent builds sharing the directory never observe a
+    partial entry. When the total size exceeds `max_bytes`, the least recently
+    used entries are evicted.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self._size = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, fingerprint):
+        return os.path.join(self.directory, fingerprint[:2], fingerprint + ".html")
+
+    def get(self, fingerprint):
+        path = self._path(fingerprint)
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+
+        # Refresh the modification time, which is used as the LRU clock
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, fingerprint, text):
+        path = self._path(fingerprint)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+
+        fd, tmp_path = create_temporary(shard)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another writer may have removed the shard, the entry will be
+            # rendered again next time
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        if self._size is None:
+            self._size = self._total_size()
+        else:
+            self._size += len(text.encode("utf-8"))
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(".html"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _total_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Removes the least recently used entries until the cache fits in
+        three quarters of `max_bytes`."""
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 3 // 4
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Already evicted by a concurrent build
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+@cache
+def _render_versions():
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = []
+    for package in _RENDER_PACKAGES:
+        try:
+            versions.append(f"{package}=={version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package}==unknown")
+    return ";".join(versions)
+
+
+def function_fingerprint(name, func, context="", format_default=repr):
+    """Content hash of everything that the rendered HTML of a plum `Function`
+    depends on: the code, docstring, annotations and defaults of each method,
+    together with the versions of the rendering packages and the rendering
+    configuration given as `context`. Defaults are hashed through `format_default`,
+    as their full `repr` can be arbitrarily large."""
+    h = hashlib.sha256()
+    h.update(_render_versions().encode())
+    h.update(context.encode())
+    h.update(name.encode())
+
+    sources = getattr(func, "sources", None)
+    if sources is not None:
+        # Read from the source in static mode, which renders annotations differently
+        h.update(b"static")
+        for source in sources:
+            h.update(source.encode())
+        return h.hexdigest()
+
+    for method in func.methods:
+        implementation = method.implementation
+        h.update(repr(method.signature).encode())
+
+        code = getattr(inspect.unwrap(implementation), "__code__", None)
+        if code is not None:
+            h.update(marshal.dumps(code))
+
+        h.update((inspect.getdoc(implementation) or "").encode())
+        for param in inspect.signature(implementation).parameters.values():
+            h.update(
+                f"{param.name}|{param.kind}|{param.annotation!r}|{format_default(param.default)}".encode()
+            )
+    return h.hexdigest()
+
+
+def from_options(options):
+    """Creates the cache configured by the environment or mkdocs.yml, if any."""
+    directory = os.environ.get(ENV_VAR) or options.get("cache_dir")
+    if not directory:
+        return None
+    return DiskCache(directory, int(options.get("cache_max_bytes", DEFAULT_MAX_BYTES)))
@@ -0,0 +1,192 @@
+import re
+import reprlib
+import types
+import typing
+
+from .lru import LRUCache
+
+# Modules whose names are rendered without their module path
+_BARE_MODULES = {None, "builtins", "typing", "collections.abc"}
+
+
+class TypeFormatter:
+    """Renders annotations by walking them structurally.
+
+    Classes are rendered by their qualified name (without module for builtins and
+    `typing`), `typing` generics and unions by their origin and arguments, and
+    concrete plum parametric types by their base class and type parameters. The
+    qualified names are then shortened with `aliases`, a mapping of prefixes (e.g.
+    module paths) to their replacement, applied in a single pass of one compiled
+    pattern. Results are memoized per annotation object, by identity (holding a
+    reference, so that ids are not reused): equal annotations are not always
+    rendered alike, e.g. unions compare equal whatever the order of their
+    arguments.
+    """
+
+    def __init__(self, aliases=None, maxsize=4096):
+        self.aliases = dict(aliases or {})
+        self._pattern = None
+        if self.aliases:
+            # Longest prefixes first, only matching at the start of a dotted name
+            keys = sorted(self.aliases, key=len, reverse=True)
+            self._pattern = re.compile(
+                r"(?<![\w.])(?:" + "|".join(re.escape(k) for k in keys) + ")"
+            )
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def fingerprint(self):
+        return repr(sorted(self.aliases.items()))
+
+    def format(self, annotation):
+        entry = self._cache.get(id(annotation))
+        if entry is not None and entry[0] is annotation:
+            return entry[1]
+
+        text = self._format(annotation)
+        self._cache.put(id(annotation), (annotation, text))
+        return text
+
+    def _alias(self, name):
+        if self._pattern is None:
+            return name
+        return self._pattern.sub(lambda m: self.aliases[m.group(0)], name)
+
+    def _join(self, args):
+        return ", ".join(self.format(a) for a in args)
+
+    def _format(self, t):
+        if isinstance(t, Rendered):
+            return t
+        if isinstance(t, str):
+            # Forward references and annotations read from the source
+            return self._alias(t)
+        if t is None or t is type(None):
+            return "None"
+        if t is Ellipsis:
+            return "..."
+        if isinstance(t, list | tuple):
+            return f"[{self._join(t)}]"
+
+        # Concrete plum parametric type, e.g. `MediumObject[object, OnGrid]`
+        if isinstance(t, type) and getattr(t, "_concrete", False):
+            base = t.__mro__[1]
+            return f"{self._format(base)}[{self._join(t._type_parameter)}]"
+
+        origin = typing.get_origin(t)
+        if origin is typing.Union or origin is types.UnionType:
+            return f"Union[{self._join(typing.get_args(t))}]"
+        if origin is typing.Literal:
+            return f"Literal[{', '.join(repr(a) for a in typing.get_args(t))}]"
+        if origin is not None:
+            args = typing.get_args(t)
+            name = self._format(origin)
+            return f"{name}[{self._join(args)}]" if args else name
+
+        if isinstance(t, typing.TypeVar):
+            return t.__name__
+        if isinstance(t, type):
+            module = getattr(t, "__module__", None)
+            qualname = t.__qualname__
+            if module in _BARE_MODULES:
+                return qualname
+            return self._alias(f"{module}.{qualname}")
+
+        # Anything else, e.g. type parameters which are values
+        return self._alias(repr(t) if isinstance(t, int | float | bool) else str(t))
+
+
+class Rendered(str):
+    """Annotation or default value that is already rendered, and shown as is."""
+
+
+# Formatting hooks for the default values, type -> function returning a string
+_default_hooks = {}
+
+
+def register_default_formatter(cls, func=None):
+    """Renders the default values that are instances of `cls` with `func`.
+
+    Hooks apply to subclasses as well, and take precedence over the built-in
+    rendering. This is useful for large objects whose `repr` is slow or huge.
+    Without `func`, the values are shown as `<TypeName>` without calling their
+    `repr` at all.
+    """
+    _default_hooks[cls] = func or _placeholder
+
+
+def _placeholder(value):
+    return f"<{type(value).__name__}>"
+
+
+def _hook_for(cls):
+    for base in cls.__mro__:
+        hook = _default_hooks.get(base)
+        if hook is not None:
+            return hook
+    return None
+
+
+class _BoundedRepr(reprlib.Repr):
+    def __init__(self, formatter, max_length, max_items, max_depth):
+        super().__init__()
+        self.formatter = formatter
+        self.maxstring = self.maxother = self.maxlong = max_length
+        self.maxlist = self.maxtuple = self.maxdict = max_items
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = max_items
+        self.maxlevel = max_depth
+
+    def repr1(self, x, level):
+        hook = _hook_for(type(x))
+        if hook is not None:
+            return self.formatter._truncate(hook(x))
+        if hasattr(x, "shape") and hasattr(x, "dtype"):
+            # NumPy/JAX arrays and the like: their full repr can be huge
+            return f"{type(x).__name__}(shape={tuple(x.shape)}, dtype={x.dtype})"
+        return super().repr1(x, level)
+
+
+class DefaultFormatter:
+    """Renders default values with bounded size.
+
+    Strings are shown as is, as with `str`, other values with `reprlib` size
+    limits on strings, containers and nesting. Hooks registered with
+    `register_default_formatter` take precedence, and array-like objects are
+    summarized by their shape and dtype. Results are cached by object identity
+    (holding a reference, so that ids are not reused) so that a value is only
+    formatted once per build. The output only depends on the values and the
+    configuration, so types whose `repr` is slow are registered with
+    `register_default_formatter` to be shown as `<TypeName>`.
+    """
+
+    def __init__(self, max_length=80, max_items=6, max_depth=3):
+        self.max_length = max_length
+        self._repr = _BoundedRepr(self, max_length, max_items, max_depth)
+        self._cache = {}
+
+    @property
+    def fingerprint(self):
+        r = self._repr
+        return repr((self.max_length, r.maxlist, r.maxlevel, sorted(map(repr, _default_hooks))))
+
+    def _truncate(self, text):
+        if len(text) <= self.max_length:
+            return text
+        return text[: self.max_length - 3] + "..."
+
+    def format(self, value):
+        if isinstance(value, Rendered):
+            return value
+        entry = self._cache.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+
+        if isinstance(value, str):
+            text = self._truncate(value)
+        else:
+            text = self._repr.repr(value)
+        self._cache[id(value)] = (value, text)
+        return text
+
+    def clear(self):
+        self._cache.clear()
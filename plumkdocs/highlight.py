@@ -0,0 +1,97 @@
+from pygments import highlight
+from pygments.formatter import Formatter
+from pygments.lexers import PythonLexer
+from pygments.token import STANDARD_TYPES, Token
+
+from . import tracing
+
+# Same escaping as the pygments HtmlFormatter
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+)
+
+
+class SignatureFormatter(Formatter):
+    """Pygments formatter emitting the signature code in a single pass.
+
+    Tokens are written with the CSS classes of the pygments `HtmlFormatter` and
+    the names of the parameters are made bold, without any `<div>`/`<pre>`: the
+    heading around it comes from the `signature.html` template.
+    """
+
+    name = "plumkdocs signature"
+    aliases = []
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._css_classes = {}
+
+    def _css_class(self, ttype):
+        css = self._css_classes.get(ttype)
+        if css is None:
+            # Same lookup as pygments: use the closest standard parent type,
+            # suffixed by the names of the non-standard subtypes
+            suffix = ""
+            current = ttype
+            css = STANDARD_TYPES.get(current)
+            while css is None:
+                suffix = "-" + current[-1] + suffix
+                current = current.parent
+                css = STANDARD_TYPES.get(current)
+            css += suffix
+            self._css_classes[ttype] = css
+        return css
+
+    @staticmethod
+    def _is_parameter(tokens, i):
+        # A name is a parameter if followed by its annotation, its default
+        # value or the next parameter
+        if i + 1 >= len(tokens):
+            return False
+        ttype, value = tokens[i + 1]
+        if ttype is Token.Punctuation and value in (":", ","):
+            return True
+        return not value.strip() and i + 2 < len(tokens) and tokens[i + 2] == (Token.Operator, "=")
+
+    def format(self, tokensource, outfile):
+        tokens = list(tokensource)
+
+        # Consecutive tokens with the same class share a span, as in HtmlFormatter
+        run_css, run = None, []
+        for i, (ttype, value) in enumerate(tokens):
+            value = value.replace("\n", "")
+            if not value:
+                continue
+            css = self._css_class(ttype)
+            text = value.translate(_HTML_ESCAPE_TABLE)
+            if ttype is Token.Name and self._is_parameter(tokens, i):
+                css, text = None, f'<span class="{css}"><strong>{text}</strong></span>'
+            elif css:
+                if css == run_css:
+                    run.append(text)
+                    continue
+                self._write_run(outfile, run_css, run)
+                run_css, run = css, [text]
+                continue
+            self._write_run(outfile, run_css, run)
+            run_css, run = None, []
+            outfile.write(text)
+        self._write_run(outfile, run_css, run)
+
+    @staticmethod
+    def _write_run(outfile, css, run):
+        if run:
+            outfile.write(f'<span class="{css}">{"".join(run)}</span>')
+
+
+# Shared between all the signatures, both are stateless
+_LEXER = PythonLexer()
+_SIGNATURE_FORMATTER = SignatureFormatter()
+
+
+def highlight_signature(code, templates):
+    """Returns the heading markup of the highlighted signature `code`, from the
+    `signature.html` template of `templates`."""
+    with tracing.span("highlight"):
+        code = highlight(code, _LEXER, _SIGNATURE_FORMATTER)
+    return templates.render("signature.html", code=code)
@@ -0,0 +1,112 @@
+import json
+
+
+class _Node:
+    # Plain record with value semantics, serialized field by field. `_nested`
+    # maps the fields holding other nodes (or lists of them) to their class
+    __slots__ = ()
+    _nested = {}
+
+    def __init__(self, *args, **kwargs):
+        for field, value in zip(self.__slots__, args, strict=False):
+            setattr(self, field, value)
+        for field in self.__slots__[len(args) :]:
+            setattr(self, field, kwargs.pop(field, None))
+        if kwargs:
+            raise TypeError(f"unexpected fields for {type(self).__name__}: {sorted(kwargs)}")
+
+    def _values(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self), json.dumps(self.to_dict(), sort_keys=True)))
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __getstate__(self):
+        return self._values()
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state, strict=True):
+            setattr(self, field, value)
+
+    def to_dict(self):
+        data = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if isinstance(value, _Node):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, _Node) else v for v in value]
+            data[field] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        values = {}
+        for field in cls.__slots__:
+            value = data.get(field)
+            nested = cls._nested.get(field)
+            if nested is not None and value is not None:
+                if isinstance(value, list):
+                    value = [nested.from_dict(v) for v in value]
+                else:
+                    value = nested.from_dict(value)
+            values[field] = value
+        return cls(**values)
+
+
+class Param(_Node):
+    """Row of the parameters table: `annotation` and `description` come from the
+    docstring, `default` is the rendered default value, or `None` if required."""
+
+    __slots__ = ("name", "annotation", "description", "default")
+
+
+class Return(_Node):
+    """Row of the returns table, from the docstring."""
+
+    __slots__ = ("annotation", "description")
+
+
+class Doc(_Node):
+    """Parsed docstring: the text sections and the parameters and returns.
+
+    The text and descriptions are kept as Markdown, they are only converted by
+    the renderer.
+    """
+
+    __slots__ = ("text", "params", "returns")
+    _nested = {"params": Param, "returns": Return}
+
+
+class Overload(_Node):
+    """One implementation of a plum function: its signature as plain text and
+    its docstring."""
+
+    __slots__ = ("signature", "doc")
+    _nested = {"doc": Doc}
+
+
+class Function(_Node):
+    """A plum function: its base docstring and its overloads, deduplicated and
+    sorted by signature."""
+
+    __slots__ = ("name", "doc", "overloads")
+    _nested = {"doc": Doc, "overloads": Overload}
+
+
+def to_json(node):
+    """Serializes a node to JSON. The output is stable: the same node always
+    gives the same text, which can be hashed or diffed."""
+    return json.dumps(node.to_dict(), sort_keys=True, separators=(",", ":"))
+
+
+def from_json(text, cls=Function):
+    """Reads a node of type `cls` serialized with `to_json`."""
+    return cls.from_dict(json.loads(text))
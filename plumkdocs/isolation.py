@@ -0,0 +1,279 @@
+import importlib
+import inspect
+import sys
+import threading
+
+DEFAULT_MAX_REQUESTS = 100
+
+
+class IsolatedFunction:
+    """Description of a plum function introspected in a worker process.
+
+    Mirrors the parts of a plum `Function` used for rendering, like
+    `static.StaticFunction`: `_doc` is the base docstring, `methods` holds the
+    `Implementation` of each method, with annotations and defaults already
+    rendered to strings, `sources` the fingerprint of the function computed by
+    the worker and `paths` the files defining its methods. `__module__` and
+    `__qualname__` are the ones of the plum function, which identify it across
+    the modules re-exporting it.
+    """
+
+    def __init__(self, name, description):
+        from .main import Implementation
+
+        self.name = name
+        self._doc = description["doc"]
+        self.methods = [Implementation(*payload) for payload in description["implementations"]]
+        self.sources = [description["fingerprint"]]
+        self.paths = description["paths"]
+        self.__module__ = description["module"]
+        self.__qualname__ = description["qualname"]
+
+
+def portable(implementation):
+    """Picklable copy of an `Implementation`: annotations and defaults are
+    replaced by their string form, which is all the rendering needs."""
+    from .formatting import Rendered
+    from .main import default_formatter, type_formatter
+
+    params = {}
+    for name, param in implementation.params.items():
+        annotation = param.annotation
+        default = param.default
+        params[name] = param.replace(
+            annotation=(
+                annotation
+                if annotation is inspect.Parameter.empty
+                else Rendered(type_formatter.format(annotation))
+            ),
+            default=(
+                default
+                if default is inspect.Parameter.empty
+                else Rendered(default_formatter.format(default))
+            ),
+        )
+    return (implementation.name, params, implementation.raw_docs)
+
+
+def describe(module_name):
+    """Imports the module and returns a serializable description of each of its
+    plum functions, as `(name, description)` pairs."""
+    from . import main
+    from .disk_cache import function_fingerprint
+
+    mod = importlib.import_module(module_name)
+    descriptions = []
+    for name, func in main._find_operators(mod):
+        operator = (name, func)
+        descriptions.append(
+            (
+                name,
+                {
+                    "doc": main.get_base_docs([operator]),
+                    "implementations": [
+                        portable(i) for i in main._extract_implementations(operator)
+                    ],
+                    "fingerprint": function_fingerprint(
+                        name, func, format_default=main.default_formatter.format
+                    ),
+                    "paths": sorted(main._source_files([operator])),
+                    "module": getattr(func, "__module__", module_name),
+                    "qualname": getattr(func, "__qualname__", name),
+                },
+            )
+        )
+    return descriptions
+
+
+def _peak_rss():
+    # Peak resident set size of the process in bytes, 0 where it is unknown
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # In bytes on macOS, in KiB elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _serve(conn, options):
+    # Main loop of a worker: receives module names, replies with their
+    # description (or the exception raised) and the memory used so far
+    from . import main
+
+    main.type_formatter, main.default_formatter = main._formatters(options)
+    while True:
+        try:
+            module_name = conn.recv()
+        except EOFError:
+            break
+        if module_name is None:
+            break
+        try:
+            reply = ("ok", describe(module_name))
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            conn.send((*reply, _peak_rss()))
+        except Exception as e:
+            # The exception could not be pickled
+            conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}"), _peak_rss()))
+
+
+class WorkerDiedError(RuntimeError):
+    """Raised when an import worker exits or is killed, e.g. when out of memory."""
+
+
+class _Worker:
+    def __init__(self, context, options):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(child, options), name="plumkdocs-import", daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.requests = 0
+        self.rss = 0
+        self.alive = True
+
+    def call(self, module_name):
+        try:
+            self.conn.send(module_name)
+            status, result, self.rss = self.conn.recv()
+        except (EOFError, OSError):
+            # Killed during the request or since the previous one
+            self.alive = False
+            raise WorkerDiedError(
+                f"plumkdocs: the import worker died while introspecting {module_name}"
+            ) from None
+        self.requests += 1
+        if status == "error":
+            raise result
+        return result
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+class IsolationPool:
+    """Long-lived worker processes importing the documented modules, so that
+    they (and their dependencies) are never loaded in the mkdocs process.
+
+    Each module is introspected once per build by one of the workers, which
+    only sends back an `IsolatedFunction` description of its plum functions.
+    Workers are started lazily with the `spawn` method, and recycled after
+    `max_requests` modules or once their peak memory exceeds `max_memory`
+    bytes. Concurrent calls, e.g. from the prefetch threads, are served by
+    different workers.
+    """
+
+    def __init__(self, workers=1, options=None, max_requests=DEFAULT_MAX_REQUESTS, max_memory=None):
+        self.workers = workers
+        self.options = dict(options or {})
+        self.max_requests = max_requests
+        self.max_memory = max_memory
+        self._idle = []
+        self._started = 0
+        self._all = []
+        # Notified whenever a worker is released, recycled or the pool shut down
+        self._available = threading.Condition()
+        self._modules = {}
+
+    def _acquire(self):
+        with self._available:
+            while not self._idle and self._started >= self.workers:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+
+            import multiprocessing
+
+            worker = _Worker(multiprocessing.get_context("spawn"), self.options)
+            self._started += 1
+            self._all.append(worker)
+            return worker
+
+    def _release(self, worker):
+        exhausted = worker.requests >= self.max_requests or (
+            self.max_memory is not None and worker.rss > self.max_memory
+        )
+        with self._available:
+            self._available.notify()
+            if worker in self._all:
+                if worker.alive and not exhausted:
+                    self._idle.append(worker)
+                    return
+                self._all.remove(worker)
+                self._started -= 1
+            # Otherwise stopped by `shutdown` in the meantime
+        worker.stop()
+
+    def describe(self, module_name):
+        """Returns the name -> `IsolatedFunction` mapping of the module, sorted by
+        name, introspecting it in a worker on first use."""
+        functions = self._modules.get(module_name)
+        if functions is not None:
+            return functions
+
+        for attempt in range(2):
+            worker = self._acquire()
+            try:
+                descriptions = worker.call(module_name)
+                break
+            except WorkerDiedError:
+                # Retried once on a fresh worker
+                if attempt:
+                    raise
+            finally:
+                self._release(worker)
+
+        functions = {name: IsolatedFunction(name, d) for name, d in descriptions}
+        self._modules[module_name] = functions
+        return functions
+
+    def find_operators(self, module_name, function=None):
+        """Isolated counterpart of `main._find_operators`."""
+        functions = self.describe(module_name)
+        if function is None:
+            return list(functions.items())
+        return [(function, functions[function])] if function in functions else []
+
+    def invalidate_files(self, paths):
+        """Drops the modules described from any of the source files in `paths`,
+        and recycles the workers so that they import the new version."""
+        for module_name, functions in list(self._modules.items()):
+            if any(not paths.isdisjoint(f.paths) for f in functions.values()):
+                del self._modules[module_name]
+        self.shutdown()
+
+    def clear(self):
+        self._modules.clear()
+
+    def shutdown(self):
+        with self._available:
+            workers, self._all = self._all, []
+            self._started = 0
+            self._idle = []
+            self._available.notify_all()
+        for worker in workers:
+            worker.stop()
+
+
+def from_options(options):
+    """Creates the pool configured in mkdocs.yml, if isolation is enabled."""
+    if not options.get("isolation", False):
+        return None
+    max_memory = options.get("isolation_max_memory")
+    return IsolationPool(
+        workers=max(1, int(options.get("isolation_workers", 1))),
+        options=options,
+        max_requests=int(options.get("isolation_max_requests", DEFAULT_MAX_REQUESTS)),
+        max_memory=None if max_memory is None else int(max_memory),
+    )
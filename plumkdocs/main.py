@@ -1,120 +1,80 @@
+import contextlib
 import importlib
 import inspect
+import logging
+import os
 import re
+import sys
+import threading
+from functools import cached_property
 
-from griffe import (
-    Docstring,
-    DocstringSectionParameters,
-    DocstringSectionReturns,
-    DocstringSectionText,
-    Parser,
-    parse,
-)
-from markdown import markdown
-from plum import Function
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import PythonLexer
+from . import bundle as _bundle
+from . import disk_cache as _disk_cache
+from . import ir as _ir
+from . import isolation as _isolation
+from . import memory as _memory
+from . import parallel as _parallel
+from . import renderer as _renderer
+from . import tracing as _tracing
+from . import walker as _walker
+from .formatting import DefaultFormatter, TypeFormatter
+from .lru import LRUCache
+
+# griffe, plum, pygments and markdown are imported on first use, so that loading
+# the plugin stays cheap for builds and pages that never call the macros
+
+log = logging.getLogger("mkdocs.plugins.plumkdocs")
 
 
 class Implementation:
     def __init__(self, name, params, docs):
         self.name = name
         self.params = params
-        self.docs = self.parse_docs(docs)
+        self.raw_docs = docs
+
+    @cached_property
+    def doc(self):
+        # Parsed on first use, so that discarded implementations cost nothing
+        return parse_doc(self.raw_docs, self.params)
+
+    @cached_property
+    def ir(self):
+        return _ir.Overload(self._signature_text, self.doc)
+
+    @cached_property
+    def docs(self):
+        return renderer.render_doc(self.doc)
 
     def __str__(self):
         return self.__repr__()
 
     def __repr__(self):
-        string = self._signature
-        string += "\n\n"
-        string += self.docs if self.docs else ""
-        string += "\n"
-        return string
+        return renderer.templates.render("overload.html", signature=self._signature, doc=self.docs)
 
     def parse_docs(self, docs):
-        # Extracting text and parameters
-        docstring = Docstring(docs)
-        parsed = parse(docstring, Parser.google)
-
-        text = [x for x in parsed if isinstance(x, DocstringSectionText)]
-        if len(text) > 0:
-            text = [x.value for x in text]
-            text = "\n".join(text)
-        else:
-            text = ""
-
-        try:
-            params = [x for x in parsed if isinstance(x, DocstringSectionParameters)][0]
-        except IndexError:
-            params = None
-
-        try:
-            returns = [x for x in parsed if isinstance(x, DocstringSectionReturns)][0]
-        except IndexError:
-            returns = None
-
-        # Transform parameters into table
-        if params:
-            text += "<p><strong>Parameters:</strong></p>"
-            table = '<div class="md-typeset__scrollwrap"><div class="md-typeset__table"><table>'
-            table += "<thead><tr><th>Name</th><th>Type</th><th>Description</th><th>Default</th></tr></thead>"
-            table += "<tbody>"
-
-            for p in params.value:
-                table += "<tr>"
-                table += f"<td><code>{p.name}</code></td>"
-
-                if p.annotation:
-                    table += f"<td><code>{p.annotation}</code></td>"
-                else:
-                    table += "<td></td>"
-                if p.description:
-                    table += f"<td>{markdown(p.description)}</td>"
-                else:
-                    table += "<td></td>"
-
-                # Get default value
-                default = self.params[p.name]._default
-                this_param_default = (
-                    "<em>required</em>" if default == inspect._empty else f"<code>{default}</code>"
-                )
-                table += f"<td>{this_param_default}</td>"
-                table += "</tr>"
-
-            table += "</tbody></table></div></div>"
-            text += table
-
-        # Transform returns into table
-        if returns:
-            text += "<p><strong>Returns:</strong></p>"
-            table = '<div class="md-typeset__scrollwrap"><div class="md-typeset__table"><table>'
-            table += "<thead><tr><th>Type</th><th>Description</th></tr></thead>"
-            table += "<tbody>"
-
-            for r in returns.value:
-                table += "<tr>"
-                table += f"<td><code>{r.name}</code></td>"
-                if r.description:
-                    table += f"<td>{markdown(r.description)}</td>"
-                else:
-                    table += "<td></td>"
-                table += "</tr>"
-            table += "</tbody></table></div></div>"
-            text += table
-
-        return text
+        return renderer.render_doc(parse_doc(docs, self.params))
 
     @staticmethod
     def param_to_string(names, types, defaults):
         namestring = f"{names}"
-        typestring = ": " + strip_modules(str(types)) if types != inspect._empty else ""
-        defaultstring = f" = {defaults}" if defaults != inspect._empty else ""
+        typestring = ": " + type_formatter.format(types) if types != inspect._empty else ""
+        defaultstring = (
+            f" = {default_formatter.format(defaults)}" if defaults is not inspect._empty else ""
+        )
         return namestring + typestring + defaultstring
 
-    @property
-    def _signature(self):
+    @cached_property
+    def key(self):
+        # Structural identity of the signature, used to deduplicate and compare
+        # implementations without rendering them
+        params = tuple(
+            (n, p._kind, _identity(p._annotation), _identity(p._default))
+            for n, p in self.params.items()
+        )
+        return (self.name, params)
+
+    @cached_property
+    def _signature_text(self):
         string = f"{self.name}("
         counter = 0
         keyword_arguments = False
@@ -131,80 +91,122 @@ class Implementation:
             string += self.param_to_string(n, thistype, default)
             counter += 1
         string += ")"
-        string = highlight(string, PythonLexer(), HtmlFormatter())
+        return string
 
-        string = var_to_bold(string)
+    @cached_property
+    def _signature(self):
+        return renderer.render_signature(self._signature_text)
 
-        # Change outer <div> form class "highlight" to class "highlight language-python
-        string = string.replace(
-            '<div class="highlight">', '<code class="highlight language-python">'
-        )
-        # Remove <pre> and </pre>
-        string = string.replace("<pre>", "").replace("</pre>", "")
-        # Update <div> closing tag
-        string = string.replace("</div>", "</code>")
 
-        # Wrap around various containers
-        string = '<h3 class="doc doc-heading">' + string + "</h3>"
+def _identity(obj):
+    # Hashable stand-in for annotations and defaults. The type is included so
+    # that e.g. `1` and `True` are not merged, unhashable objects compare by id
+    try:
+        hash(obj)
+    except TypeError:
+        return (type(obj), id(obj))
+    return (type(obj), obj)
 
-        return string
 
+DEFAULT_DOCSTRING_CACHE_SIZE = 1024
 
-def var_to_bold(string):
-    # Make variable names in the string bold
-    # example "... <span class="n">text</span><span class="p">:</span> ..."
-    # becomes
-    # "... <span class="n"><strong>text_value</strong></span><span class="p">:</span> ..."
-    string = re.sub(
-        r'<span class="n">([^<]+)</span><span class="p">:</span>',
-        r'<span class="n"><strong>\1</strong></span><span class="p">:</span>',
-        string,
-    )
-    string = re.sub(
-        r'<span class="n">([^<]+)</span> <span class="o">=</span>',
-        r'<span class="n"><strong>\1</strong></span> <span class="o">=</span>',
-        string,
-    )
-    string = re.sub(
-        r'<span class="n">([^<]+)</span><span class="p">,</span>',
-        r'<span class="n"><strong>\1</strong></span><span class="p">,</span>',
-        string,
+# Parsed griffe sections, keyed by docstring text and parser. Overloads often share
+# their docstring, and parsed sections are never mutated, so they can be shared
+docstring_cache = LRUCache(DEFAULT_DOCSTRING_CACHE_SIZE)
+
+
+def parse_docstring(docs, parser="google"):
+    """Returns the griffe sections of `docs`, going through `docstring_cache`."""
+    key = (docs, parser)
+    parsed = docstring_cache.get(key)
+    if parsed is None:
+        from griffe import Docstring, Parser, parse
+
+        parsed = parse(Docstring(docs), Parser(parser))
+        docstring_cache.put(key, parsed)
+    return parsed
+
+
+def parse_doc(docs, params=None):
+    """Builds the `ir.Doc` of a docstring. `params` are the parameters of the
+    signature, which give the default values shown in the parameters table."""
+    from griffe import (
+        DocstringSectionParameters,
+        DocstringSectionReturns,
+        DocstringSectionText,
     )
 
-    return string
-
-
-def strip_modules(string):
-    # Removes the module roots and the <class > tags from the string.
-    # Example:
-    # typing.Union[jwave.geometry.MediumObject[<class 'object'>, <class 'object'>, <class 'jaxdf.discretization.OnGrid'>], jwave.geometry.MediumObject[<class 'object'>, <class 'jaxdf.discretization.OnGrid'>, <class 'object'>]]
-    # becomes
-    # Union[MediumObject[object, object, OnGrid], MediumObject[object, OnGrid, object]]
-    to_change = {
-        "typing.Union": "Union",
-        "jwave.geometry.MediumObject": "Medium",
-        "<class ": "",
-        ">": "",
-        "jaxdf.discretization.": "",
-        "jwave.geometry.": "",
-        "jaxdf.core.": "",
-    }
-    for key, value in to_change.items():
-        string = string.replace(key, value)
-    return string
+    with _tracing.span("parse_docs"):
+        parsed = parse_docstring(docs)
+    text = "\n".join(x.value for x in parsed if isinstance(x, DocstringSectionText))
+    params_section = next((x for x in parsed if isinstance(x, DocstringSectionParameters)), None)
+    returns_section = next((x for x in parsed if isinstance(x, DocstringSectionReturns)), None)
+
+    rows = []
+    for p in params_section.value if params_section else []:
+        param = params.get(p.name) if params else None
+        default = (
+            None
+            if param is None or param.default is inspect.Parameter.empty
+            else default_formatter.format(param.default)
+        )
+        rows.append(_ir.Param(p.name, str(p.annotation or ""), p.description, default))
+
+    # Without annotation, griffe reads the type of `int: Description` as the name
+    returns = [
+        _ir.Return(r.name, r.description)
+        for r in (returns_section.value if returns_section else [])
+    ]
+    return _ir.Doc(text, rows, returns)
+
+
+def function_ir(plum_func):
+    """Builds the `ir.Function` of a `(name, Function)` pair, which the renderer
+    turns into HTML."""
+    name, _ = plum_func
+    with _tracing.span("extract", function=name):
+        overloads = [i.ir for i in _extract_implementations(plum_func)]
+    return _ir.Function(name, parse_doc(get_base_docs([plum_func])), overloads)
 
 
 def get_base_docs(plum_func):
+    # The returned docstring is parsed by `parse_doc`, through `docstring_cache`
     _, func = plum_func[0]
     return func._doc
 
 
 def _extract_implementations(plum_func):
+    from plum import Function
+
     name, func = plum_func
+    if isinstance(func, Function):
+        implementations = _runtime_implementations(name, func)
+    else:
+        # Read from the source by `static.find_operators`
+        implementations = list(func.methods)
+
+    # Remove distinct implementations with the same signature, keeping the first one
+    impl = {}
+    for i in implementations:
+        impl.setdefault(i.key, i)
+
+    # Sort on the plain signature, the highlighted HTML is only rendered later
+    return sorted(impl.values(), key=lambda i: i._signature_text)
+
+
+def _runtime_implementations(name, func):
     implementations = []
 
+    # plum registers one method per signature obtained by dropping trailing
+    # default arguments, and `dispatch.multi` registers the same implementation
+    # under several signatures: all of them document the same implementation
+    seen = set()
     for method in func.methods:
         implementation = method.implementation
+        if id(implementation) in seen:
+            continue
+        seen.add(id(implementation))
+
         params = inspect.signature(implementation).parameters
         docs = inspect.getdoc(implementation)
 
@@ -212,60 +214,525 @@ def _extract_implementations(plum_func):
         docs = "" if docs is None else docs
 
         implementations.append(Implementation(name, params, docs))
+    return implementations
 
-    # Remove implementations with the same _signature
-    # TODO: Understand why those duplicates exist at all..
-    impl = {}
-    for i in implementations:
-        signature = i._signature
-        if signature not in impl.keys():
-            impl[signature] = i
 
-    # Sort dictionary by key
-    impl = dict(sorted(impl.items(), key=lambda item: item[0]))
+class BuildCache:
+    """Memoizes the output of `mod_to_string` for the duration of a build.
 
-    implementations = list(impl.values())
-    return implementations
+    Entries are keyed by `(module_name, function)` and are only served as long as
+    the method tables of the plum functions they were rendered from are unchanged,
+    so registering a new method invalidates the fragment. Each entry also records
+    the source files it was rendered from, see `invalidate_sources`.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, tables):
+        entry = self._entries.get(key)
+        hit = entry is not None and _same_method_tables(entry[0], tables)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry[1] if hit else None
+
+    def put(self, key, tables, text, sources=()):
+        self._entries[key] = (tables, text, frozenset(sources))
+
+    def invalidate_sources(self, paths):
+        """Drops the entries rendered from any of the source files in `paths`,
+        returns their number."""
+        stale = [key for key, entry in self._entries.items() if not entry[2].isdisjoint(paths)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self._entries.clear()
+        self.reset_stats()
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Cache shared by all the macro calls of a build, cleared by `define_env`
+build_cache = BuildCache()
+
+# Worker processes introspecting the modules, configured by `define_env`
+isolation_pool = None
+
+# Whether the build cache is kept across the rebuilds of `mkdocs serve`,
+# configured by `define_env`
+incremental = False
+
+# Source files of the fragments in the build cache -> modification time when
+# they were first rendered from, only tracked in incremental mode
+_source_mtimes = {}
+
+# Options of the previous build, which must match to reuse its fragments
+_previous_options = None
+
+# Optional persistent cache of rendered functions, configured by `define_env`
+disk_cache = None
+
+# Renders the IR to HTML, with the Markdown converter of the descriptions and the
+# templates configured by `define_env`
+renderer = _renderer.Renderer()
+
+# Renders the annotations in signatures, configured by `define_env`
+type_formatter = TypeFormatter()
+default_formatter = DefaultFormatter()
+
+# Optional process pool for rendering, configured by `define_env`
+render_pool = None
+
+# Fragments rendered ahead of the build by the `plumkdocs` command, if any
+bundle = None
+
+# Whether to document functions from their source without importing them
+static_mode = False
+
+
+def _method_tables(operators):
+    # Snapshot of the methods registered on each plum function. `Method` objects
+    # are only recreated when the function is (re)registered, so identity is enough
+    return tuple((name, func, tuple(func.methods)) for name, func in operators)
+
+
+def _same_method_tables(cached, current):
+    if len(cached) != len(current):
+        return False
+    for (name_a, func_a, methods_a), (name_b, func_b, methods_b) in zip(
+        cached, current, strict=True
+    ):
+        if name_a != name_b or func_a is not func_b or len(methods_a) != len(methods_b):
+            return False
+        if any(a is not b for a, b in zip(methods_a, methods_b, strict=True)):
+            return False
+    return True
+
+
+# Per-module index of plum functions: module name -> (module, namespace size, index)
+_module_indices = {}
+
+
+def module_index(mod):
+    """Returns a name -> plum `Function` mapping for the module, sorted by name.
+
+    The index is built once from the module `__dict__` and rebuilt whenever the
+    size of the namespace changes. Use `invalidate_module_index` when names are
+    rebound in place, e.g. after `importlib.reload`.
+    """
+    from plum import Function
+
+    namespace = vars(mod)
+    entry = _module_indices.get(mod.__name__)
+    if entry is None or entry[0] is not mod or entry[1] != len(namespace):
+        index = {
+            name: obj
+            for name, obj in sorted(namespace.items(), key=lambda item: item[0])
+            if isinstance(obj, Function)
+        }
+        entry = (mod, len(namespace), index)
+        _module_indices[mod.__name__] = entry
+    return entry[2]
+
+
+def invalidate_module_index(module_name=None):
+    """Drops the index of `module_name`, or of every module if not given."""
+    if module_name is None:
+        _module_indices.clear()
+    else:
+        _module_indices.pop(module_name, None)
+
+
+def _find_operators(mod, function=None):
+    # Returns the sorted (name, Function) pairs to document
+    index = module_index(mod)
+    if function is None:
+        return list(index.items())
+
+    func = index.get(function)
+    if func is not None and vars(mod).get(function) is not func:
+        # The name was rebound since the index was built
+        invalidate_module_index(mod.__name__)
+        func = module_index(mod).get(function)
+    return [] if func is None else [(function, func)]
+
+
+def _resolve_operators(module_name, function=None):
+    # In static mode, read the overloads from the source when possible
+    operators = None
+    if static_mode:
+        from . import static
+
+        with _tracing.span("static", module=module_name):
+            operators = static.find_operators(module_name, function)
+
+    if operators is None and isolation_pool is not None:
+        # Introspect the module in a worker process, without importing it here
+        with _tracing.span("isolated import", module=module_name):
+            operators = isolation_pool.find_operators(module_name, function)
+
+    if operators is None:
+        # Import the module using importlib
+        with (
+            _tracing.span("import", module=module_name),
+            _memory.measure(module_name, None, "import"),
+        ):
+            mod = importlib.import_module(module_name)
+        with _tracing.span("scan", module=module_name):
+            operators = _find_operators(mod, function)
+    return operators
 
 
 def mod_to_string(module_name, function=None):
-    # Import the module using importlib
-    mod = importlib.import_module(module_name)
-    operators = set(inspect.getmembers(mod, lambda x: isinstance(x, Function)))
+    if bundle is not None:
+        text = bundle.get(module_name, function)
+        if text is not None:
+            return text
+
+    operators = _resolve_operators(module_name, function)
+
+    # Reuse the fragment rendered earlier in this build, if any
+    key = (module_name, function)
+    tables = _method_tables(operators)
+    text = build_cache.get(key, tables)
+    if text is not None:
+        return text
 
-    if function is not None:
-        # Keep only the operators whose first element is the same as the function
-        operators = [op for op in operators if op[0] == function]
+    with _memory.measure(module_name, function, "render"):
+        text = _render_operators(operators)
+    build_cache.put(key, tables, text, _track_sources(operators))
+    return text
 
-    # Sort operators by name
-    def keyfun(op):
-        func = op[1].methods
-        func = func[func.keys()[0]][0].__wrapped__.__name__
-        return func
 
-    operators = sorted(operators, key=lambda item: item[0])
+def mod_to_strings(module_name, functions=None, pattern=None):
+    """Renders several functions of a module in a single pass.
 
+    `functions` is a list of names and `pattern` a regular expression searched
+    in the names, every plum function of the module is rendered when neither is
+    given. Returns a name -> fragment mapping, each fragment being the one of
+    `mod_to_string(module_name, name)`.
+    """
+    if bundle is not None:
+        fragments = _bundled_fragments(module_name, functions, pattern)
+        if fragments is not None:
+            return fragments
+
+    operators = dict(_resolve_operators(module_name))
+    names = list(operators) if functions is None else list(functions)
+    if pattern is not None:
+        regex = re.compile(pattern)
+        names = [n for n in names if regex.search(n)]
+
+    fragments = {}
+    missing = []
+    for name in names:
+        selected = [(name, operators[name])] if name in operators else []
+        tables = _method_tables(selected)
+        fragments[name] = build_cache.get((module_name, name), tables)
+        if fragments[name] is None:
+            missing.append((name, selected, tables))
+
+    # Render the missing functions together, so that the pool gets all of them
+    label = ", ".join(name for name, _, _ in missing)
+    with _memory.measure(module_name, label, "render"):
+        rendered = iter(_render_functions([op for _, selected, _ in missing for op in selected]))
+        for name, selected, _ in missing:
+            implementations = [next(rendered)] if selected else []
+            fragments[name] = _render_operators(selected, implementations)
+    for name, selected, tables in missing:
+        build_cache.put((module_name, name), tables, fragments[name], _track_sources(selected))
+    return fragments
+
+
+def pkg_to_strings(package, include=None, exclude=None, workers=None):
+    """Renders the plum functions of a package and of all its submodules.
+
+    The modules are found with `walker.discover`, which imports them in a pool
+    of `workers` threads and keeps each function in a single module, so that a
+    function re-exported by other modules is only rendered once. `include` and
+    `exclude` are glob patterns on the module names. Returns a module ->
+    fragment mapping, each fragment documenting the functions of the module.
+    """
+    include = None if include is None else tuple(include)
+    exclude = None if exclude is None else tuple(exclude)
+    if bundle is not None:
+        fragments = bundle.package(package, include, exclude)
+        if fragments is not None:
+            return fragments
+
+    with _tracing.span("walk", package=package):
+        discovered = _walker.discover(package, include, exclude, workers)
+
+    fragments = {}
+    missing = []
+    for module_name, operators in discovered:
+        key = (module_name, (package, include, exclude))
+        tables = _method_tables(operators)
+        fragments[module_name] = build_cache.get(key, tables)
+        if fragments[module_name] is None:
+            missing.append((key, operators, tables))
+
+    # Render the missing functions together, so that the pool gets all of them
+    with _memory.measure(package, None, "render"):
+        rendered = iter(_render_functions([op for _, operators, _ in missing for op in operators]))
+        for key, operators, _ in missing:
+            implementations = [next(rendered) for _ in operators]
+            fragments[key[0]] = _render_operators(operators, implementations)
+    for key, operators, tables in missing:
+        build_cache.put(key, tables, fragments[key[0]], _track_sources(operators))
+    return fragments
+
+
+def _bundled_fragments(module_name, functions, pattern):
+    # Fragments of `mod_to_strings` served from the bundle, `None` unless all of
+    # them are found there
+    names = bundle.functions(module_name) if functions is None else list(functions)
+    if names is None:
+        return None
+    if pattern is not None:
+        regex = re.compile(pattern)
+        names = [n for n in names if regex.search(n)]
+    fragments = {name: bundle.get(module_name, name) for name in names}
+    if None in fragments.values():
+        return None
+    return fragments
+
+
+def _render_operators(operators, implementations=None):
     # Handle case when no operators are found
     if not operators:
-        return "<hr>"
+        return renderer.render_fragment(None, [])
+
+    if implementations is None:
+        implementations = _render_functions(operators)
+    return renderer.render_fragment(parse_doc(get_base_docs(operators)), implementations)
+
+
+def _render_functions(operators):
+    # Renders the overloads of the `ir.Function` of each plum function, going
+    # through the persistent cache when it is enabled
+    cache = disk_cache
+    texts = [None] * len(operators)
+    pending = []
+    for n, plum_func in enumerate(operators):
+        fingerprint = None
+        if cache is not None:
+            fingerprint = _disk_cache.function_fingerprint(
+                *plum_func, _render_fingerprint(), default_formatter.format
+            )
+            texts[n] = cache.get(fingerprint)
+            if texts[n] is not None:
+                continue
+        pending.append((n, fingerprint, function_ir(plum_func)))
+
+    # Render all the missing overloads at once, in the pool if enabled
+    overloads = [o for _, _, function in pending for o in function.overloads]
+    if render_pool is not None and len(overloads) > 1:
+        with _tracing.span("render pool", functions=len(pending)):
+            rendered = iter(render_pool.map(overloads))
+        for n, _, function in pending:
+            texts[n] = "".join(next(rendered) + "\n" for _ in function.overloads)
+    else:
+        for n, _, function in pending:
+            with _tracing.span("render", function=function.name):
+                texts[n] = renderer.render_overloads(function.overloads)
+
+    for n, fingerprint, _ in pending:
+        if fingerprint is not None:
+            cache.put(fingerprint, texts[n])
+    return texts
+
+
+def _render_fingerprint():
+    """Identifies the rendering configuration of the build.
+
+    Every object whose configuration affects the rendered HTML (the Markdown
+    context and the templates of the renderer, and the formatters of the
+    annotations and default values) exposes it as its `fingerprint` string,
+    which is equal for objects rendering alike. Their concatenation keys the
+    fragments of the persistent cache and of the bundle, so that the ones
+    rendered with another configuration are never served.
+    """
+    return renderer.fingerprint + type_formatter.fingerprint + default_formatter.fingerprint
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _source_files(operators):
+    # Files defining the methods of the plum functions, as recorded when they
+    # were not imported in this process
+    files = set()
+    for _, func in operators:
+        paths = getattr(func, "paths", None)
+        if paths is not None:
+            files.update(paths)
+            continue
+        for method in func.methods:
+            try:
+                path = inspect.getsourcefile(inspect.unwrap(method.implementation))
+            except TypeError:
+                # Builtins and other objects without source
+                continue
+            if path is not None:
+                files.add(os.path.realpath(path))
+    return files
+
+
+def _track_sources(operators):
+    if not incremental:
+        return ()
+    files = _source_files(operators)
+    for path in files:
+        if path not in _source_mtimes:
+            _source_mtimes[path] = _mtime(path)
+    return files
+
+
+def tracked_sources():
+    """Returns the source files of the fragments rendered in incremental mode."""
+    return sorted(_source_mtimes)
+
+
+def _defined_in(f, files):
+    try:
+        path = inspect.getsourcefile(inspect.unwrap(f))
+    except TypeError:
+        return False
+    return path is not None and os.path.realpath(path) in files
+
+
+def _edit_methods(func, drop=None, source=None):
+    # Edits the registrations of a plum `Function` in place: drops the methods
+    # whose implementation satisfies `drop`, and takes the definition and the
+    # methods of the `Function` `source`. Returns whether `func` was edited.
+    # This goes through private attributes of plum, checked against
+    # plum-dispatch 2.6.1 and 2.10.1. Only the later releases have `_lock`.
+    registered = func._pending + func._resolved
+    if source is None and not any(drop(f) for f, _, _ in registered):
+        return False
+    with getattr(func, "_lock", contextlib.nullcontext()):
+        # Moves the resolved registrations back to the pending ones
+        func.clear_cache()
+        if drop is not None:
+            func._pending = [r for r in func._pending if not drop(r[0])]
+        if source is not None:
+            source.clear_cache()
+            func._f, func._doc = source._f, source._doc
+            func._pending.extend(source._pending)
+    return True
+
+
+def _drop_methods(files):
+    # Unregisters the methods defined in `files` from every plum function, as
+    # functions of a shared dispatcher (e.g. the global `plum.dispatch`) outlive
+    # the reload of the modules, which registers the methods again
+    from plum import Function
+
+    for func in list(Function._instances):
+        _edit_methods(func, drop=lambda f: _defined_in(f, files))
+
+
+def _reload(mod, files):
+    # Reloads a module. The functions of shared dispatchers first defined in
+    # `files` are detached from their dispatcher during the reload, so that it
+    # creates them from their new definition, which is then merged back into the
+    # existing objects, as other modules may re-export them
+    from plum import Dispatcher
+
+    detached = []
+    dispatchers = {id(d): d for d in vars(mod).values() if isinstance(d, Dispatcher)}
+    for dispatcher in dispatchers.values():
+        for name, func in list(dispatcher.functions.items()):
+            if _defined_in(func._f, files):
+                detached.append((dispatcher, name, dispatcher.functions.pop(name)))
+    try:
+        importlib.reload(mod)
+    finally:
+        for dispatcher, name, func in detached:
+            new = dispatcher.functions.get(name)
+            if new is not None and new is not func:
+                _edit_methods(func, source=new)
+                for key, value in list(vars(mod).items()):
+                    if value is new:
+                        setattr(mod, key, func)
+            dispatcher.functions[name] = func
+
+
+def refresh_sources():
+    """Invalidates what was rendered from the source files modified since.
+
+    The fragments rendered from the modified files are dropped from the build
+    cache and the modules loaded from them are reloaded, so that the next calls
+    render their new version. Returns the modified files.
+    """
+    changed = {path for path, mtime in _source_mtimes.items() if _mtime(path) != mtime}
+    if not changed:
+        return changed
+
+    invalidated = build_cache.invalidate_sources(changed)
+    for path in changed:
+        del _source_mtimes[path]
+    reloaded = [
+        mod
+        for mod in list(sys.modules.values())
+        if getattr(mod, "__file__", None) is not None and os.path.realpath(mod.__file__) in changed
+    ]
+    if reloaded:
+        _drop_methods(changed)
+    for mod in reloaded:
+        try:
+            _reload(mod, changed)
+        except Exception as e:
+            # Reported when a page imports the module again
+            log.warning("plumkdocs: reloading %s failed: %s", mod.__name__, e)
+    invalidate_module_index()
+    static = sys.modules.get(f"{__package__}.static")
+    if static is not None:
+        static.invalidate_files(changed)
+    if isolation_pool is not None:
+        isolation_pool.invalidate_files(changed)
+
+    log.info(
+        "plumkdocs: %d source files changed, %d fragments invalidated",
+        len(changed),
+        invalidated,
+    )
+    return changed
 
-    implementations = list(map(_extract_implementations, operators))
 
-    base_docs = get_base_docs(operators)
-    base_implementation = Implementation(None, None, base_docs)
+def _formatters(options):
+    # Formatters of the annotations and defaults configured in mkdocs.yml
+    return (
+        TypeFormatter(options.get("type_aliases")),
+        DefaultFormatter(
+            max_length=int(options.get("default_max_length", 80)),
+            max_items=int(options.get("default_max_items", 6)),
+        ),
+    )
 
-    # Concatenate all implementations into a string
-    text = base_implementation.docs + "\n"
-    text += "<h3>Concrete implementations:</h3>"
-    for fun in implementations:
-        # text += f'## `{fun[0].name}`\n\n'
-        for i in fun:
-            text += "".join(str(i)) + "\n"
-        # text += '\n<hr/>\n'
 
-    # Add an horizontal line
-    text += "<hr>"
-    return text
+def _options(env):
+    # Options are read from the `extra: plumkdocs:` section of mkdocs.yml
+    variables = getattr(env, "variables", None) or {}
+    return dict(variables.get("plumkdocs") or {})
 
 
 # -----------------------------------------------------------------------------
@@ -282,7 +749,149 @@ def define_env(env):
     - filter: a function with one of more arguments,
         used to perform a transformation
     """
+    global default_formatter, disk_cache, incremental, renderer, render_pool
+    global bundle, isolation_pool, static_mode, type_formatter, _previous_options
+
+    options = _options(env)
+    same_options = options == _previous_options
+    _previous_options = options
+    incremental = bool(options.get("incremental", False))
+    if incremental and same_options:
+        # Rebuild of `mkdocs serve`: only what was rendered from modified files
+        # is rendered again
+        build_cache.reset_stats()
+        refresh_sources()
+    else:
+        # Every build starts from a clean slate
+        build_cache.clear()
+        _source_mtimes.clear()
+        invalidate_module_index()
+        static = sys.modules.get(f"{__package__}.static")
+        if static is not None:
+            static.clear_cache()
+        if isolation_pool is not None:
+            isolation_pool.shutdown()
+        isolation_pool = _isolation.from_options(options)
+
+    disk_cache = _disk_cache.from_options(options)
+    docstring_cache.resize(int(options.get("docstring_cache_size", DEFAULT_DOCSTRING_CACHE_SIZE)))
+    docstring_cache.reset_stats()
+    type_formatter, default_formatter = _formatters(options)
+    config_file = (getattr(env, "conf", None) or {}).get("config_file_path")
+    renderer = _renderer.from_options(options, config_file)
+    if render_pool is not None:
+        render_pool.shutdown()
+    # The workers get the resolved directory, `options` are left as configured
+    # to be compared with the ones of the next build
+    render_pool = _parallel.from_options({**options, "templates_dir": renderer.templates.directory})
+    static_mode = bool(options.get("static", False))
+    if bundle is not None:
+        bundle.close()
+    bundle = _bundle.from_options(options, config_file)
+    _tracing.tracer = _tracing.from_options(options)
+    if _memory.tracker is not None:
+        _memory.tracker.stop()
+    _memory.tracker = _memory.from_options(options)
+
+    @env.macro
+    def implementations(module: str, function=None, functions=None, pattern=None):
+        with _tracing.span(
+            "implementations",
+            "macro",
+            module=module,
+            function=function,
+            functions=functions,
+            pattern=pattern,
+        ):
+            if functions is None and pattern is None:
+                return mod_to_string(module, function)
+            return "".join(mod_to_strings(module, functions, pattern).values())
 
     @env.macro
-    def implementations(module: str, function=None):
-        return mod_to_string(module, function)
+    def implementation_fragments(module: str, functions=None, pattern=None):
+        with _tracing.span(
+            "implementation_fragments", "macro", module=module, functions=functions, pattern=pattern
+        ):
+            return mod_to_strings(module, functions, pattern)
+
+    @env.macro
+    def package_implementations(package: str, include=None, exclude=None):
+        with _tracing.span(
+            "package_implementations", "macro", package=package, include=include, exclude=exclude
+        ):
+            workers = options.get("walk_workers")
+            fragments = pkg_to_strings(
+                package, include, exclude, None if workers is None else int(workers)
+            )
+            return "".join(fragments.values())
+
+    if options.get("prefetch", False):
+        from . import prefetch
+
+        prefetch.from_options(options, env.conf)
+
+
+def on_post_build(env):
+    """
+    Hook called by mkdocs-macros at the end of the build, logs cache statistics.
+
+    When tracing, the trace is exported and the duration of the macro calls and
+    stages is logged. The memory report is written likewise when enabled. In
+    incremental mode, the source files of the fragments are added to the files
+    watched by `mkdocs serve`, so that modifying them triggers a rebuild.
+    """
+    if render_pool is not None:
+        render_pool.shutdown()
+
+    conf = getattr(env, "conf", None) or {}
+    watch = conf.get("watch")
+    if incremental and watch is not None:
+        watch.extend(path for path in tracked_sources() if path not in watch)
+
+    stats = build_cache.stats()
+    log.info(
+        "plumkdocs: %d fragments rendered, %d served from cache",
+        stats["misses"],
+        stats["hits"],
+    )
+    if bundle is not None:
+        log.info("plumkdocs: %d fragments served from the bundle %s", bundle.hits, bundle.path)
+    stats = docstring_cache.stats()
+    log.info(
+        "plumkdocs: %d docstrings parsed, %d served from cache (hit rate %.0f%%)",
+        stats["misses"],
+        stats["hits"],
+        100 * stats["hit_rate"],
+    )
+
+    tracer = _tracing.tracer
+    if tracer is not None:
+        path = _options(env).get("trace_file") or _tracing.report_path(conf, "plumkdocs-trace.json")
+        tracer.export(path)
+        macros, stages = tracer.summary()
+        log.info("plumkdocs: trace written to %s, slowest macro calls:", path)
+        for label, seconds, count in macros:
+            log.info("plumkdocs: %8.3fs  %s%s", seconds, label, f" (x{count})" if count > 1 else "")
+        log.info(
+            "plumkdocs: stages: %s",
+            ", ".join(f"{label} {seconds:.3f}s (x{count})" for label, seconds, count in stages),
+        )
+
+    tracker = _memory.tracker
+    if tracker is not None:
+        path = _options(env).get("memory_file") or _tracing.report_path(
+            conf, "plumkdocs-memory.json"
+        )
+        tracker.write(path)
+        log.info("plumkdocs: memory report written to %s, largest modules:", path)
+        for module, entry in list(tracker.report()["modules"].items())[:5]:
+            imported = (entry["import"] or {}).get("retained", 0)
+            rendered = sum(f["retained"] for f in entry["functions"].values())
+            log.info(
+                "plumkdocs: %10.1f KiB import, %10.1f KiB render  %s",
+                imported / 1024,
+                rendered / 1024,
+                module,
+            )
+        tracker.stop()
+        _memory.tracker = None
@@ -0,0 +1,106 @@
+import contextlib
+import threading
+
+# Tracker of the current build, `None` when memory accounting is disabled
+tracker = None
+
+_DISABLED = contextlib.nullcontext()
+
+
+class _Measure:
+    __slots__ = ("tracker", "key", "stage", "before")
+
+    def __init__(self, tracker, key, stage):
+        self.tracker = tracker
+        self.key = key
+        self.stage = stage
+
+    def __enter__(self):
+        import tracemalloc
+
+        tracemalloc.reset_peak()
+        self.before = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc_info):
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        self.tracker.record(self.key, self.stage, peak - self.before, current - self.before)
+
+
+class MemoryTracker:
+    """Accounts the memory allocated while importing and rendering each module.
+
+    Uses `tracemalloc`, started by the tracker if it is not already running: for
+    each measured stage, the peak is the maximum traced memory above the one at
+    the start of the stage, and the retained memory is what is still allocated
+    at its end. Measures are global to the process, so stages running
+    concurrently (e.g. with `prefetch`) are attributed each other's allocations.
+    """
+
+    def __init__(self):
+        import tracemalloc
+
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self.records = {}
+        self._lock = threading.Lock()
+
+    def measure(self, module, function, stage):
+        return _Measure(self, (module, function), stage)
+
+    def record(self, key, stage, peak, retained):
+        with self._lock:
+            stages = self.records.setdefault(key, {})
+            entry = stages.setdefault(stage, {"peak": 0, "retained": 0, "calls": 0})
+            entry["peak"] = max(entry["peak"], peak)
+            entry["retained"] += retained
+            entry["calls"] += 1
+
+    def report(self):
+        """Returns the measures per module, with the import at the module level
+        and the rendering per function (`*` for whole-module calls)."""
+        modules = {}
+        for (module, function), stages in sorted(self.records.items(), key=repr):
+            entry = modules.setdefault(module, {"import": None, "functions": {}})
+            if function is None and "import" in stages:
+                entry["import"] = stages["import"]
+            if "render" in stages:
+                entry["functions"][function or "*"] = stages["render"]
+
+        def retained(item):
+            _, entry = item
+            total = (entry["import"] or {}).get("retained", 0)
+            return -(total + sum(f["retained"] for f in entry["functions"].values()))
+
+        return {"unit": "bytes", "modules": dict(sorted(modules.items(), key=retained))}
+
+    def write(self, path):
+        import json
+        import os
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def stop(self):
+        import tracemalloc
+
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+
+def measure(module, function, stage):
+    """Context manager measuring a stage when memory accounting is enabled, and
+    doing nothing otherwise."""
+    if tracker is None:
+        return _DISABLED
+    return tracker.measure(module, function, stage)
+
+
+def from_options(options):
+    """Creates the tracker if memory accounting is enabled in mkdocs.yml."""
+    return MemoryTracker() if options.get("memory_report", False) else None
@@ -0,0 +1,62 @@
+import threading
+
+# Renderer of a worker process, built by `_init_worker`
+_renderer = None
+
+
+def _init_worker(options):
+    global _renderer
+    from . import renderer
+
+    _renderer = renderer.from_options(options)
+
+
+def _render(overload):
+    return _renderer.render_overload(overload)
+
+
+class RenderPool:
+    """Process pool rendering implementations to HTML.
+
+    Only the renderer stage (markdown, highlighting and templates) runs in the
+    workers, on the `ir.Overload` of each implementation, which is a plain
+    picklable record. The workers are started lazily, with the `spawn` method
+    so that they do not inherit the state of the mkdocs process, and the output
+    order is the input order.
+    """
+
+    def __init__(self, workers, options=None):
+        self.workers = workers
+        self.options = dict(options or {})
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def map(self, overloads):
+        payloads = list(overloads)
+        with self._lock:
+            # The pool may be shared by the threads prefetching the fragments
+            if self._executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.options,),
+                )
+        chunksize = max(1, len(payloads) // (4 * self.workers))
+        return list(self._executor.map(_render, payloads, chunksize=chunksize))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def from_options(options):
+    """Creates the pool configured in mkdocs.yml, if parallel rendering is enabled."""
+    workers = int(options.get("workers", 0))
+    if workers < 2:
+        return None
+    return RenderPool(workers, options)
@@ -0,0 +1,140 @@
+import ast
+import logging
+import os
+import re
+import time
+
+log = logging.getLogger("mkdocs.plugins.plumkdocs")
+
+# Start of a macro call in the Markdown, the arguments are parsed with `ast`
+_CALL = re.compile(r"\b(implementations|implementation_fragments|package_implementations)\s*\(")
+
+_PARAMETERS = {
+    "implementations": ("module", "function", "functions", "pattern"),
+    "implementation_fragments": ("module", "functions", "pattern"),
+    "package_implementations": ("module", "include", "exclude"),
+}
+
+
+def _parse_call(text, start):
+    # Returns the (name, arguments) of the call starting at `start`, or `None` if
+    # it is not a call with literal arguments
+    end = start
+    while True:
+        end = text.find(")", end) + 1
+        if end == 0:
+            return None
+        try:
+            node = ast.parse(text[start:end].strip(), mode="eval").body
+            break
+        except SyntaxError:
+            continue
+
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return None
+    name = node.func.id
+    try:
+        arguments = dict(zip(_PARAMETERS[name], map(ast.literal_eval, node.args), strict=False))
+        arguments.update((k.arg, ast.literal_eval(k.value)) for k in node.keywords)
+    except (ValueError, TypeError, SyntaxError):
+        # Variables or expressions, only known when the page is rendered
+        return None
+    if not isinstance(arguments.get("module"), str):
+        return None
+    return name, arguments
+
+
+def find_calls(text):
+    """Returns the requests of the macro calls with literal arguments in a
+    Markdown text: `(module, function)` for single functions,
+    `(module, functions, pattern)` for batches and
+    `(package, include, exclude, "package")` for packages."""
+    requests = set()
+    for match in _CALL.finditer(text):
+        call = _parse_call(text, match.start())
+        if call is None:
+            continue
+        name, arguments = call
+        module = arguments["module"]
+        functions = arguments.get("functions")
+        pattern = arguments.get("pattern")
+        if name == "package_implementations":
+            include = arguments.get("include")
+            exclude = arguments.get("exclude")
+            requests.add(
+                (
+                    module,
+                    None if include is None else tuple(include),
+                    None if exclude is None else tuple(exclude),
+                    "package",
+                )
+            )
+        elif name == "implementations" and functions is None and pattern is None:
+            requests.add((module, arguments.get("function")))
+        else:
+            requests.add((module, None if functions is None else tuple(functions), pattern))
+    return requests
+
+
+def scan_docs(docs_dir):
+    """Collects the distinct macro requests of all the Markdown files in `docs_dir`."""
+    requests = set()
+    for root, _, files in os.walk(docs_dir):
+        for file in files:
+            if not file.endswith(".md"):
+                continue
+            try:
+                with open(os.path.join(root, file), encoding="utf-8") as f:
+                    requests |= find_calls(f.read())
+            except (OSError, UnicodeDecodeError):
+                continue
+    return sorted(requests, key=repr)
+
+
+def _render(request):
+    from . import main
+
+    if len(request) == 2:
+        main.mod_to_string(*request)
+    elif len(request) == 3:
+        main.mod_to_strings(*request)
+    else:
+        main.pkg_to_strings(*request[:3])
+
+
+def prefetch(docs_dir, workers=None):
+    """Renders the fragments requested in the docs ahead of the pages, in a pool
+    of threads, so that the macros of the pages are served from the build cache.
+
+    Failures are only logged at debug level: the page requesting the fragment
+    reports them when it is rendered.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    start = time.perf_counter()
+    requests = scan_docs(docs_dir)
+    if not requests:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plumkdocs") as pool:
+        futures = [pool.submit(_render, r) for r in requests]
+    failed = 0
+    for request, future in zip(requests, futures, strict=True):
+        if future.exception() is not None:
+            failed += 1
+            log.debug("plumkdocs: prefetching %r failed: %s", request, future.exception())
+
+    log.info(
+        "plumkdocs: prefetched %d macro calls in %.2fs",
+        len(requests) - failed,
+        time.perf_counter() - start,
+    )
+    return len(requests) - failed
+
+
+def from_options(options, config):
+    """Runs the prefetch if it is enabled in mkdocs.yml."""
+    if not options.get("prefetch", False) or config is None:
+        return 0
+    workers = options.get("prefetch_workers")
+    return prefetch(config["docs_dir"], None if workers is None else int(workers))
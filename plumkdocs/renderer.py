@@ -0,0 +1,100 @@
+from . import rendering as _rendering
+from . import templates as _templates
+
+
+def _descriptions(docs):
+    # Descriptions of all the parameters and returns of the docs, in order
+    return [
+        item.description for doc in docs for item in doc.params + doc.returns if item.description
+    ]
+
+
+def _converted(items, converted):
+    # HTML of the description of each item, `None` for the ones without
+    return [next(converted) if item.description else None for item in items]
+
+
+class Renderer:
+    """Renders the IR to HTML.
+
+    The descriptions are converted from Markdown with the `context`, a
+    `RenderContext`, and the HTML is generated from the `templates`. The
+    renderer holds no other state, so that it can be built in the workers of
+    the render pool from the same options as the build.
+    """
+
+    def __init__(self, context=None, templates=None):
+        self.context = _rendering.RenderContext() if context is None else context
+        self.templates = _templates.Templates() if templates is None else templates
+
+    @property
+    def fingerprint(self):
+        return self.context.fingerprint + self.templates.fingerprint
+
+    def write_doc(self, buffer, doc, converted=None):
+        """Appends the HTML of an `ir.Doc` to the `buffer` list: its text followed
+        by the parameters and returns tables.
+
+        `converted` iterates over the HTML of the descriptions, when they were
+        converted together with the ones of other docs.
+        """
+        if converted is None:
+            converted = iter(self.context.convert_many(_descriptions([doc])))
+
+        buffer.append(doc.text)
+        if doc.params:
+            descriptions = _converted(doc.params, converted)
+            self.templates.write(
+                buffer, "parameters.html", params=doc.params, descriptions=descriptions
+            )
+        if doc.returns:
+            descriptions = _converted(doc.returns, converted)
+            self.templates.write(
+                buffer, "returns.html", returns=doc.returns, descriptions=descriptions
+            )
+
+    def render_doc(self, doc, converted=None):
+        """HTML of an `ir.Doc`, see `write_doc`."""
+        buffer = []
+        self.write_doc(buffer, doc, converted)
+        return "".join(buffer)
+
+    def render_signature(self, signature):
+        """Heading markup of a signature, highlighted."""
+        from .highlight import highlight_signature
+
+        return highlight_signature(signature, self.templates)
+
+    def render_overload(self, overload, converted=None):
+        """HTML of an `ir.Overload`: its highlighted signature and its docs."""
+        return self.templates.render(
+            "overload.html",
+            signature=self.render_signature(overload.signature),
+            doc=self.render_doc(overload.doc, converted),
+        )
+
+    def render_overloads(self, overloads):
+        """HTML of the overloads of a function, converting all their descriptions
+        with a single Markdown conversion."""
+        converted = iter(self.context.convert_many(_descriptions(o.doc for o in overloads)))
+        return "".join([self.render_overload(o, converted) + "\n" for o in overloads])
+
+    def render_fragment(self, doc, overloads):
+        """HTML of a fragment: the base docs `doc`, an `ir.Doc` (or `None` when no
+        function was found), followed by the HTML of the `overloads` of each
+        documented function."""
+        if doc is None:
+            return "<hr>"
+        return self.templates.render(
+            "implementations.html", doc=self.render_doc(doc), overloads=overloads
+        )
+
+    def render_function(self, function):
+        """HTML of the fragment documenting an `ir.Function`."""
+        return self.render_fragment(function.doc, [self.render_overloads(function.overloads)])
+
+
+def from_options(options, config_file=None):
+    """Creates the renderer configured in mkdocs.yml, see `rendering.from_options`
+    and `templates.from_options`."""
+    return Renderer(_rendering.from_options(options), _templates.from_options(options, config_file))
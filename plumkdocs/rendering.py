@@ -0,0 +1,87 @@
+import threading
+
+from . import tracing
+
+# Paragraph used to split the output of a batched conversion
+_SEPARATOR = "PLUMKDOCSSEPARATOR"
+_SPLIT = f"\n<p>{_SEPARATOR}</p>\n"
+
+# Extensions converting each block on its own, whose output is the same for a
+# batch of snippets. Document-level ones such as `footnotes`, `abbr` or `toc`
+# collect definitions across the whole text, and third-party ones are unknown.
+_BATCHABLE_EXTENSIONS = {
+    "admonition",
+    "attr_list",
+    "codehilite",
+    "def_list",
+    "fenced_code",
+    "legacy_attrs",
+    "legacy_em",
+    "md_in_html",
+    "nl2br",
+    "sane_lists",
+    "smarty",
+    "tables",
+}
+
+
+class RenderContext:
+    """Holds the markdown converter used to render docstring descriptions.
+
+    A single `markdown.Markdown` instance is built per thread with the configured
+    extensions and reset between conversions, instead of instantiating a new
+    converter (and extension registry) for every description.
+    """
+
+    def __init__(self, extensions=None, extension_configs=None):
+        self.extensions = list(extensions or [])
+        self.extension_configs = dict(extension_configs or {})
+        self.batchable = all(
+            isinstance(e, str) and e.removeprefix("markdown.extensions.") in _BATCHABLE_EXTENSIONS
+            for e in self.extensions
+        )
+        self._local = threading.local()
+
+    @property
+    def fingerprint(self):
+        return repr((self.extensions, sorted(self.extension_configs.items())))
+
+    @property
+    def converter(self):
+        md = getattr(self._local, "md", None)
+        if md is None:
+            from markdown import Markdown
+
+            md = Markdown(extensions=self.extensions, extension_configs=self.extension_configs)
+            self._local.md = md
+        return md
+
+    def convert(self, text):
+        with tracing.span("markdown"):
+            return self.converter.reset().convert(text)
+
+    def convert_many(self, texts):
+        """Converts several markdown snippets with a single conversion.
+
+        The snippets are joined by separator paragraphs and the HTML is split
+        back. If a snippet swallows a separator (e.g. an unclosed code fence),
+        falls back to converting each snippet on its own, as is done whenever an
+        extension may not convert the snippets independently of each other.
+        """
+        texts = list(texts)
+        if len(texts) < 2 or not self.batchable:
+            return [self.convert(text) for text in texts]
+
+        html = self.convert(f"\n\n{_SEPARATOR}\n\n".join(texts))
+        parts = html.split(_SPLIT)
+        if len(parts) != len(texts):
+            return [self.convert(text) for text in texts]
+        return parts
+
+
+def from_options(options):
+    """Creates the context configured in mkdocs.yml."""
+    return RenderContext(
+        options.get("markdown_extensions"),
+        options.get("markdown_extension_configs"),
+    )
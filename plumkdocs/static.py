@@ -0,0 +1,176 @@
+import ast
+import inspect
+import re
+from pathlib import Path
+
+import griffe
+
+from . import main
+
+# Decorators registering a method: `dispatch`, `plum.dispatch`, `dispatch(precedence=1)`
+_DISPATCH = re.compile(r"^(?:[\w.]+\.)?dispatch(?:\(.*\))?$", re.DOTALL)
+_ABSTRACT = re.compile(r"^(?:[\w.]+\.)?dispatch\.abstract$")
+# Methods generated at runtime, which can only be documented after importing
+_DYNAMIC = re.compile(r"^(?:[\w.]+\.)?dispatch\.multi\b")
+
+_KINDS = {
+    griffe.ParameterKind.positional_only: inspect.Parameter.POSITIONAL_ONLY,
+    griffe.ParameterKind.positional_or_keyword: inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    griffe.ParameterKind.var_positional: inspect.Parameter.VAR_POSITIONAL,
+    griffe.ParameterKind.keyword_only: inspect.Parameter.KEYWORD_ONLY,
+    griffe.ParameterKind.var_keyword: inspect.Parameter.VAR_KEYWORD,
+}
+
+# Parsed modules of the current build, module name -> functions (or None)
+_modules = {}
+
+
+class StaticFunction:
+    """Overloads of a plum function, read from the source without importing it.
+
+    Mirrors the parts of a plum `Function` used for rendering: `_doc` is the
+    docstring of the first definition and `methods` holds one `Implementation`
+    per concrete (non abstract) definition. `paths` holds the source file.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.paths = []
+        self._doc = None
+        self.methods = []
+        self.sources = []
+        self.dynamic = False
+
+
+class _DispatchCollector(griffe.Extension):
+    # Records every module-level function definition, including the ones that
+    # are later shadowed by a redefinition with the same name
+    def __init__(self, lines):
+        super().__init__()
+        self.lines = lines
+        self.functions = {}
+
+    def on_function_instance(self, *, node, func, agent, **kwargs):
+        if not func.parent or not func.parent.is_module:
+            return
+        decorators = [str(d.value) for d in func.decorators]
+        is_dispatch = any(_DISPATCH.match(d) or _ABSTRACT.match(d) for d in decorators)
+        is_dynamic = any(_DYNAMIC.match(d) for d in decorators)
+        if not (is_dispatch or is_dynamic):
+            return
+
+        static_func = self.functions.setdefault(func.name, StaticFunction(func.name))
+        docs = func.docstring.value if func.docstring else ""
+        if static_func._doc is None:
+            static_func._doc = docs
+        static_func.dynamic |= is_dynamic
+
+        source = "\n".join(decorators + self.lines[func.lineno - 1 : func.endlineno])
+        static_func.sources.append(source)
+        if not is_dynamic and not any(_ABSTRACT.match(d) for d in decorators):
+            static_func.methods.append(main.Implementation(func.name, _parameters(func), docs))
+
+
+def _parameters(func):
+    params = {}
+    for p in func.parameters:
+        annotation = inspect.Parameter.empty if p.annotation is None else str(p.annotation)
+        default = inspect.Parameter.empty if p.default is None else _literal(str(p.default))
+        params[p.name] = inspect.Parameter(
+            p.name, _KINDS[p.kind], default=default, annotation=annotation
+        )
+    return params
+
+
+def _literal(source):
+    # Defaults are rendered with `str`, as when importing: evaluate literals and
+    # keep the source of anything else
+    try:
+        return ast.literal_eval(source)
+    except (ValueError, SyntaxError):
+        return source
+
+
+def find_module_file(module_name, search_paths=None):
+    """Locates the source of a module without importing it (or its parents)."""
+    top, *parts = module_name.split(".")
+    try:
+        _, package = griffe.ModuleFinder(search_paths).find_spec(top)
+    except ModuleNotFoundError:
+        return None
+
+    path = package.path
+    if isinstance(path, list):
+        # Namespace package
+        directories = path
+    elif path.name == "__init__.py":
+        directories = [path.parent]
+    else:
+        return path if not parts else None
+    if not parts:
+        return directories[0] / "__init__.py"
+
+    for directory in directories:
+        base = Path(directory, *parts[:-1])
+        for candidate in (base / f"{parts[-1]}.py", base / parts[-1] / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def load_functions(module_name, search_paths=None):
+    """Returns a name -> `StaticFunction` mapping of the plum functions defined
+    in the module, or `None` if its source cannot be found."""
+    if module_name in _modules:
+        return _modules[module_name]
+
+    functions = None
+    path = find_module_file(module_name, search_paths)
+    if path is not None:
+        code = path.read_text(encoding="utf-8")
+        collector = _DispatchCollector(code.splitlines())
+        griffe.visit(
+            module_name,
+            filepath=path,
+            code=code,
+            extensions=griffe.load_extensions(collector),
+        )
+        functions = dict(sorted(collector.functions.items()))
+        for name, static_func in functions.items():
+            static_func.paths = [str(path.resolve())]
+            # Where the function is defined, like the attributes of a plum `Function`
+            static_func.__module__ = module_name
+            static_func.__qualname__ = name
+    _modules[module_name] = functions
+    return functions
+
+
+def find_operators(module_name, function=None, search_paths=None):
+    """Static counterpart of `main._find_operators`.
+
+    Returns `None` when the module must be imported instead: its source was not
+    found, the function is not defined in it with a `dispatch` decorator, or
+    some methods are generated at runtime.
+    """
+    functions = load_functions(module_name, search_paths)
+    if not functions:
+        return None
+    if function is not None:
+        if function not in functions:
+            return None
+        functions = {function: functions[function]}
+
+    if any(f.dynamic or not f.methods for f in functions.values()):
+        return None
+    return list(functions.items())
+
+
+def clear_cache():
+    _modules.clear()
+
+
+def invalidate_files(paths):
+    """Drops the parsed modules read from any of the source files in `paths`."""
+    for module_name, functions in list(_modules.items()):
+        if functions and any(not paths.isdisjoint(f.paths) for f in functions.values()):
+            del _modules[module_name]
@@ -0,0 +1,129 @@
+import json
+import mmap
+import os
+import struct
+
+from .disk_cache import create_temporary
+
+MAGIC = b"PLUMKDOC"
+VERSION = 1
+
+# magic, version, number of entries, length of the metadata and of the keys
+_HEADER = struct.Struct("<8sIIQQ")
+# offset and length of the key, offset and length of the value
+_ENTRY = struct.Struct("<QIQQ")
+
+
+class FragmentStore:
+    """Read-only mapping of string keys to texts, memory-mapped from a file.
+
+    The file holds a header, JSON metadata, an index of the entries sorted by
+    key, the keys and the values. Lookups bisect the index in the mapping and
+    values are decoded from a slice of it, so opening a store only reads its
+    header and metadata, and the memory used grows with the entries read, which
+    the OS can page out, rather than with the size of the store.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError(f"{path} is not a fragment store")
+            magic, version, self._count, meta_length, keys_length = _HEADER.unpack_from(self._map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a fragment store of version {VERSION}")
+            start = _HEADER.size
+            self._index = start + meta_length
+            if self._index + self._count * _ENTRY.size + keys_length > len(self._map):
+                raise ValueError(f"{path} is truncated")
+            self.metadata = json.loads(self._map[start : self._index])
+        except ValueError:
+            self._map.close()
+            raise
+        self._view = memoryview(self._map)
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, n):
+        return _ENTRY.unpack_from(self._map, self._index + n * _ENTRY.size)
+
+    def _key(self, entry):
+        key_offset, key_length, _, _ = entry
+        return self._map[key_offset : key_offset + key_length]
+
+    def _find(self, key):
+        # Bisects the sorted index, returns the entry of `key` or `None`
+        key = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry(mid)
+            if self._key(entry) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            entry = self._entry(lo)
+            if self._key(entry) == key:
+                return entry
+        return None
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def get(self, key, default=None):
+        entry = self._find(key)
+        if entry is None:
+            return default
+        _, _, offset, length = entry
+        return str(self._view[offset : offset + length], "utf-8")
+
+    def keys(self):
+        for n in range(self._count):
+            yield self._key(self._entry(n)).decode("utf-8")
+
+    def close(self):
+        if self._map is not None:
+            self._view.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write(path, entries, metadata=None):
+    """Writes a store of the `entries`, a key -> text mapping, atomically."""
+    items = sorted((key.encode("utf-8"), text.encode("utf-8")) for key, text in entries.items())
+    meta = json.dumps(metadata or {}).encode("utf-8")
+    keys_length = sum(len(key) for key, _ in items)
+
+    # Keys follow the index and values follow the keys
+    key_offset = _HEADER.size + len(meta) + len(items) * _ENTRY.size
+    offset = key_offset + keys_length
+    index = []
+    for key, value in items:
+        index.append(_ENTRY.pack(key_offset, len(key), offset, len(value)))
+        key_offset += len(key)
+        offset += len(value)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = create_temporary(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(items), len(meta), keys_length))
+            f.write(meta)
+            f.writelines(index)
+            f.writelines(key for key, _ in items)
+            f.writelines(value for _, value in items)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
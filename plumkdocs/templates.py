@@ -0,0 +1,107 @@
+import hashlib
+import os
+
+_TABLE = '<div class="md-typeset__scrollwrap"><div class="md-typeset__table"><table>'
+_TABLE_END = "</tbody></table></div></div>"
+
+# Built-in templates, which can be overridden by files with the same name in the
+# `templates_dir` of mkdocs.yml. `descriptions` holds the HTML of the
+# description of each row, or `None` when it has none
+DEFAULT_TEMPLATES = {
+    "signature.html": (
+        '<h3 class="doc doc-heading"><code class="highlight language-python">{{ code }}</code></h3>'
+    ),
+    "parameters.html": (
+        "<p><strong>Parameters:</strong></p>" + _TABLE + "<thead><tr><th>Name</th><th>Type</th>"
+        "<th>Description</th><th>Default</th></tr></thead><tbody>"
+        "{% for p in params %}<tr>"
+        "<td><code>{{ p.name }}</code></td>"
+        "<td>{% if p.annotation %}<code>{{ p.annotation }}</code>{% endif %}</td>"
+        "<td>{% if descriptions[loop.index0] is not none %}{{ descriptions[loop.index0] }}{% endif %}</td>"
+        "<td>{% if p.default is none %}<em>required</em>"
+        "{% else %}<code>{{ p.default | e }}</code>{% endif %}</td>"
+        "</tr>{% endfor %}" + _TABLE_END
+    ),
+    "returns.html": (
+        "<p><strong>Returns:</strong></p>" + _TABLE + "<thead><tr><th>Type</th>"
+        "<th>Description</th></tr></thead><tbody>"
+        "{% for r in returns %}<tr>"
+        "<td><code>{{ r.annotation }}</code></td>"
+        "<td>{% if descriptions[loop.index0] is not none %}{{ descriptions[loop.index0] }}{% endif %}</td>"
+        "</tr>{% endfor %}" + _TABLE_END
+    ),
+    "overload.html": "{{ signature }}\n\n{{ doc }}\n",
+    "implementations.html": (
+        "{{ doc }}\n<h3>Concrete implementations:</h3>"
+        "{% for text in overloads %}{{ text }}{% endfor %}<hr>"
+    ),
+}
+
+
+class Templates:
+    """Jinja templates of the HTML output, compiled once on first use.
+
+    Templates found in `directory` take precedence over the built-in ones. The
+    output is not escaped, except for the default values, since the docstring
+    text and descriptions are already Markdown or HTML.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._environment = None
+        self._compiled = {}
+        self._fingerprint = None
+
+    @property
+    def environment(self):
+        if self._environment is None:
+            from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader
+
+            loaders = [DictLoader(DEFAULT_TEMPLATES)]
+            if self.directory is not None:
+                loaders.insert(0, FileSystemLoader(self.directory))
+            self._environment = Environment(
+                loader=ChoiceLoader(loaders),
+                autoescape=False,
+                keep_trailing_newline=True,
+                auto_reload=False,
+            )
+        return self._environment
+
+    def get(self, name):
+        template = self._compiled.get(name)
+        if template is None:
+            template = self._compiled[name] = self.environment.get_template(name)
+        return template
+
+    def write(self, buffer, name, **context):
+        """Appends the output of the template to the `buffer` list."""
+        buffer.extend(self.get(name).generate(**context))
+
+    def render(self, name, **context):
+        buffer = []
+        self.write(buffer, name, **context)
+        return "".join(buffer)
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            h = hashlib.sha256()
+            for name in sorted(DEFAULT_TEMPLATES):
+                path = None if self.directory is None else os.path.join(self.directory, name)
+                if path is not None and os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        h.update(name.encode() + f.read())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+
+def from_options(options, config_file=None):
+    """Creates the templates configured in mkdocs.yml, the `templates_dir` being
+    relative to the directory of `config_file`."""
+    directory = options.get("templates_dir")
+    if directory is None:
+        return Templates()
+    if config_file is not None:
+        directory = os.path.join(os.path.dirname(os.path.abspath(config_file)), directory)
+    return Templates(os.path.abspath(directory))
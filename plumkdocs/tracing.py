@@ -0,0 +1,113 @@
+import contextlib
+import os
+import threading
+import time
+
+# Tracer of the current build, `None` when tracing is disabled
+tracer = None
+
+_DISABLED = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        self.tracer.record(self.name, self.category, self.start, end - self.start, self.args)
+
+
+class Tracer:
+    """Records the duration of the stages of the build as complete events.
+
+    Events are kept in memory, and exported in the Chrome trace format which is
+    read by `chrome://tracing` and Perfetto. Spans can be recorded from any
+    thread, each thread getting its own track.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def span(self, name, category="stage", args=None):
+        return _Span(self, name, category, args or {})
+
+    def record(self, name, category, start, duration, args):
+        event = (name, category, start - self._origin, duration, threading.get_ident(), args)
+        with self._lock:
+            self.events.append(event)
+
+    def chrome_trace(self):
+        """Returns the events in the Chrome trace format, as a dictionary."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, category, start, duration, tid, args in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path):
+        import json
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self):
+        """Returns the total duration in seconds of each macro call, sorted from
+        the slowest, and of each stage, as two lists of `(label, seconds, count)`."""
+        macros = {}
+        stages = {}
+        for name, category, _, duration, _, args in self.events:
+            if category == "macro":
+                arguments = ", ".join(repr(v) for v in args.values() if v is not None)
+                totals, label = macros, f"{name}({arguments})"
+            else:
+                totals, label = stages, name
+            seconds, count = totals.get(label, (0, 0))
+            totals[label] = (seconds + duration / 1e9, count + 1)
+
+        def ordered(totals):
+            return sorted(((label, s, c) for label, (s, c) in totals.items()), key=lambda x: -x[1])
+
+        return ordered(macros), ordered(stages)
+
+
+def span(name, category="stage", **args):
+    """Context manager recording `name` when tracing is enabled, and doing
+    nothing otherwise."""
+    if tracer is None:
+        return _DISABLED
+    return tracer.span(name, category, args)
+
+
+def from_options(options):
+    """Creates the tracer if tracing is enabled in mkdocs.yml."""
+    return Tracer() if options.get("trace", False) else None
+
+
+def report_path(config, name):
+    """Path of a report file of the build: next to the site directory."""
+    site_dir = os.path.abspath(config.get("site_dir") or "site")
+    return os.path.join(os.path.dirname(site_dir), name)
@@ -0,0 +1,100 @@
+import fnmatch
+import logging
+
+log = logging.getLogger("mkdocs.plugins.plumkdocs")
+
+
+def _matches(name, patterns):
+    # Glob patterns on module names, a pattern also matching the submodules
+    return any(
+        fnmatch.fnmatchcase(name, p) or fnmatch.fnmatchcase(name, p + ".*") for p in patterns
+    )
+
+
+def _function_key(func):
+    # Identifies a function across the modules exposing it, also when each module
+    # gets its own description of it (static and isolation modes)
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if module is None or qualname is None:
+        return (None, id(func))
+    return (module, qualname)
+
+
+def walk_modules(package, include=None, exclude=None):
+    """Returns the names of a package and of all its submodules, recursively.
+
+    `include` and `exclude` are lists of glob patterns on the module names,
+    e.g. `pkg.tests` or `pkg.*._private`, matching the submodules too. Only the
+    packages are imported to find their submodules, the ones failing to import
+    are skipped.
+    """
+    import importlib
+    import pkgutil
+
+    def onerror(name):
+        log.warning("plumkdocs: importing %s failed, its submodules are skipped", name)
+
+    root = importlib.import_module(package)
+    names = [package]
+    path = getattr(root, "__path__", None)
+    if path is not None:
+        for info in pkgutil.walk_packages(path, package + ".", onerror=onerror):
+            names.append(info.name)
+    return [
+        name
+        for name in names
+        if (not include or _matches(name, include)) and not (exclude and _matches(name, exclude))
+    ]
+
+
+def discover(package, include=None, exclude=None, workers=None):
+    """Finds the plum functions of a package tree.
+
+    The modules are imported and scanned concurrently, in a pool of `workers`
+    threads. A function re-exported by several modules is only kept once, as
+    identified by its defining module and qualified name whichever way the
+    modules were introspected: in the module defining it if it is walked, and
+    otherwise in the first module exposing it. Returns the `(module, operators)`
+    pairs of the modules with functions, in the walk order, where `operators`
+    are the sorted `(name, Function)` pairs of `mod_to_string`.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from . import main
+
+    modules = walk_modules(package, include, exclude)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plumkdocs") as pool:
+        futures = [pool.submit(main._resolve_operators, name) for name in modules]
+
+    found = []
+    for name, future in zip(modules, futures, strict=True):
+        if future.exception() is not None:
+            log.warning("plumkdocs: skipping %s: %s", name, future.exception())
+            continue
+        found.append((name, future.result()))
+
+    # Module documenting each function, which is where it is defined if possible
+    walked = {name for name, _ in found}
+    owners = {}
+    for name, operators in found:
+        for _, func in operators:
+            key = _function_key(func)
+            if key[0] in walked:
+                owners[key] = key[0]
+            else:
+                owners.setdefault(key, name)
+
+    discovered = []
+    documented = set()
+    for name, operators in found:
+        owned = []
+        for operator in operators:
+            # A function may also be exposed under several names of its module
+            key = _function_key(operator[1])
+            if owners[key] == name and key not in documented:
+                documented.add(key)
+                owned.append(operator)
+        if owned:
+            discovered.append((name, owned))
+    return discovered
@@ -3,6 +3,7 @@
 import inspect
 import os
 import sys
+import textwrap
 
 import pytest
 from plum import dispatch
@@ -11,6 +12,42 @@ from plum import dispatch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(autouse=True)
+def reset_build_state():
+    """Reset the module-level state configured by define_env after each test."""
+    yield
+    from plumkdocs import main, memory, static, tracing
+    from plumkdocs.formatting import DefaultFormatter, TypeFormatter
+    from plumkdocs.renderer import Renderer
+
+    main.build_cache.clear()
+    main.invalidate_module_index()
+    main.docstring_cache.clear()
+    main.docstring_cache.resize(main.DEFAULT_DOCSTRING_CACHE_SIZE)
+    main.disk_cache = None
+    if main.render_pool is not None:
+        main.render_pool.shutdown()
+    main.render_pool = None
+    main.static_mode = False
+    if main.bundle is not None:
+        main.bundle.close()
+    main.bundle = None
+    if main.isolation_pool is not None:
+        main.isolation_pool.shutdown()
+    main.isolation_pool = None
+    main.incremental = False
+    main._source_mtimes.clear()
+    main._previous_options = None
+    main.type_formatter = TypeFormatter()
+    main.default_formatter = DefaultFormatter()
+    static.clear_cache()
+    main.renderer = Renderer()
+    tracing.tracer = None
+    if memory.tracker is not None:
+        memory.tracker.stop()
+    memory.tracker = None
+
+
 @pytest.fixture
 def simple_implementation_params():
     """Return sample parameters for Implementation testing."""
@@ -97,6 +134,8 @@ def mock_env():
     class MockEnv:
         def __init__(self):
             self.macros = {}
+            self.variables = {}
+            self.conf = {}
 
         def macro(self, func):
             """Decorator to register a macro."""
@@ -104,3 +143,43 @@ def mock_env():
             return func
 
     return MockEnv()
+
+
+@pytest.fixture
+def write_module(tmp_path, monkeypatch):
+    """Return a function writing modules in a temporary directory importable for
+    the test, and unloading them afterwards.
+
+    `write_module(name, source, package=False)` writes the dedented `source` to
+    the file of the module `name`, `__init__.py` for a package, creating the
+    missing parent packages, and returns its path. A rewritten file gets a later
+    modification time, whatever the resolution of the file system.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+    roots = set()
+
+    def write(name, source="", package=False):
+        parts = name.split(".")
+        directory = tmp_path
+        for part in parts[:-1]:
+            directory = directory / part
+            directory.mkdir(exist_ok=True)
+            if not (directory / "__init__.py").exists():
+                (directory / "__init__.py").write_text("")
+        if package:
+            (directory / parts[-1]).mkdir(exist_ok=True)
+            path = directory / parts[-1] / "__init__.py"
+        else:
+            path = directory / f"{parts[-1]}.py"
+        previous = path.stat().st_mtime_ns if path.exists() else None
+        path.write_text(textwrap.dedent(source))
+        if previous is not None:
+            mtime = max(path.stat().st_mtime_ns, previous + 1_000_000_000)
+            os.utime(path, ns=(mtime, mtime))
+        roots.add(parts[0])
+        return path
+
+    yield write
+    for name in list(sys.modules):
+        if name.split(".")[0] in roots:
+            del sys.modules[name]
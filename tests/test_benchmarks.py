@@ -0,0 +1,43 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+
+from benchmarks.run import STAGES, main, run
+from benchmarks.synthetic import ModuleSpec, module_source
+
+
+class TestSynthetic:
+    """Tests for the generation of synthetic modules."""
+
+    def test_module_shape(self):
+        """Test that the module defines the requested functions and overloads."""
+        namespace = {}
+        exec(module_source(ModuleSpec(functions=2, overloads=3, params=4)), namespace)
+        for name in ("function_0", "function_1"):
+            # Two signatures per method, because of the default value
+            assert len(namespace[name].methods) == 6
+
+    def test_annotation_depth(self):
+        """Test that deeper annotations nest more."""
+        shallow = module_source(ModuleSpec(annotation_depth=0))
+        deep = module_source(ModuleSpec(annotation_depth=3))
+        assert "Union[" not in shallow
+        assert "Dict[str, Union[" in deep
+
+
+class TestRun:
+    """Tests for the benchmark runner."""
+
+    def test_stages(self):
+        """Test that every stage is timed."""
+        result = run(ModuleSpec(functions=1, overloads=2), repeat=1)
+        assert list(result["stages"]) == STAGES
+        assert all(stats["min"] >= 0 for stats in result["stages"].values())
+
+    def test_json_output(self, tmp_path):
+        """Test that the command line writes one result per combination of sizes."""
+        output = tmp_path / "results.json"
+        main(["--functions", "1", "--overloads", "1,2", "--repeat", "1", "--output", str(output)])
+        data = json.loads(output.read_text())
+        assert [r["spec"]["overloads"] for r in data["results"]] == [1, 2]
+        assert "python" in data["environment"]
@@ -0,0 +1,68 @@
+"""Tests for the build-scoped render cache."""
+
+import logging
+
+from plum import Function
+
+from plumkdocs.main import BuildCache, build_cache, define_env, mod_to_string, on_post_build
+
+
+class TestBuildCache:
+    """Tests for the BuildCache class."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored entry is served for identical method tables."""
+        cache = BuildCache()
+        assert cache.get(("mod", "f"), ()) is None
+        cache.put(("mod", "f"), (), "<hr>")
+        assert cache.get(("mod", "f"), ()) == "<hr>"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_changed_method_table_is_a_miss(self):
+        """Test that entries are invalidated when the methods change."""
+        cache = BuildCache()
+        func = Function(lambda x: x)
+        cache.put(("mod", "f"), (("f", func, ()),), "old")
+
+        changed = (("f", func, (object(),)),)
+        assert cache.get(("mod", "f"), changed) is None
+
+    def test_clear_resets_counters(self):
+        """Test that clear drops entries and counters."""
+        cache = BuildCache()
+        cache.put(("mod", None), (), "text")
+        cache.get(("mod", None), ())
+        cache.clear()
+        assert cache.stats() == {"entries": 0, "hits": 0, "misses": 0}
+
+
+class TestModToStringCaching:
+    """Tests for the memoization of mod_to_string."""
+
+    def test_repeated_calls_hit_the_cache(self, mock_env):
+        """Test that repeated macro calls are served from the cache."""
+        define_env(mock_env)
+        first = mod_to_string("tests.fixtures.sample_functions", "simple_func")
+        second = mod_to_string("tests.fixtures.sample_functions", "simple_func")
+
+        assert first == second
+        assert build_cache.hits == 1
+        assert build_cache.misses == 1
+
+    def test_define_env_clears_cache(self, mock_env):
+        """Test that each build starts with an empty cache."""
+        mod_to_string("tests.fixtures.sample_functions", "simple_func")
+        define_env(mock_env)
+        assert build_cache.stats()["entries"] == 0
+
+    def test_on_post_build_logs_stats(self, mock_env, caplog):
+        """Test that hit/miss counters are logged at the end of the build."""
+        define_env(mock_env)
+        mod_to_string("tests.fixtures.sample_functions", "simple_func")
+        mod_to_string("tests.fixtures.sample_functions", "simple_func")
+
+        with caplog.at_level(logging.INFO, logger="mkdocs.plugins.plumkdocs"):
+            on_post_build(mock_env)
+
+        assert "1 fragments rendered, 1 served from cache" in caplog.text
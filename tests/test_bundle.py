@@ -0,0 +1,163 @@
+"""Tests for the fragment bundle rendered by the plumkdocs command."""
+
+import logging
+import os
+import textwrap
+
+import pytest
+
+from plumkdocs import bundle, cli, main
+from plumkdocs.bundle import Bundle
+from plumkdocs.main import define_env, mod_to_string, on_post_build
+
+MODULE = "tests.fixtures.sample_functions"
+
+SOURCE = '''
+from plum import dispatch
+
+
+@dispatch
+def g(x: int):
+    """{doc}"""
+    return x
+'''
+
+
+@pytest.fixture
+def module(write_module):
+    """Return a function writing a module importable for the test."""
+
+    def write(doc):
+        return write_module("bundled_module", SOURCE.format(doc=doc))
+
+    write("First version.")
+    return write
+
+
+class TestBundle:
+    """Tests for writing and reading bundles."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that the bundle holds the fragments rendered in process."""
+        path = tmp_path / "bundle.bin"
+        count = cli.prerender([MODULE], path)
+
+        loaded = Bundle.load(path)
+        names = loaded.functions(MODULE)
+        assert "simple_func" in names
+        assert count == len(names) + 1
+
+        main.build_cache.clear()
+        assert loaded.get(MODULE, "simple_func") == mod_to_string(MODULE, "simple_func")
+        assert loaded.get(MODULE) == mod_to_string(MODULE)
+        assert loaded.get(MODULE, "missing") is None
+        assert loaded.hits == 2
+
+    def test_modified_module_is_stale(self, tmp_path, module):
+        """Test that the fragments of a modified module are not served."""
+        path = tmp_path / "bundle.bin"
+        cli.prerender(["bundled_module"], path)
+        assert "First version." in Bundle.load(path).get("bundled_module", "g")
+
+        module("Second version.")
+        loaded = Bundle.load(path)
+        assert loaded.functions("bundled_module") is None
+        assert loaded.get("bundled_module", "g") is None
+
+    def test_other_configuration(self, tmp_path):
+        """Test that a bundle rendered with other options is ignored."""
+        path = tmp_path / "bundle.bin"
+        cli.prerender([MODULE], path, {"default_max_length": 10})
+
+        options = {"bundle": str(path)}
+        cli.configure({})
+        assert bundle.from_options(options) is None
+        cli.configure({"default_max_length": 10})
+        assert bundle.from_options(options) is not None
+
+    def test_invalid_bundle(self, tmp_path, caplog):
+        """Test that unreadable bundles are ignored with a warning."""
+        path = tmp_path / "bundle.bin"
+        path.write_text('{"format": 0}')
+        with caplog.at_level(logging.WARNING, logger="mkdocs.plugins.plumkdocs"):
+            assert bundle.from_options({"bundle": str(path)}) is None
+        assert "ignoring the bundle" in caplog.text
+
+
+class TestBundleOption:
+    """Tests for the bundle option."""
+
+    def test_macros_are_served_from_bundle(self, mock_env, tmp_path, monkeypatch, caplog):
+        """Test that the macros do not import nor render the bundled modules."""
+        config_file = tmp_path / "mkdocs.yml"
+        cli.prerender([MODULE], tmp_path / "bundle.bin")
+        expected = Bundle.load(tmp_path / "bundle.bin")
+
+        mock_env.conf = {"config_file_path": str(config_file)}
+        mock_env.variables = {"plumkdocs": {"bundle": "bundle.bin"}}
+        define_env(mock_env)
+        assert main.bundle is not None
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rendered in process")
+
+        monkeypatch.setattr(main, "_resolve_operators", fail)
+        assert mock_env.macros["implementations"](MODULE, "simple_func") == expected.get(
+            MODULE, "simple_func"
+        )
+        fragments = mock_env.macros["implementation_fragments"](MODULE, pattern="^simple")
+        assert list(fragments) == ["simple_func"]
+
+        with caplog.at_level(logging.INFO, logger="mkdocs.plugins.plumkdocs"):
+            on_post_build(mock_env)
+        assert "2 fragments served from the bundle" in caplog.text
+
+    def test_missing_bundle(self, mock_env, tmp_path):
+        """Test that the build renders everything when the bundle does not exist."""
+        mock_env.variables = {"plumkdocs": {"bundle": str(tmp_path / "bundle.bin")}}
+        define_env(mock_env)
+        assert main.bundle is None
+
+
+class TestCli:
+    """Tests for the plumkdocs command."""
+
+    def test_main(self, tmp_path, monkeypatch):
+        """Test that the command reads mkdocs.yml and writes the configured bundle."""
+        (tmp_path / "mkdocs.yml").write_text(
+            textwrap.dedent(
+                """
+                site_name: Test
+                extra:
+                  version: !ENV [VERSION, "dev"]
+                  plumkdocs:
+                    bundle: build/bundle.bin
+                    default_max_length: 10
+                """
+            )
+        )
+        monkeypatch.chdir(tmp_path)
+        cli.main([MODULE])
+
+        path = tmp_path / "build" / "bundle.bin"
+        assert os.path.isfile(path)
+        assert bundle.from_options({"bundle": str(path)}) is not None
+        cli.configure({})
+        assert bundle.from_options({"bundle": str(path)}) is None
+
+    def test_load_options(self, tmp_path):
+        """Test that the options are read whatever the tags of mkdocs.yml."""
+        config = tmp_path / "mkdocs.yml"
+        config.write_text(
+            "extra:\n  plumkdocs:\n    workers: 2\nhooks:\n  - !!python/name:os.getcwd\n"
+        )
+        assert cli.load_options(config) == {"workers": 2}
+
+    def test_jobs(self, tmp_path, module):
+        """Test that modules are rendered in a pool of processes."""
+        path = tmp_path / "bundle.bin"
+        cli.prerender([MODULE, "bundled_module"], path, jobs=2)
+
+        loaded = Bundle.load(path)
+        assert "First version." in loaded.get("bundled_module", "g")
+        assert loaded.get(MODULE, "simple_func") is not None
@@ -0,0 +1,154 @@
+"""Tests for the rendering of default values."""
+
+import inspect
+
+import pytest
+
+from plumkdocs import formatting, main
+from plumkdocs.formatting import DefaultFormatter, Rendered, register_default_formatter
+from plumkdocs.main import Implementation, define_env
+
+
+class FakeArray:
+    """Array-like object with a huge repr, standing in for e.g. a NumPy array."""
+
+    shape = (1000, 1000)
+    dtype = "float32"
+    reprs = 0
+
+    def __repr__(self):
+        FakeArray.reprs += 1
+        return "FakeArray(" + "0.0, " * 1_000_000 + ")"
+
+
+class Slow:
+    """Object whose repr is slow, counting its calls."""
+
+    reprs = 0
+
+    def __repr__(self):
+        Slow.reprs += 1
+        return "Slow()"
+
+
+@pytest.fixture
+def hooks():
+    """Restore the registered formatting hooks after the test."""
+    saved = dict(formatting._default_hooks)
+    yield formatting._default_hooks
+    formatting._default_hooks.clear()
+    formatting._default_hooks.update(saved)
+
+
+class TestDefaultFormatter:
+    """Tests for the DefaultFormatter class."""
+
+    def test_scalars(self):
+        """Test that small values are rendered by their repr."""
+        formatter = DefaultFormatter()
+        assert formatter.format(None) == "None"
+        assert formatter.format(1.5) == "1.5"
+        assert formatter.format((1, 2)) == "(1, 2)"
+
+    def test_strings_are_shown_as_is(self):
+        """Test that top-level strings keep their `str` form."""
+        assert DefaultFormatter().format("default") == "default"
+
+    def test_long_strings_are_truncated(self):
+        """Test that strings are cut at the maximum length."""
+        text = DefaultFormatter(max_length=10).format("x" * 100)
+        assert text == "xxxxxxx..."
+
+    def test_containers_are_bounded(self):
+        """Test that long containers are abbreviated."""
+        text = DefaultFormatter(max_items=3).format(list(range(100)))
+        assert text == "[0, 1, 2, ...]"
+
+    def test_array_like_summary(self):
+        """Test that array-like objects are summarized without their repr."""
+        FakeArray.reprs = 0
+        text = DefaultFormatter().format(FakeArray())
+        assert text == "FakeArray(shape=(1000, 1000), dtype=float32)"
+        assert FakeArray.reprs == 0
+
+    def test_hooks(self, hooks):
+        """Test that registered hooks take precedence, also for nested values."""
+        register_default_formatter(FakeArray, lambda x: "<array>")
+        formatter = DefaultFormatter()
+        assert formatter.format(FakeArray()) == "<array>"
+        assert formatter.format([FakeArray()]) == "[<array>]"
+
+    def test_identity_cache(self, hooks):
+        """Test that the same object is only formatted once."""
+        calls = []
+        register_default_formatter(FakeArray, lambda x: calls.append(x) or "<array>")
+        formatter = DefaultFormatter()
+        value = FakeArray()
+        formatter.format(value)
+        formatter.format(value)
+        assert len(calls) == 1
+
+        formatter.format(FakeArray())
+        assert len(calls) == 2
+
+    def test_placeholder(self, hooks):
+        """Test that registered types without a hook are shown as placeholders."""
+        Slow.reprs = 0
+        formatter = DefaultFormatter()
+        assert formatter.format(Slow()) == "Slow()"
+        register_default_formatter(Slow)
+        assert formatter.format(Slow()) == "<Slow>"
+        assert formatter.format([Slow()]) == "[<Slow>]"
+        assert Slow.reprs == 1
+
+    def test_deterministic(self):
+        """Test that the output does not depend on previously formatted values."""
+        values = [Slow(), list(range(100)), "x" * 100]
+        first = DefaultFormatter()
+        second = DefaultFormatter()
+        assert [first.format(v) for v in values] == [second.format(v) for v in reversed(values)][
+            ::-1
+        ]
+
+    def test_rendered_values_pass_through(self):
+        """Test that already rendered values are not formatted again."""
+        text = Rendered("x" * 100)
+        assert DefaultFormatter(max_length=10).format(text) is text
+
+
+class TestDefaultsInImplementation:
+    """Tests for the defaults shown in signatures and tables."""
+
+    def test_large_default(self):
+        """Test that large defaults are rendered compactly in the signature."""
+
+        def f(x=FakeArray()):  # noqa: B008
+            """Docs.
+
+            Args:
+                x: The array.
+            """
+
+        impl = Implementation("f", inspect.signature(f).parameters, inspect.getdoc(f))
+        expected = "FakeArray(shape=(1000, 1000), dtype=float32)"
+        assert impl._signature_text == f"f(x = {expected})"
+        assert f"<code>{expected}</code>" in impl.docs
+
+    def test_table_default_is_escaped(self):
+        """Test that defaults are escaped in the parameter table."""
+
+        def f(x=object):
+            """Docs.
+
+            Args:
+                x: The value.
+            """
+
+        impl = Implementation("f", inspect.signature(f).parameters, inspect.getdoc(f))
+        assert "<code>&lt;class &#39;object&#39;&gt;</code>" in impl.docs
+
+    def test_options(self, mock_env):
+        """Test that the limits are read from mkdocs.yml."""
+        mock_env.variables = {"plumkdocs": {"default_max_length": 10}}
+        define_env(mock_env)
+        assert main.default_formatter.format("x" * 100) == "xxxxxxx..."
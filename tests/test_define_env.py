@@ -90,3 +90,26 @@ class TestDefineEnv:
         assert "function" in params
         # function parameter should have a default (it's optional)
         assert sig.parameters["function"].default is None
+
+    def test_implementations_macro_with_functions(self, mock_env):
+        """Test that a list of functions renders the concatenated fragments."""
+        define_env(mock_env)
+
+        macro_func = mock_env.macros["implementations"]
+        result = macro_func(
+            "tests.fixtures.sample_functions", functions=["simple_func", "func_no_docs"]
+        )
+
+        assert result == macro_func("tests.fixtures.sample_functions", "simple_func") + macro_func(
+            "tests.fixtures.sample_functions", "func_no_docs"
+        )
+
+    def test_implementation_fragments_macro(self, mock_env):
+        """Test that the fragments macro returns a name -> fragment mapping."""
+        define_env(mock_env)
+
+        macro_func = mock_env.macros["implementation_fragments"]
+        result = macro_func("tests.fixtures.sample_functions", pattern="^simple_")
+
+        assert list(result) == ["simple_func"]
+        assert "Base documentation for simple_func" in result["simple_func"]
@@ -0,0 +1,143 @@
+"""Tests for the persistent on-disk fragment cache."""
+
+import os
+import stat
+import sys
+
+import pytest
+from plum import Function
+
+from plumkdocs import main
+from plumkdocs.disk_cache import ENV_VAR, DiskCache, from_options, function_fingerprint
+
+
+@pytest.fixture
+def fresh_function():
+    """Return a factory of plum Functions with a single method."""
+
+    def make(doc="Docs."):
+        def impl(x: int, y: int = 1):
+            return x + y
+
+        impl.__doc__ = doc
+        func = Function(impl)
+        func.register(impl)
+        return func
+
+    return make
+
+
+class TestDiskCache:
+    """Tests for the DiskCache class."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that stored entries can be read back."""
+        cache = DiskCache(tmp_path)
+        assert cache.get("abcdef") is None
+        cache.put("abcdef", "<h3>text</h3>")
+        assert cache.get("abcdef") == "<h3>text</h3>"
+
+    def test_entries_are_sharded(self, tmp_path):
+        """Test that entries are stored under a two character shard."""
+        cache = DiskCache(tmp_path)
+        cache.put("abcdef", "text")
+        assert os.path.isfile(tmp_path / "ab" / "abcdef.html")
+
+    def test_no_temporary_files_left(self, tmp_path):
+        """Test that atomic writes do not leave temporary files behind."""
+        cache = DiskCache(tmp_path)
+        cache.put("abcdef", "text")
+        cache.put("abcdef", "other text")
+        assert os.listdir(tmp_path / "ab") == ["abcdef.html"]
+        assert cache.get("abcdef") == "other text"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_permissions(self, tmp_path):
+        """Test that entries get the permissions of a file created with `open`."""
+        umask = os.umask(0o022)
+        try:
+            DiskCache(tmp_path).put("abcdef", "text")
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(os.stat(tmp_path / "ab" / "abcdef.html").st_mode) == 0o644
+
+    def test_eviction_keeps_cache_bounded(self, tmp_path):
+        """Test that least recently used entries are evicted."""
+        cache = DiskCache(tmp_path, max_bytes=250)
+        for i in range(10):
+            fingerprint = f"{i:02d}" + "f" * 10
+            cache.put(fingerprint, "x" * 50)
+            os.utime(cache._path(fingerprint), (i, i))
+
+        assert cache._total_size() <= 250
+        # The most recent entry survives
+        assert cache.get("09" + "f" * 10) == "x" * 50
+        assert cache.get("00" + "f" * 10) is None
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every entry."""
+        cache = DiskCache(tmp_path)
+        cache.put("abcdef", "text")
+        cache.clear()
+        assert cache.get("abcdef") is None
+
+
+class TestFunctionFingerprint:
+    """Tests for function_fingerprint."""
+
+    def test_stable(self, fresh_function):
+        """Test that the fingerprint is deterministic."""
+        func = fresh_function()
+        assert function_fingerprint("f", func) == function_fingerprint("f", func)
+
+    def test_depends_on_docstring(self, fresh_function):
+        """Test that docstring changes produce a new fingerprint."""
+        assert function_fingerprint("f", fresh_function("A.")) != function_fingerprint(
+            "f", fresh_function("B.")
+        )
+
+    def test_depends_on_name(self, fresh_function):
+        """Test that the function name is part of the fingerprint."""
+        func = fresh_function()
+        assert function_fingerprint("f", func) != function_fingerprint("g", func)
+
+
+class TestFromOptions:
+    """Tests for the cache configuration."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no cache is created without configuration."""
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        assert from_options({}) is None
+
+    def test_from_mkdocs_options(self, monkeypatch, tmp_path):
+        """Test configuration from the mkdocs.yml options."""
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        cache = from_options({"cache_dir": str(tmp_path), "cache_max_bytes": 1000})
+        assert cache.directory == str(tmp_path)
+        assert cache.max_bytes == 1000
+
+    def test_env_var_takes_precedence(self, monkeypatch, tmp_path):
+        """Test that the environment variable overrides mkdocs.yml."""
+        monkeypatch.setenv(ENV_VAR, str(tmp_path / "env"))
+        cache = from_options({"cache_dir": str(tmp_path / "yml")})
+        assert cache.directory == str(tmp_path / "env")
+
+
+class TestModToStringWithDiskCache:
+    """Tests for mod_to_string with the persistent cache enabled."""
+
+    def test_fragments_are_persisted(self, mock_env, monkeypatch, tmp_path):
+        """Test that a second build reads fragments from disk."""
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        mock_env.variables = {"plumkdocs": {"cache_dir": str(tmp_path)}}
+
+        main.define_env(mock_env)
+        first = main.mod_to_string("tests.fixtures.sample_functions", "simple_func")
+        assert len(list(tmp_path.glob("*/*.html"))) == 1
+
+        # A new build must not re-render the implementations
+        main.define_env(mock_env)
+        monkeypatch.setattr(main, "_extract_implementations", None)
+        second = main.mod_to_string("tests.fixtures.sample_functions", "simple_func")
+        assert first == second
@@ -0,0 +1,97 @@
+"""Tests for the LRU cache of parsed docstrings."""
+
+import logging
+
+from griffe import Parser
+
+from plumkdocs import main
+from plumkdocs.lru import LRUCache
+from plumkdocs.main import Implementation, define_env, docstring_cache, parse_docstring
+
+
+class TestLRUCache:
+    """Tests for the LRUCache class."""
+
+    def test_get_and_put(self):
+        """Test storing and retrieving entries."""
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_resize(self):
+        """Test that shrinking the cache drops the oldest entries."""
+        cache = LRUCache(3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.resize(1)
+        assert len(cache) == 1
+        assert cache.get("c") == "c"
+
+    def test_statistics(self):
+        """Test hit/miss counting."""
+        cache = LRUCache()
+        cache.get("a")
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        assert cache.stats() == {
+            "entries": 1,
+            "maxsize": 1024,
+            "hits": 2,
+            "misses": 1,
+            "hit_rate": 2 / 3,
+        }
+
+    def test_empty_hit_rate(self):
+        """Test the hit rate of an unused cache."""
+        assert LRUCache().hit_rate == 0.0
+
+
+class TestParseDocstring:
+    """Tests for parse_docstring."""
+
+    def test_identical_docstrings_are_parsed_once(self):
+        """Test that the parsed sections are shared between identical docstrings."""
+        docs = "Shared docstring.\n\nArgs:\n    x (int): Value."
+        first = parse_docstring(docs)
+        second = parse_docstring(docs)
+        assert first is second
+        assert docstring_cache.hits == 1
+
+    def test_parser_is_part_of_the_key(self):
+        """Test that different parsers do not share entries."""
+        docs = "Some docs."
+        assert parse_docstring(docs, Parser.google) is not parse_docstring(docs, Parser.numpy)
+
+    def test_implementations_share_parsed_docstrings(self):
+        """Test that parse_docs goes through the cache."""
+        docs = "Common docs.\n\nReturns:\n    int: A value."
+        assert Implementation("f", {}, docs).docs == Implementation("g", {}, docs).docs
+        assert docstring_cache.stats()["hits"] == 1
+
+    def test_size_is_configurable(self, mock_env):
+        """Test that the size limit is read from mkdocs.yml."""
+        mock_env.variables = {"plumkdocs": {"docstring_cache_size": 3}}
+        define_env(mock_env)
+        assert main.docstring_cache.maxsize == 3
+
+    def test_hit_rate_is_logged(self, mock_env, caplog):
+        """Test that the statistics are logged at the end of the build."""
+        define_env(mock_env)
+        parse_docstring("Docs.")
+        parse_docstring("Docs.")
+        with caplog.at_level(logging.INFO, logger="mkdocs.plugins.plumkdocs"):
+            main.on_post_build(mock_env)
+        assert "1 docstrings parsed, 1 served from cache (hit rate 50%)" in caplog.text
@@ -1,5 +1,8 @@
 """Tests for _extract_implementations function."""
 
+from plum import Function
+
+from plumkdocs import main
 from plumkdocs.main import Implementation, _extract_implementations
 
 
@@ -30,8 +33,8 @@ class TestExtractImplementations:
         """Test that implementations are sorted by signature."""
         implementations = _extract_implementations(plum_function_simple)
 
-        # Extract signatures for comparison
-        signatures = [impl._signature for impl in implementations]
+        # Extract plain text signatures for comparison
+        signatures = [impl._signature_text for impl in implementations]
 
         # Signatures should be sorted (alphabetically)
         assert signatures == sorted(signatures)
@@ -49,6 +52,15 @@ class TestExtractImplementations:
         # All signatures should be unique
         assert len(signatures) == len(set(signatures))
 
+    def test_deduplication_uses_structural_key(self, plum_function_with_defaults):
+        """Test that duplicates are removed without highlighting them."""
+        implementations = _extract_implementations(plum_function_with_defaults)
+
+        keys = [impl.key for impl in implementations]
+        assert len(keys) == len(set(keys))
+        # Only the surviving implementations are highlighted, when rendered
+        assert all("_signature" not in vars(impl) for impl in implementations)
+
     def test_implementation_with_defaults(self, plum_function_with_defaults):
         """Test extracting implementations with default parameters."""
         implementations = _extract_implementations(plum_function_with_defaults)
@@ -99,3 +111,52 @@ class TestExtractImplementations:
         # Check that parameter names are in the params dict
         param_names = list(impl.params.keys())
         assert len(param_names) > 0
+
+    def test_shared_implementation_is_extracted_once(self, monkeypatch):
+        """Test that an implementation registered under many signatures is extracted once."""
+
+        def impl(x: int | float | str):
+            """Docs."""
+            return x
+
+        func = Function(impl)
+        func.dispatch_multi((int,), (float,), (str,))(impl)
+
+        constructed = []
+        original_init = Implementation.__init__
+
+        def counting_init(self, *args):
+            constructed.append(args)
+            original_init(self, *args)
+
+        monkeypatch.setattr(Implementation, "__init__", counting_init)
+        implementations = _extract_implementations(("impl", func))
+
+        assert len(func.methods) == 3
+        assert len(implementations) == 1
+        assert len(constructed) == 1
+
+    def test_default_truncated_methods_are_extracted_once(self, plum_function_with_defaults):
+        """Test that methods generated for default arguments are skipped early."""
+        _, func = plum_function_with_defaults
+        implementations = _extract_implementations(plum_function_with_defaults)
+
+        # plum registers `(x)` and `(x, y)` for the same implementation
+        assert len(func.methods) == 2
+        assert len(implementations) == 1
+
+    def test_docstrings_are_parsed_lazily(self, monkeypatch, plum_function_simple):
+        """Test that extraction does not parse any docstring."""
+        parsed = []
+        original = main.parse_doc
+
+        def counting_parse(docs, params=None):
+            parsed.append(docs)
+            return original(docs, params)
+
+        monkeypatch.setattr(main, "parse_doc", counting_parse)
+        implementations = _extract_implementations(plum_function_simple)
+        assert parsed == []
+
+        assert implementations[0].docs == implementations[0].docs
+        assert len(parsed) == 1
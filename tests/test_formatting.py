@@ -0,0 +1,120 @@
+"""Tests for the rendering of annotations."""
+
+import inspect
+import typing
+
+from plum import parametric
+
+from plumkdocs import main
+from plumkdocs.formatting import TypeFormatter
+from plumkdocs.main import Implementation, define_env
+
+
+@parametric
+class MediumObject:
+    """Parametric class standing in for e.g. `jwave.geometry.MediumObject`."""
+
+
+class OnGrid:
+    """Plain class standing in for e.g. `jaxdf.discretization.OnGrid`."""
+
+
+T = typing.TypeVar("T")
+
+MODULE = __name__
+
+
+class TestTypeFormatter:
+    """Tests for the TypeFormatter class."""
+
+    def test_builtins(self):
+        """Test that builtin classes are rendered by name."""
+        formatter = TypeFormatter()
+        assert formatter.format(int) == "int"
+        assert formatter.format(None) == "None"
+        assert formatter.format(type(None)) == "None"
+
+    def test_qualified_names(self):
+        """Test that other classes keep their module path by default."""
+        assert TypeFormatter().format(OnGrid) == f"{MODULE}.OnGrid"
+
+    def test_unions(self):
+        """Test typing and PEP 604 unions."""
+        formatter = TypeFormatter()
+        assert formatter.format(typing.Union[int, str]) == "Union[int, str]"  # noqa: UP007
+        assert formatter.format(int | str) == "Union[int, str]"
+        assert formatter.format(typing.Optional[int]) == "Union[int, None]"  # noqa: UP045
+
+    def test_generics(self):
+        """Test typing generics."""
+        formatter = TypeFormatter()
+        assert formatter.format(dict[str, list[int]]) == "dict[str, list[int]]"
+        assert formatter.format(typing.Callable[[int], str]) == "Callable[[int], str]"
+        assert formatter.format(tuple[int, ...]) == "tuple[int, ...]"
+        assert formatter.format(typing.Literal["a", 1]) == "Literal['a', 1]"
+        assert formatter.format(typing.Any) == "Any"
+        assert formatter.format(T) == "T"
+
+    def test_plum_parametric_types(self):
+        """Test that concrete parametric types show their type parameters."""
+        formatter = TypeFormatter()
+        assert formatter.format(MediumObject[int, float]) == f"{MODULE}.MediumObject[int, float]"
+
+    def test_aliases(self):
+        """Test that aliases shorten module paths and names."""
+        formatter = TypeFormatter({f"{MODULE}.MediumObject": "Medium", f"{MODULE}.": ""})
+        annotation = typing.Union[  # noqa: UP007
+            MediumObject[object, object, OnGrid], MediumObject[object, OnGrid, object]
+        ]
+        assert (
+            formatter.format(annotation)
+            == "Union[Medium[object, object, OnGrid], Medium[object, OnGrid, object]]"
+        )
+
+    def test_aliases_only_match_whole_prefixes(self):
+        """Test that aliases do not match inside other dotted names."""
+        formatter = TypeFormatter({"geometry.": ""})
+        assert formatter.format("jwave.geometry.Domain") == "jwave.geometry.Domain"
+        assert formatter.format("geometry.Domain") == "Domain"
+
+    def test_string_annotations(self):
+        """Test that forward references go through the aliases."""
+        formatter = TypeFormatter({"jaxdf.core.": ""})
+        assert formatter.format("jaxdf.core.Field") == "Field"
+
+    def test_results_are_memoized(self, monkeypatch):
+        """Test that each annotation is only walked once."""
+        formatter = TypeFormatter()
+        calls = []
+        original = formatter._format
+        monkeypatch.setattr(formatter, "_format", lambda t: calls.append(t) or original(t))
+
+        annotation = list[int]
+        formatter.format(annotation)
+        formatter.format(annotation)
+        assert calls.count(annotation) == 1
+
+    def test_union_order(self):
+        """Test that equal unions keep the order of their own arguments."""
+        formatter = TypeFormatter()
+        assert formatter.format(typing.Union[int, float]) == "Union[int, float]"  # noqa: UP007
+        assert formatter.format(typing.Union[float, int]) == "Union[float, int]"  # noqa: UP007
+        assert formatter.format(float | int) == "Union[float, int]"
+        assert formatter.format(typing.Literal[1, 2]) == "Literal[1, 2]"
+        assert formatter.format(typing.Literal[2, 1]) == "Literal[2, 1]"
+
+
+class TestTypeAliasesOption:
+    """Tests for the type_aliases option."""
+
+    def test_aliases_are_read_from_mkdocs_yml(self, mock_env):
+        """Test that signatures use the configured aliases."""
+        mock_env.variables = {"plumkdocs": {"type_aliases": {f"{MODULE}.": ""}}}
+        define_env(mock_env)
+        assert main.type_formatter.format(OnGrid) == "OnGrid"
+
+        def f(x: OnGrid):
+            pass
+
+        impl = Implementation("f", inspect.signature(f).parameters, "")
+        assert impl._signature_text == "f(x: OnGrid)"
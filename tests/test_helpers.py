@@ -1,113 +1,58 @@
 """Tests for helper functions in plumkdocs.main."""
 
-from plumkdocs.main import get_base_docs, strip_modules, var_to_bold
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
 
+from plumkdocs.highlight import SignatureFormatter, highlight_signature
+from plumkdocs.main import get_base_docs
+from plumkdocs.templates import Templates
 
-class TestVarToBold:
-    """Tests for var_to_bold function."""
+
+def _format_signature(code):
+    return highlight(code, PythonLexer(), SignatureFormatter())
+
+
+class TestSignatureFormatter:
+    """Tests for the SignatureFormatter pygments formatter."""
 
     def test_type_annotation_context(self):
         """Test variable bolding in type annotation context."""
-        input_html = '<span class="n">text</span><span class="p">:</span>'
-        expected = '<span class="n"><strong>text</strong></span><span class="p">:</span>'
-        assert var_to_bold(input_html) == expected
+        result = _format_signature("f(text: int)")
+        assert '<span class="n"><strong>text</strong></span><span class="p">:</span>' in result
 
     def test_assignment_context(self):
         """Test variable bolding in assignment context."""
-        input_html = '<span class="n">value</span> <span class="o">=</span>'
-        expected = '<span class="n"><strong>value</strong></span> <span class="o">=</span>'
-        assert var_to_bold(input_html) == expected
+        result = _format_signature("f(value = 3)")
+        assert '<span class="n"><strong>value</strong></span> <span class="o">=</span>' in result
 
     def test_parameter_list_context(self):
         """Test variable bolding in parameter list context."""
-        input_html = '<span class="n">param</span><span class="p">,</span>'
-        expected = '<span class="n"><strong>param</strong></span><span class="p">,</span>'
-        assert var_to_bold(input_html) == expected
-
-    def test_multiple_variables(self):
-        """Test bolding multiple variables in same string."""
-        input_html = (
-            '<span class="n">a</span><span class="p">:</span> '
-            '<span class="n">b</span> <span class="o">=</span> '
-            '<span class="n">c</span><span class="p">,</span>'
-        )
-        expected = (
-            '<span class="n"><strong>a</strong></span><span class="p">:</span> '
-            '<span class="n"><strong>b</strong></span> <span class="o">=</span> '
-            '<span class="n"><strong>c</strong></span><span class="p">,</span>'
+        result = _format_signature("f(param, other)")
+        assert '<span class="n"><strong>param</strong></span><span class="p">,</span>' in result
+
+    def test_function_name_not_bold(self):
+        """Test that the function name is not made bold."""
+        result = _format_signature("foo(a: int)")
+        assert '<span class="n">foo</span>' in result
+        assert "<strong>foo</strong>" not in result
+
+    def test_heading_structure(self):
+        """Test that the highlighted signature is wrapped in the heading markup."""
+        result = highlight_signature("foo()", Templates())
+        assert result.startswith(
+            '<h3 class="doc doc-heading"><code class="highlight language-python">'
         )
-        assert var_to_bold(input_html) == expected
-
-    def test_no_matching_patterns(self):
-        """Test that non-matching HTML is unchanged."""
-        input_html = '<span class="k">def</span> <span class="nf">foo</span>'
-        assert var_to_bold(input_html) == input_html
-
-    def test_empty_string(self):
-        """Test empty string input."""
-        assert var_to_bold("") == ""
-
-
-class TestStripModules:
-    """Tests for strip_modules function."""
-
-    def test_strip_typing_union(self):
-        """Test stripping typing.Union."""
-        input_str = "typing.Union[int, str]"
-        expected = "Union[int, str]"
-        assert strip_modules(input_str) == expected
-
-    def test_strip_jwave_medium(self):
-        """Test stripping jwave.geometry.MediumObject."""
-        input_str = "jwave.geometry.MediumObject[int, str]"
-        expected = "Medium[int, str]"
-        assert strip_modules(input_str) == expected
-
-    def test_strip_class_tags(self):
-        """Test stripping <class > tags."""
-        input_str = "<class 'int'>"
-        expected = "'int'"
-        assert strip_modules(input_str) == expected
-
-    def test_strip_jaxdf_paths(self):
-        """Test stripping jaxdf module paths."""
-        input_str = "jaxdf.discretization.OnGrid"
-        expected = "OnGrid"
-        assert strip_modules(input_str) == expected
-
-    def test_strip_jwave_paths(self):
-        """Test stripping jwave module paths."""
-        input_str = "jwave.geometry.Domain"
-        expected = "Domain"
-        assert strip_modules(input_str) == expected
-
-    def test_strip_jaxdf_core_paths(self):
-        """Test stripping jaxdf.core module paths."""
-        input_str = "jaxdf.core.Field"
-        expected = "Field"
-        assert strip_modules(input_str) == expected
-
-    def test_complex_nested_type(self):
-        """Test stripping from complex nested type annotation."""
-        input_str = (
-            "typing.Union[jwave.geometry.MediumObject[<class 'object'>, "
-            "<class 'object'>, <class 'jaxdf.discretization.OnGrid'>], "
-            "jwave.geometry.MediumObject[<class 'object'>, "
-            "<class 'jaxdf.discretization.OnGrid'>, <class 'object'>]]"
-        )
-        expected = (
-            "Union[Medium['object', 'object', 'OnGrid'], Medium['object', 'OnGrid', 'object']]"
-        )
-        assert strip_modules(input_str) == expected
-
-    def test_unrecognized_module(self):
-        """Test that unrecognized modules are left unchanged."""
-        input_str = "my.custom.module.Class"
-        assert strip_modules(input_str) == input_str
-
-    def test_empty_string(self):
-        """Test empty string input."""
-        assert strip_modules("") == ""
+        assert result.endswith("</code></h3>")
+        assert "<pre>" not in result
+        assert "<div" not in result
+
+    def test_matches_html_formatter_classes(self):
+        """Test that tokens get the same classes and escaping as HtmlFormatter."""
+        code = "f(a: 'int', b: float = 3.14)"
+        reference = highlight(code, PythonLexer(), HtmlFormatter(nowrap=True)).strip()
+        body = _format_signature(code)
+        assert body.replace("<strong>", "").replace("</strong>", "") == reference
 
 
 class TestGetBaseDocs:
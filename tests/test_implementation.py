@@ -230,3 +230,56 @@ class TestImplementationRepr:
             simple_implementation_params["docs"],
         )
         assert str(impl) == repr(impl)
+
+
+class TestImplementationKey:
+    """Tests for the structural key of implementations."""
+
+    def test_same_signature_same_key(self):
+        """Test that identical signatures have the same key."""
+
+        def f(a: int, b: str = "x"):
+            pass
+
+        params = inspect.signature(f).parameters
+        assert Implementation("f", params, "").key == Implementation("f", params, "").key
+
+    def test_different_annotations_different_key(self):
+        """Test that annotations are part of the key."""
+
+        def f(a: int):
+            pass
+
+        def g(a: float):
+            pass
+
+        key_f = Implementation("f", inspect.signature(f).parameters, "").key
+        key_g = Implementation("f", inspect.signature(g).parameters, "").key
+        assert key_f != key_g
+
+    def test_equal_but_differently_typed_defaults(self):
+        """Test that `1` and `True` defaults are not merged."""
+
+        def f(a=1):
+            pass
+
+        def g(a=True):
+            pass
+
+        key_f = Implementation("f", inspect.signature(f).parameters, "").key
+        key_g = Implementation("f", inspect.signature(g).parameters, "").key
+        assert key_f != key_g
+
+    def test_unhashable_default(self):
+        """Test that unhashable defaults are supported."""
+
+        def f(a=[]):  # noqa: B006
+            pass
+
+        params = inspect.signature(f).parameters
+        assert hash(Implementation("f", params, "").key)
+
+    def test_signature_is_memoized(self):
+        """Test that the highlighted signature is only computed once."""
+        impl = Implementation("func", {}, "")
+        assert impl._signature is impl._signature
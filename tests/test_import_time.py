@@ -0,0 +1,62 @@
+"""Import-time regression checks for the plugin entry points."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for `from plumkdocs import define_env`
+IMPORT_BUDGET_US = int(os.environ.get("PLUMKDOCS_IMPORT_BUDGET_US", 150_000))
+
+HEAVY_MODULES = ["griffe", "plum", "pygments", "markdown", "multiprocessing"]
+
+
+def _run(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=root,
+    )
+
+
+def _cumulative_times(stderr):
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Checks that loading the plugin does not load the rendering dependencies."""
+
+    @pytest.mark.parametrize(
+        "code",
+        ["import plumkdocs", "from plumkdocs import define_env, mod_to_string, on_post_build"],
+    )
+    def test_heavy_dependencies_are_deferred(self, code):
+        """Test that the rendering dependencies are not imported eagerly."""
+        result = _run(f"{code}\nimport sys\nprint(' '.join(sys.modules))")
+        loaded = set(result.stdout.split())
+        assert not [m for m in HEAVY_MODULES if m in loaded]
+
+    def test_import_time_budget(self):
+        """Test the cumulative import time of the plugin entry point."""
+        result = _run("from plumkdocs import define_env")
+        times = _cumulative_times(result.stderr)
+        assert times["plumkdocs.main"] < IMPORT_BUDGET_US
+
+    def test_dependencies_are_loaded_on_first_use(self):
+        """Test that rendering still works once the dependencies are needed."""
+        result = _run(
+            "from plumkdocs import mod_to_string\n"
+            "print(mod_to_string('tests.fixtures.sample_functions', 'simple_func'))"
+        )
+        assert "Concrete implementations:" in result.stdout
@@ -0,0 +1,154 @@
+"""Tests for the incremental rebuilds of mkdocs serve."""
+
+import os
+import sys
+
+import pytest
+
+from plumkdocs import main
+from plumkdocs.main import define_env, mod_to_string, on_post_build
+
+SOURCE = '''
+from plum import Dispatcher
+
+dispatch = Dispatcher()
+
+
+@dispatch.abstract
+def {name}(x):
+    """Base documentation for {name}."""
+
+
+@dispatch
+def {name}(x: int):
+    """{doc}"""
+    return x
+'''
+
+
+@pytest.fixture
+def modules(write_module):
+    """Return a function writing modules importable for the test."""
+
+    def write(module_name, doc, name="f"):
+        return write_module(module_name, SOURCE.format(name=name, doc=doc))
+
+    return write
+
+
+class TestIncrementalRebuilds:
+    """Tests for the incremental option."""
+
+    def test_only_modified_sources_are_rendered_again(self, mock_env, modules):
+        """Test that a rebuild re-renders the fragments of the modified files only."""
+        mock_env.variables = {"plumkdocs": {"incremental": True}}
+        modules("incr_a", "First version.")
+        modules("incr_b", "Unchanged.")
+
+        define_env(mock_env)
+        assert "First version." in mod_to_string("incr_a")
+        mod_to_string("incr_b")
+
+        modules("incr_a", "Second version.")
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 1
+        assert "Second version." in mod_to_string("incr_a")
+        mod_to_string("incr_b")
+        assert (main.build_cache.hits, main.build_cache.misses) == (1, 1)
+
+    def test_unchanged_rebuild_is_served_from_cache(self, mock_env, modules):
+        """Test that a rebuild without modifications renders nothing."""
+        mock_env.variables = {"plumkdocs": {"incremental": True}}
+        modules("incr_c", "Docs.")
+
+        define_env(mock_env)
+        text = mod_to_string("incr_c")
+        define_env(mock_env)
+        assert mod_to_string("incr_c") == text
+        assert main.build_cache.misses == 0
+
+    def test_relative_templates_dir(self, mock_env, modules, tmp_path):
+        """Test that resolving the templates directory does not change the options."""
+        (tmp_path / "templates").mkdir()
+        mock_env.conf = {"config_file_path": str(tmp_path / "mkdocs.yml")}
+        mock_env.variables = {"plumkdocs": {"incremental": True, "templates_dir": "templates"}}
+        modules("incr_h", "Docs.")
+        define_env(mock_env)
+        mod_to_string("incr_h")
+
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 1
+        assert mock_env.variables["plumkdocs"]["templates_dir"] == "templates"
+
+    def test_changed_options_clear_the_cache(self, mock_env, modules):
+        """Test that a modified configuration renders everything again."""
+        mock_env.variables = {"plumkdocs": {"incremental": True}}
+        modules("incr_d", "Docs.")
+        define_env(mock_env)
+        mod_to_string("incr_d")
+
+        mock_env.variables = {"plumkdocs": {"incremental": True, "type_aliases": {"x": "y"}}}
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 0
+
+    def test_global_dispatcher(self, mock_env, write_module):
+        """Test that the methods of the global plum dispatcher are replaced on reload."""
+        source = '''
+            from plum import dispatch
+
+
+            @dispatch.abstract
+            def incr_global(x):
+                """{doc}"""
+
+
+            @dispatch
+            def incr_global(x: {annotation}):
+                return x
+            '''
+        write_module("incr_global_mod", source.format(doc="First version.", annotation="int"))
+        mock_env.variables = {"plumkdocs": {"incremental": True}}
+        define_env(mock_env)
+        text = mod_to_string("incr_global_mod")
+        assert "First version." in text and '"nb">int<' in text
+        function = sys.modules["incr_global_mod"].incr_global
+
+        write_module("incr_global_mod", source.format(doc="Second version.", annotation="float"))
+        define_env(mock_env)
+        text = mod_to_string("incr_global_mod")
+        assert "Second version." in text and '"nb">float<' in text
+        assert '"nb">int<' not in text
+        assert sys.modules["incr_global_mod"].incr_global is function
+        assert function(1.5) == 1.5
+
+    def test_sources_are_watched(self, mock_env, modules):
+        """Test that on_post_build adds the source files to the watched paths."""
+        mock_env.variables = {"plumkdocs": {"incremental": True}}
+        path = modules("incr_e", "Docs.")
+        define_env(mock_env)
+        mod_to_string("incr_e")
+
+        mock_env.conf = {"watch": []}
+        on_post_build(mock_env)
+        assert mock_env.conf["watch"] == [os.path.realpath(path)]
+
+    def test_disabled_by_default(self, mock_env, modules):
+        """Test that every build starts from a clean slate by default."""
+        modules("incr_f", "Docs.")
+        define_env(mock_env)
+        mod_to_string("incr_f")
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 0
+        assert main.tracked_sources() == []
+
+    def test_static_mode(self, mock_env, modules):
+        """Test that the modified sources are parsed again in static mode."""
+        mock_env.variables = {"plumkdocs": {"incremental": True, "static": True}}
+        modules("incr_g", "First version.")
+        define_env(mock_env)
+        assert "First version." in mod_to_string("incr_g")
+
+        modules("incr_g", "Second version.")
+        define_env(mock_env)
+        assert "Second version." in mod_to_string("incr_g")
+        assert "incr_g" not in sys.modules
@@ -0,0 +1,86 @@
+"""Tests for the intermediate representation of the documentation."""
+
+import pickle
+
+import pytest
+
+from plumkdocs import ir, main
+from plumkdocs.main import function_ir, mod_to_string
+
+MODULE = "tests.fixtures.sample_functions"
+
+
+@pytest.fixture
+def simple_ir(plum_function_simple):
+    """Return the IR of the simple_func fixture."""
+    return function_ir(plum_function_simple)
+
+
+class TestNodes:
+    """Tests for the IR nodes."""
+
+    def test_slots(self):
+        """Test that nodes have no instance dictionary."""
+        param = ir.Param("x", "int", "The value.", None)
+        assert not hasattr(param, "__dict__")
+        with pytest.raises(AttributeError):
+            param.other = 1
+
+    def test_value_semantics(self):
+        """Test that nodes compare and hash by value."""
+        a = ir.Doc("Text.", [ir.Param("x", "", "", "1")], [])
+        b = ir.Doc("Text.", [ir.Param("x", "", "", "1")], [])
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != ir.Doc("Other.", [], [])
+
+    def test_unexpected_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(TypeError):
+            ir.Return("int", "", other=1)
+
+    def test_pickle(self, simple_ir):
+        """Test that nodes can be sent to other processes."""
+        assert pickle.loads(pickle.dumps(simple_ir)) == simple_ir
+
+
+class TestJson:
+    """Tests for the JSON serialization."""
+
+    def test_round_trip(self, simple_ir):
+        """Test that the JSON gives back the same node."""
+        assert ir.from_json(ir.to_json(simple_ir)) == simple_ir
+
+    def test_stable(self, plum_function_simple, simple_ir):
+        """Test that the same function always gives the same text."""
+        assert ir.to_json(function_ir(plum_function_simple)) == ir.to_json(simple_ir)
+
+    def test_nested_nodes(self):
+        """Test reading a node of another type."""
+        doc = ir.Doc("Text.", [], [ir.Return("int", "The result.")])
+        assert ir.from_json(ir.to_json(doc), ir.Doc) == doc
+
+
+class TestFunctionIr:
+    """Tests for the IR built from plum functions."""
+
+    def test_overloads(self, simple_ir):
+        """Test that the overloads are deduplicated and sorted by signature."""
+        assert simple_ir.name == "simple_func"
+        assert [o.signature for o in simple_ir.overloads] == [
+            "simple_func(a: int, b: int)",
+            "simple_func(a: str, b: str)",
+        ]
+        assert "Base documentation for simple_func" in simple_ir.doc.text
+
+    def test_params_and_returns(self, plum_function_with_defaults):
+        """Test that the tables hold the Markdown descriptions and the defaults."""
+        (overload,) = function_ir(plum_function_with_defaults).overloads
+        params = {p.name: p for p in overload.doc.params}
+        assert params["x"].default is None
+        assert params["y"].default == "10"
+        assert overload.doc.returns
+
+    def test_renderer_matches_macro(self, simple_ir):
+        """Test that rendering the IR gives the fragment of the macro."""
+        assert main.renderer.render_function(simple_ir) == mod_to_string(MODULE, "simple_func")
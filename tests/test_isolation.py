@@ -0,0 +1,173 @@
+"""Tests for the introspection of modules in worker processes."""
+
+import pickle
+import sys
+import threading
+
+import pytest
+
+from plumkdocs import isolation, main
+from plumkdocs.isolation import IsolationPool, describe, portable
+from plumkdocs.main import _extract_implementations, define_env, mod_to_string
+
+MODULE = "tests.fixtures.sample_functions"
+
+SOURCE = '''
+from plum import dispatch
+
+
+@dispatch.abstract
+def isolated(x):
+    """Base documentation for isolated."""
+
+
+@dispatch
+def isolated(x: int, y: float = 1.5):
+    """Isolated implementation."""
+    return x
+'''
+
+
+@pytest.fixture
+def pool():
+    """Return an isolation pool, shut down after the test."""
+    pool = IsolationPool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def isolated_module(write_module):
+    """Write a module which is only importable from the test directory."""
+    write_module("plumkdocs_isolated", SOURCE)
+    return "plumkdocs_isolated"
+
+
+class TestPortable:
+    """Tests for the picklable copies of implementations."""
+
+    def test_payload_is_picklable(self, plum_function_with_defaults):
+        """Test that payloads survive a pickle roundtrip."""
+        implementation = _extract_implementations(plum_function_with_defaults)[0]
+        payload = portable(implementation)
+        assert pickle.loads(pickle.dumps(payload)) == payload
+
+
+class TestDescribe:
+    """Tests for the description sent back by the workers."""
+
+    def test_description_is_rendered_like_the_imported_module(self):
+        """Test that rendering the description gives the fragment of the module."""
+        expected = mod_to_string(MODULE, "simple_func")
+        main.build_cache.clear()
+
+        pool = IsolationPool()
+        description = dict(describe(MODULE))
+        pool._modules[MODULE] = {
+            name: main._isolation.IsolatedFunction(name, d) for name, d in description.items()
+        }
+        main.isolation_pool = pool
+        assert mod_to_string(MODULE, "simple_func") == expected
+
+
+class TestPeakRss:
+    """Tests for the peak memory of the workers."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="no resource module")
+    @pytest.mark.parametrize(("platform", "factor"), [("linux", 1024), ("darwin", 1)])
+    def test_units(self, monkeypatch, platform, factor):
+        """Test that ru_maxrss is read in KiB, except on macOS where it is in bytes."""
+        import resource
+
+        class Usage:
+            ru_maxrss = 1000
+
+        monkeypatch.setattr(resource, "getrusage", lambda who: Usage)
+        monkeypatch.setattr(sys, "platform", platform)
+        assert isolation._peak_rss() == 1000 * factor
+
+
+class TestIsolationPool:
+    """Tests for the IsolationPool class."""
+
+    def test_module_is_not_imported(self, pool, isolated_module):
+        """Test that the module is introspected without importing it here."""
+        functions = pool.describe(isolated_module)
+        assert list(functions) == ["isolated"]
+        assert isolated_module not in sys.modules
+
+        (implementation,) = functions["isolated"].methods
+        assert implementation._signature_text == "isolated(x: int, y: float = 1.5)"
+
+    def test_modules_are_described_once(self, pool, isolated_module):
+        """Test that a module is only sent to the workers once."""
+        first = pool.describe(isolated_module)
+        assert pool.describe(isolated_module) is first
+        assert sum(w.requests for w in pool._all) == 1
+
+    def test_errors_are_raised(self, pool):
+        """Test that the exceptions of the workers are raised in the caller."""
+        with pytest.raises(ModuleNotFoundError):
+            pool.describe("nonexistent.module")
+        # The worker is still usable
+        assert "simple_func" in pool.describe(MODULE)
+
+    def test_recycling_by_requests(self, isolated_module):
+        """Test that workers are replaced after the maximum number of requests."""
+        pool = IsolationPool(max_requests=1)
+        try:
+            pool.describe(isolated_module)
+            assert pool._all == []
+            pool.describe(MODULE)
+            assert pool._all == []
+        finally:
+            pool.shutdown()
+
+    def test_waiting_callers_get_recycled_workers(self, isolated_module):
+        """Test that a caller waiting for a busy worker is served once it is recycled."""
+        pool = IsolationPool(workers=1, max_requests=1)
+        results = {}
+
+        def describe(module_name):
+            results[module_name] = pool.describe(module_name)
+
+        threads = [threading.Thread(target=describe, args=(m,)) for m in (isolated_module, MODULE)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=60)
+            assert not any(thread.is_alive() for thread in threads)
+            assert set(results) == {isolated_module, MODULE}
+        finally:
+            pool.shutdown()
+
+    def test_killed_worker_is_replaced(self, pool, isolated_module):
+        """Test that a worker killed between requests is replaced by a fresh one."""
+        pool.describe(isolated_module)
+        (worker,) = pool._all
+        worker.process.kill()
+        worker.process.join()
+
+        assert "simple_func" in pool.describe(MODULE)
+        assert worker not in pool._all
+        assert "simple_func" in pool.describe(MODULE)
+
+    def test_recycling_by_memory(self, isolated_module):
+        """Test that workers are replaced once they exceed the memory limit."""
+        pool = IsolationPool(max_memory=1)
+        try:
+            pool.describe(isolated_module)
+            assert pool._all == []
+        finally:
+            pool.shutdown()
+
+    def test_enabled_from_mkdocs_yml(self, mock_env, isolated_module):
+        """Test that the macro renders isolated modules when enabled."""
+        mock_env.variables = {"plumkdocs": {"isolation": True}}
+        define_env(mock_env)
+        assert isinstance(main.isolation_pool, IsolationPool)
+
+        text = mock_env.macros["implementations"](isolated_module)
+        assert "Isolated implementation." in text
+        assert isolated_module not in sys.modules
@@ -0,0 +1,114 @@
+"""Tests for the memory accounting of the build."""
+
+import json
+import logging
+import tracemalloc
+
+from plumkdocs import memory
+from plumkdocs.main import define_env, on_post_build
+from plumkdocs.memory import MemoryTracker, measure
+
+MODULE = "tests.fixtures.sample_functions"
+
+
+class TestMemoryTracker:
+    """Tests for the MemoryTracker class."""
+
+    def test_disabled_by_default(self):
+        """Test that measures do nothing without a tracker."""
+        assert memory.tracker is None
+        assert measure("m", None, "import") is measure("m", "f", "render")
+
+    def test_measure(self, monkeypatch):
+        """Test that the peak and retained allocations of a stage are recorded."""
+        tracker = MemoryTracker()
+        monkeypatch.setattr(memory, "tracker", tracker)
+        try:
+            with measure("m", "f", "render"):
+                temporary = bytearray(1_000_000)
+                del temporary
+                kept = bytearray(100_000)
+        finally:
+            tracker.stop()
+
+        entry = tracker.records[("m", "f")]["render"]
+        assert entry["calls"] == 1
+        assert entry["peak"] >= 900_000
+        assert 100_000 <= entry["retained"] < 1_000_000
+        assert len(kept) == 100_000
+
+    def test_stop(self):
+        """Test that tracemalloc is only stopped if the tracker started it."""
+        tracker = MemoryTracker()
+        assert tracemalloc.is_tracing()
+        tracker.stop()
+        assert not tracemalloc.is_tracing()
+
+        tracemalloc.start()
+        try:
+            MemoryTracker().stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_report(self):
+        """Test that the report is grouped by module and sorted by retained memory."""
+        tracker = MemoryTracker()
+        tracker.stop()
+        tracker.record(("a", None), "import", 10, 5)
+        tracker.record(("a", None), "render", 30, 20)
+        tracker.record(("b", None), "import", 100, 50)
+        tracker.record(("b", "f"), "render", 40, 10)
+        tracker.record(("b", "f"), "render", 20, 10)
+
+        report = tracker.report()
+        assert report["unit"] == "bytes"
+        assert list(report["modules"]) == ["b", "a"]
+        assert report["modules"]["b"] == {
+            "import": {"peak": 100, "retained": 50, "calls": 1},
+            "functions": {"f": {"peak": 40, "retained": 20, "calls": 2}},
+        }
+        assert report["modules"]["a"]["functions"] == {
+            "*": {"peak": 30, "retained": 20, "calls": 1}
+        }
+
+
+class TestMemoryReportOption:
+    """Tests for the memory_report option."""
+
+    def test_build_is_measured(self, mock_env, tmp_path, caplog):
+        """Test that the import and rendering of the macros are reported."""
+        mock_env.conf = {"site_dir": str(tmp_path / "site")}
+        mock_env.variables = {"plumkdocs": {"memory_report": True}}
+        define_env(mock_env)
+        mock_env.macros["implementations"](MODULE, "simple_func")
+
+        with caplog.at_level(logging.INFO, logger="mkdocs.plugins.plumkdocs"):
+            on_post_build(mock_env)
+
+        report = json.loads((tmp_path / "plumkdocs-memory.json").read_text())
+        entry = report["modules"][MODULE]
+        assert entry["import"]["calls"] == 1
+        assert entry["functions"]["simple_func"]["peak"] > 0
+        assert MODULE in caplog.text
+        assert memory.tracker is None
+
+    def test_package_is_measured(self, mock_env, tmp_path):
+        """Test that rendering a whole package is reported under the package."""
+        path = tmp_path / "memory.json"
+        mock_env.variables = {"plumkdocs": {"memory_report": True, "memory_file": str(path)}}
+        define_env(mock_env)
+        mock_env.macros["package_implementations"]("tests.fixtures")
+        on_post_build(mock_env)
+
+        modules = json.loads(path.read_text())["modules"]
+        assert modules["tests.fixtures"]["functions"]["*"]["calls"] == 1
+        assert modules[MODULE]["import"]["calls"] == 1
+
+    def test_memory_file(self, mock_env, tmp_path):
+        """Test that the report is written to the configured file."""
+        path = tmp_path / "memory.json"
+        mock_env.variables = {"plumkdocs": {"memory_report": True, "memory_file": str(path)}}
+        define_env(mock_env)
+        on_post_build(mock_env)
+        assert json.loads(path.read_text()) == {"unit": "bytes", "modules": {}}
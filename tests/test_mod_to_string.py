@@ -1,6 +1,9 @@
 """Tests for mod_to_string function."""
 
-from plumkdocs.main import mod_to_string
+from plumkdocs import main
+from plumkdocs.main import mod_to_string, mod_to_strings
+
+MODULE = "tests.fixtures.sample_functions"
 
 
 class TestModToString:
@@ -106,3 +109,54 @@ class TestModToString:
 
         # Should still return a string (possibly with just HR or empty content)
         assert isinstance(result, str)
+
+
+class TestModToStrings:
+    """Tests for mod_to_strings function."""
+
+    def test_fragments_match_single_calls(self):
+        """Test that each fragment is the one rendered by mod_to_string."""
+        fragments = mod_to_strings(MODULE, ["simple_func", "func_no_docs"])
+        assert list(fragments) == ["simple_func", "func_no_docs"]
+        main.build_cache.clear()
+        for name, text in fragments.items():
+            assert text == mod_to_string(MODULE, name)
+
+    def test_all_functions_when_no_filter(self):
+        """Test that every plum function is rendered without names or pattern."""
+        fragments = mod_to_strings(MODULE)
+        assert list(fragments) == sorted(fragments)
+        assert {"simple_func", "func_with_defaults", "func_markdown_docs"} <= set(fragments)
+
+    def test_pattern(self):
+        """Test selecting functions with a regular expression."""
+        fragments = mod_to_strings(MODULE, pattern="^func_with_")
+        assert list(fragments) == ["func_with_defaults", "func_with_kwonly"]
+
+    def test_missing_function(self):
+        """Test that unknown names render as a horizontal line."""
+        assert mod_to_strings(MODULE, ["nonexistent_function"]) == {"nonexistent_function": "<hr>"}
+
+    def test_single_pass(self, monkeypatch):
+        """Test that the module is resolved once and rendered in one batch."""
+        resolved = []
+        batches = []
+        resolve = main._resolve_operators
+        render = main._render_functions
+        monkeypatch.setattr(
+            main, "_resolve_operators", lambda *args: resolved.append(args) or resolve(*args)
+        )
+        monkeypatch.setattr(
+            main, "_render_functions", lambda ops: batches.append(len(ops)) or render(ops)
+        )
+
+        mod_to_strings(MODULE, ["simple_func", "func_no_docs", "func_with_kwonly"])
+        assert resolved == [(MODULE,)]
+        assert batches == [3]
+
+    def test_uses_build_cache(self):
+        """Test that fragments rendered earlier in the build are reused."""
+        mod_to_string(MODULE, "simple_func")
+        hits = main.build_cache.hits
+        mod_to_strings(MODULE, ["simple_func"])
+        assert main.build_cache.hits == hits + 1
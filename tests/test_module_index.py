@@ -0,0 +1,84 @@
+"""Tests for the per-module index of plum functions."""
+
+import types
+
+from plum import Function
+
+from plumkdocs.main import _find_operators, invalidate_module_index, module_index
+
+
+def _make_module(name, **members):
+    mod = types.ModuleType(name)
+    vars(mod).update(members)
+    return mod
+
+
+def _make_function(name):
+    def impl(x: int):
+        return x
+
+    impl.__name__ = name
+    return Function(impl)
+
+
+class TestModuleIndex:
+    """Tests for module_index."""
+
+    def test_only_plum_functions_are_indexed(self):
+        """Test that non-plum members are skipped."""
+        f = _make_function("f")
+        mod = _make_module("index_only_plum", f=f, g=lambda x: x, value=3)
+        assert module_index(mod) == {"f": f}
+
+    def test_index_is_sorted_by_name(self):
+        """Test that the index is ordered by name."""
+        mod = _make_module("index_sorted", b=_make_function("b"), a=_make_function("a"))
+        assert list(module_index(mod)) == ["a", "b"]
+
+    def test_index_is_reused(self):
+        """Test that the index is only built once for an unchanged module."""
+        mod = _make_module("index_reused", f=_make_function("f"))
+        assert module_index(mod) is module_index(mod)
+
+    def test_new_names_rebuild_the_index(self):
+        """Test that adding members invalidates the index."""
+        mod = _make_module("index_new_names", f=_make_function("f"))
+        module_index(mod)
+        mod.g = _make_function("g")
+        assert list(module_index(mod)) == ["f", "g"]
+
+    def test_explicit_invalidation(self):
+        """Test that invalidate_module_index forces a rebuild."""
+        mod = _make_module("index_invalidation", f=_make_function("f"))
+        first = module_index(mod)
+        invalidate_module_index("index_invalidation")
+        assert module_index(mod) is not first
+
+
+class TestFindOperators:
+    """Tests for _find_operators."""
+
+    def test_single_function_lookup(self):
+        """Test looking up a single function by name."""
+        f = _make_function("f")
+        mod = _make_module("find_single", f=f, g=_make_function("g"))
+        assert _find_operators(mod, "f") == [("f", f)]
+
+    def test_missing_function(self):
+        """Test that missing functions give no operators."""
+        mod = _make_module("find_missing", f=_make_function("f"))
+        assert _find_operators(mod, "nope") == []
+
+    def test_rebound_name_is_detected(self):
+        """Test that rebinding a name in place is picked up."""
+        mod = _make_module("find_rebound", f=_make_function("f"))
+        _find_operators(mod, "f")
+        new_f = _make_function("f")
+        mod.f = new_f
+        assert _find_operators(mod, "f") == [("f", new_f)]
+
+    def test_all_functions(self):
+        """Test listing every function of a module."""
+        f, g = _make_function("f"), _make_function("g")
+        mod = _make_module("find_all", g=g, f=f)
+        assert _find_operators(mod) == [("f", f), ("g", g)]
@@ -0,0 +1,69 @@
+"""Tests for parallel rendering in a process pool."""
+
+import pickle
+
+from plumkdocs import main, parallel
+from plumkdocs.main import _extract_implementations, define_env, mod_to_string
+from plumkdocs.parallel import RenderPool, from_options
+
+
+class TestWorkerRendering:
+    """Tests for the rendering of the IR sent to the workers."""
+
+    def test_rendering_matches_implementation(self, plum_function_with_defaults, monkeypatch):
+        """Test that rendering a pickled overload gives the same HTML."""
+        implementation = _extract_implementations(plum_function_with_defaults)[0]
+        overload = pickle.loads(pickle.dumps(implementation.ir))
+        monkeypatch.setattr(parallel, "_renderer", main.renderer)
+        assert parallel._render(overload) == str(implementation)
+
+    def test_rendering_matches_for_every_fixture(self, monkeypatch):
+        """Test that the overloads render identically for all the fixtures."""
+        from tests.fixtures import sample_functions
+
+        monkeypatch.setattr(parallel, "_renderer", main.renderer)
+        for name in ["simple_func", "func_with_kwonly", "func_markdown_docs", "func_no_docs"]:
+            plum_func = (name, getattr(sample_functions, name))
+            for implementation in _extract_implementations(plum_func):
+                overload = pickle.loads(pickle.dumps(implementation.ir))
+                assert parallel._render(overload) == str(implementation)
+
+    def test_worker_renderer_from_options(self, tmp_path, monkeypatch):
+        """Test that the workers build their renderer from the options."""
+        (tmp_path / "overload.html").write_text("<div>{{ signature }}</div>")
+        monkeypatch.setattr(parallel, "_renderer", None)
+        parallel._init_worker({"templates_dir": str(tmp_path)})
+        assert parallel._renderer.templates.directory == str(tmp_path)
+
+
+class TestRenderPool:
+    """Tests for the RenderPool class."""
+
+    def test_disabled_by_default(self):
+        """Test that no pool is created without configuration."""
+        assert from_options({}) is None
+        assert from_options({"workers": 1}) is None
+
+    def test_from_options(self):
+        """Test configuration from the mkdocs.yml options."""
+        pool = from_options({"workers": 3})
+        assert isinstance(pool, RenderPool)
+        assert pool.workers == 3
+
+    def test_parallel_output_matches_sequential(self, mock_env):
+        """Test that the pool renders the same output, in the same order."""
+        define_env(mock_env)
+        sequential = mod_to_string("tests.fixtures.sample_functions")
+
+        mock_env.variables = {"plumkdocs": {"workers": 2}}
+        define_env(mock_env)
+        assert main.render_pool is not None
+        parallel = mod_to_string("tests.fixtures.sample_functions")
+
+        assert parallel == sequential
+
+    def test_shutdown_is_idempotent(self):
+        """Test that shutting down an unused pool is a no-op."""
+        pool = RenderPool(2)
+        pool.shutdown()
+        pool.shutdown()
@@ -0,0 +1,111 @@
+"""Tests for the prefetch of the fragments requested in the docs."""
+
+from plumkdocs import main
+from plumkdocs.main import define_env, mod_to_string, mod_to_strings
+from plumkdocs.prefetch import find_calls, prefetch, scan_docs
+
+MODULE = "tests.fixtures.sample_functions"
+
+
+class TestFindCalls:
+    """Tests for the discovery of the macro calls."""
+
+    def test_single_function(self):
+        """Test positional and keyword arguments of the implementations macro."""
+        text = f"""
+        {{{{ implementations('{MODULE}', 'simple_func') }}}}
+        {{{{ implementations("{MODULE}", function="func_no_docs") }}}}
+        {{{{implementations('{MODULE}')}}}}
+        """
+        assert find_calls(text) == {
+            (MODULE, "simple_func"),
+            (MODULE, "func_no_docs"),
+            (MODULE, None),
+        }
+
+    def test_batches(self):
+        """Test calls rendering several functions."""
+        text = f"""
+        {{{{ implementations('{MODULE}', functions=['simple_func', 'func_no_docs']) }}}}
+        {{% set api = implementation_fragments('{MODULE}', pattern='^func_') %}}
+        """
+        assert find_calls(text) == {
+            (MODULE, ("simple_func", "func_no_docs"), None),
+            (MODULE, None, "^func_"),
+        }
+
+    def test_packages(self):
+        """Test calls rendering whole packages."""
+        text = """
+        {{ package_implementations('pkg') }}
+        {{ package_implementations('pkg', exclude=['pkg.tests']) }}
+        """
+        assert find_calls(text) == {
+            ("pkg", None, None, "package"),
+            ("pkg", None, ("pkg.tests",), "package"),
+        }
+
+    def test_non_literal_arguments_are_skipped(self):
+        """Test that calls depending on page variables are left to the page."""
+        text = "{{ implementations(page.meta.module) }} {{ implementations(module, 'f') }}"
+        assert find_calls(text) == set()
+
+    def test_parentheses_in_arguments(self):
+        """Test that the end of the call is found past parentheses in strings."""
+        text = f"{{{{ implementations('{MODULE}', pattern='^(simple|other)_') }}}}"
+        assert find_calls(text) == {(MODULE, None, "^(simple|other)_")}
+
+    def test_unterminated_call(self):
+        """Test that an unterminated call is ignored."""
+        assert find_calls("{{ implementations('mod', ") == set()
+
+
+class TestPrefetch:
+    """Tests for the prefetch stage."""
+
+    def test_scan_docs(self, tmp_path):
+        """Test that the calls of every Markdown file are collected once."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.md").write_text(f"{{{{ implementations('{MODULE}', 'simple_func') }}}}")
+        (tmp_path / "sub" / "b.md").write_text(
+            f"{{{{ implementations('{MODULE}', 'simple_func') }}}}"
+        )
+        (tmp_path / "c.txt").write_text(f"{{{{ implementations('{MODULE}') }}}}")
+        assert scan_docs(tmp_path) == [(MODULE, "simple_func")]
+
+    def test_pages_are_served_from_cache(self, tmp_path):
+        """Test that the macros of the pages hit the fragments rendered ahead."""
+        (tmp_path / "index.md").write_text(
+            f"{{{{ implementations('{MODULE}', 'simple_func') }}}}\n"
+            f"{{{{ implementations('{MODULE}', functions=['func_no_docs']) }}}}"
+        )
+        assert prefetch(tmp_path, workers=2) == 2
+        misses = main.build_cache.misses
+
+        mod_to_string(MODULE, "simple_func")
+        mod_to_strings(MODULE, ["func_no_docs"])
+        assert main.build_cache.misses == misses
+        assert main.build_cache.hits == 2
+
+    def test_failures_are_left_to_the_pages(self, tmp_path):
+        """Test that a failing request does not stop the prefetch."""
+        (tmp_path / "index.md").write_text(
+            "{{ implementations('nonexistent.module') }}\n"
+            f"{{{{ implementations('{MODULE}', 'simple_func') }}}}"
+        )
+        assert prefetch(tmp_path) == 1
+
+    def test_enabled_from_mkdocs_yml(self, mock_env, tmp_path):
+        """Test that define_env runs the prefetch when enabled."""
+        (tmp_path / "index.md").write_text(f"{{{{ implementations('{MODULE}', 'simple_func') }}}}")
+        mock_env.conf = {"docs_dir": str(tmp_path)}
+        mock_env.variables = {"plumkdocs": {"prefetch": True}}
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 1
+
+    def test_disabled_by_default(self, mock_env, tmp_path):
+        """Test that nothing is rendered ahead by default."""
+        (tmp_path / "index.md").write_text(f"{{{{ implementations('{MODULE}', 'simple_func') }}}}")
+        mock_env.conf = {"docs_dir": str(tmp_path)}
+        define_env(mock_env)
+        assert main.build_cache.stats()["entries"] == 0
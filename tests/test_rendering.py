@@ -0,0 +1,108 @@
+"""Tests for the markdown rendering context."""
+
+import inspect
+import threading
+
+from markdown import markdown
+
+from plumkdocs import main
+from plumkdocs.rendering import RenderContext, from_options
+
+
+class TestRenderContext:
+    """Tests for the RenderContext class."""
+
+    def test_convert_matches_markdown(self):
+        """Test that conversions match the markdown function."""
+        context = RenderContext()
+        text = "Some *emphasis* and `code`."
+        assert context.convert(text) == markdown(text)
+
+    def test_converter_is_reused(self):
+        """Test that the same converter is used across conversions."""
+        context = RenderContext()
+        context.convert("a")
+        converter = context.converter
+        context.convert("b")
+        assert context.converter is converter
+
+    def test_converter_is_per_thread(self):
+        """Test that each thread gets its own converter."""
+        context = RenderContext()
+        converters = []
+        thread = threading.Thread(target=lambda: converters.append(context.converter))
+        thread.start()
+        thread.join()
+        assert converters[0] is not context.converter
+
+    def test_convert_many_matches_individual_conversions(self):
+        """Test that batched conversions give the same output."""
+        context = RenderContext()
+        texts = ["First *one*.", "A list:\n\n- a\n- b", "Two\n\nparagraphs."]
+        assert context.convert_many(texts) == [markdown(t) for t in texts]
+
+    def test_convert_many_falls_back_on_unbalanced_snippets(self):
+        """Test the fallback when a snippet swallows the separator."""
+        context = RenderContext(extensions=["fenced_code"])
+        texts = ["```\nunclosed", "Second."]
+        assert context.convert_many(texts) == [context.convert(t) for t in texts]
+
+    def test_convert_many_with_document_extensions(self):
+        """Test that snippets are converted separately with document-level extensions."""
+        context = RenderContext(extensions=["footnotes"])
+        texts = ["First[^1].\n\n[^1]: The note.", "Second."]
+        converted = context.convert_many(texts)
+        assert converted == [context.convert(t) for t in texts]
+        assert "The note." not in converted[1]
+        assert not context.batchable
+        assert RenderContext(extensions=["markdown.extensions.tables", "fenced_code"]).batchable
+
+    def test_convert_many_single_and_empty(self):
+        """Test the trivial batch sizes."""
+        context = RenderContext()
+        assert context.convert_many([]) == []
+        assert context.convert_many(["x"]) == [markdown("x")]
+
+    def test_extensions(self):
+        """Test that configured extensions are used."""
+        context = RenderContext(extensions=["tables"])
+        html = context.convert("| a |\n|---|\n| b |")
+        assert "<table>" in html
+
+    def test_from_options(self):
+        """Test configuration from the mkdocs.yml options."""
+        context = from_options({"markdown_extensions": ["tables"]})
+        assert context.extensions == ["tables"]
+        assert context.fingerprint != RenderContext().fingerprint
+
+
+class TestParseDocsRendering:
+    """Tests for the use of the rendering context in parse_docs."""
+
+    def test_single_conversion_per_docstring(self, monkeypatch):
+        """Test that all descriptions are rendered in a single conversion."""
+        calls = []
+        original = RenderContext.convert
+
+        def counting_convert(self, text):
+            calls.append(text)
+            return original(self, text)
+
+        monkeypatch.setattr(RenderContext, "convert", counting_convert)
+        docs = """Description.
+
+        Args:
+            a (int): First *parameter*.
+            b (int): Second parameter.
+
+        Returns:
+            int: The result.
+        """
+
+        def f(a: int, b: int):
+            pass
+
+        impl = main.Implementation("f", inspect.signature(f).parameters, docs)
+        assert "<em>parameter</em>" in impl.docs
+        assert "The result." in impl.docs
+        assert len(calls) == 1
@@ -0,0 +1,137 @@
+"""Tests for the static-analysis mode."""
+
+import sys
+
+import pytest
+
+from plumkdocs import main, static
+from plumkdocs.main import define_env, mod_to_string
+
+STATIC_SOURCE = '''
+from plum import dispatch
+
+
+@dispatch.abstract
+def area(shape):
+    """Area of a shape."""
+
+
+@dispatch
+def area(side: float, *, scale: float = 1.0):
+    """Area of a square.
+
+    Args:
+        side (float): Side length.
+        scale (float): Scale factor.
+    """
+    return scale * side**2
+
+
+@dispatch
+def area(width: float, height: float, unit: str = "m"):
+    """Area of a rectangle."""
+    return width * height
+
+
+@dispatch.multi((int,), (str,))
+def generated(x):
+    """Generated at runtime."""
+    return x
+
+
+def helper(x):
+    return x
+'''
+
+
+@pytest.fixture
+def static_module(write_module):
+    """Write a module with plum functions to a temporary search path."""
+    write_module("static_pkg.shapes", STATIC_SOURCE)
+    return "static_pkg.shapes"
+
+
+class TestFindModuleFile:
+    """Tests for find_module_file."""
+
+    def test_submodule(self, static_module, tmp_path):
+        """Test locating a submodule of a package."""
+        assert static.find_module_file(static_module) == tmp_path / "static_pkg" / "shapes.py"
+
+    def test_package(self, static_module, tmp_path):
+        """Test locating a package."""
+        assert static.find_module_file("static_pkg") == tmp_path / "static_pkg" / "__init__.py"
+
+    def test_missing(self):
+        """Test that missing modules are not found."""
+        assert static.find_module_file("surely_not_a_module_name") is None
+        assert static.find_module_file("tests.no_such_module") is None
+
+
+class TestLoadFunctions:
+    """Tests for load_functions."""
+
+    def test_overloads_are_collected(self, static_module):
+        """Test that every overload is found, in definition order."""
+        functions = static.load_functions(static_module)
+        assert list(functions) == ["area", "generated"]
+
+        area = functions["area"]
+        assert area._doc == "Area of a shape."
+        assert [m.raw_docs.splitlines()[0] for m in area.methods] == [
+            "Area of a square.",
+            "Area of a rectangle.",
+        ]
+
+    def test_parameters(self, static_module):
+        """Test that kinds, annotations and defaults are read from the source."""
+        area = static.load_functions(static_module)["area"]
+        params = area.methods[0].params
+        assert params["side"].annotation == "float"
+        assert params["scale"].kind == params["scale"].KEYWORD_ONLY
+        assert params["scale"].default == 1.0
+        assert area.methods[1].params["unit"].default == "m"
+
+    def test_module_is_not_imported(self, static_module):
+        """Test that the module is never imported."""
+        static.load_functions(static_module)
+        assert static_module not in sys.modules
+
+    def test_dynamic_methods_are_flagged(self, static_module):
+        """Test that `dispatch.multi` functions are marked as dynamic."""
+        functions = static.load_functions(static_module)
+        assert functions["generated"].dynamic
+        assert not functions["area"].dynamic
+
+
+class TestStaticModToString:
+    """Tests for mod_to_string in static mode."""
+
+    def test_renders_without_importing(self, static_module, mock_env):
+        """Test rendering a function without importing its module."""
+        mock_env.variables = {"plumkdocs": {"static": True}}
+        define_env(mock_env)
+
+        result = mod_to_string(static_module, "area")
+        assert static_module not in sys.modules
+        assert "Area of a shape." in result
+        assert "Area of a square." in result
+        assert "Area of a rectangle." in result
+        assert "<strong>side</strong>" in result
+
+    def test_dynamic_functions_fall_back_to_import(self, static_module, mock_env):
+        """Test that runtime generated methods are documented by importing."""
+        mock_env.variables = {"plumkdocs": {"static": True}}
+        define_env(mock_env)
+
+        result = mod_to_string(static_module, "generated")
+        assert static_module in sys.modules
+        assert "Generated at runtime." in result
+
+    def test_matches_import_mode(self):
+        """Test that both modes render the same documentation for the fixtures."""
+        imported = mod_to_string("tests.fixtures.sample_functions")
+
+        main.static_mode = True
+        main.build_cache.clear()
+        assert mod_to_string("tests.fixtures.sample_functions") == imported
@@ -0,0 +1,87 @@
+"""Tests for the memory-mapped fragment store."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from plumkdocs.store import FragmentStore, write
+
+
+@pytest.fixture
+def entries():
+    """Fragments with keys out of order and non-ASCII text."""
+    return {
+        "pkg.mod:g": "<p>g</p>",
+        "pkg.mod:": "<p>module</p>",
+        "pkg.other:f": "<p>f → ℝ</p>",
+        "pkg.mod:f": "",
+    }
+
+
+class TestFragmentStore:
+    """Tests for the FragmentStore class."""
+
+    def test_round_trip(self, tmp_path, entries):
+        """Test that every entry is read back, with the metadata."""
+        path = tmp_path / "store.bin"
+        write(path, entries, {"context": "abc"})
+
+        with FragmentStore(path) as store:
+            assert len(store) == len(entries)
+            assert store.metadata == {"context": "abc"}
+            for key, text in entries.items():
+                assert key in store
+                assert store.get(key) == text
+
+    def test_keys_are_sorted(self, tmp_path, entries):
+        """Test that the index is sorted by key."""
+        path = tmp_path / "store.bin"
+        write(path, entries)
+        with FragmentStore(path) as store:
+            assert list(store.keys()) == sorted(entries)
+
+    def test_missing_keys(self, tmp_path, entries):
+        """Test that keys around and between the stored ones are not found."""
+        path = tmp_path / "store.bin"
+        write(path, entries)
+        with FragmentStore(path) as store:
+            for key in ("", "a", "pkg.mod", "pkg.mod:e", "pkg.mod:ff", "z"):
+                assert key not in store
+                assert store.get(key, "default") == "default"
+
+    def test_empty_store(self, tmp_path):
+        """Test that a store without entries can be read."""
+        path = tmp_path / "store.bin"
+        write(path, {})
+        with FragmentStore(path) as store:
+            assert len(store) == 0
+            assert store.get("key") is None
+
+    @pytest.mark.parametrize("content", [b"", b"PLUMKDOC", b"not a store at all, longer"])
+    def test_invalid_files(self, tmp_path, content):
+        """Test that files which are not stores are rejected."""
+        path = tmp_path / "store.bin"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            FragmentStore(path)
+
+    def test_truncated_file(self, tmp_path, entries):
+        """Test that a store cut in its index is rejected."""
+        path = tmp_path / "store.bin"
+        write(path, entries)
+        path.write_bytes(path.read_bytes()[:60])
+        with pytest.raises(ValueError, match="truncated"):
+            FragmentStore(path)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_permissions(self, tmp_path, entries):
+        """Test that the store gets the permissions of a file created with `open`."""
+        path = tmp_path / "store.bin"
+        umask = os.umask(0o022)
+        try:
+            write(path, entries)
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
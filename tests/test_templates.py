@@ -0,0 +1,76 @@
+"""Tests for the templates of the HTML output."""
+
+import os
+
+from plumkdocs import main
+from plumkdocs.main import define_env, mod_to_string
+from plumkdocs.templates import DEFAULT_TEMPLATES, Templates, from_options
+
+MODULE = "tests.fixtures.sample_functions"
+
+
+class TestTemplates:
+    """Tests for the Templates class."""
+
+    def test_defaults(self):
+        """Test rendering a built-in template."""
+        text = Templates().render("signature.html", code="f()")
+        assert (
+            text
+            == '<h3 class="doc doc-heading"><code class="highlight language-python">f()</code></h3>'
+        )
+
+    def test_compiled_once(self):
+        """Test that templates are only compiled on first use."""
+        templates = Templates()
+        assert templates.get("overload.html") is templates.get("overload.html")
+
+    def test_write_appends_to_buffer(self):
+        """Test that the output is appended to a list buffer."""
+        buffer = ["before"]
+        Templates().write(buffer, "overload.html", signature="S", doc="D")
+        assert "".join(buffer) == "beforeS\n\nD\n"
+
+    def test_override(self, tmp_path):
+        """Test that templates of the directory take precedence."""
+        (tmp_path / "signature.html").write_text("<h4>{{ code }}</h4>")
+        templates = Templates(str(tmp_path))
+        assert templates.render("signature.html", code="f()") == "<h4>f()</h4>"
+        # The other templates are the built-in ones
+        assert (
+            templates.get("returns.html")
+            .render(returns=[], descriptions=[])
+            .startswith(DEFAULT_TEMPLATES["returns.html"][:20])
+        )
+
+    def test_fingerprint(self, tmp_path):
+        """Test that overriding a template changes the fingerprint."""
+        default = Templates(str(tmp_path)).fingerprint
+        assert default == Templates().fingerprint
+        (tmp_path / "overload.html").write_text("{{ signature }}{{ doc }}")
+        assert Templates(str(tmp_path)).fingerprint != default
+
+    def test_from_options(self, tmp_path):
+        """Test that the directory is relative to mkdocs.yml."""
+        templates = from_options({"templates_dir": "overrides"}, str(tmp_path / "mkdocs.yml"))
+        assert templates.directory == os.path.join(str(tmp_path), "overrides")
+        assert from_options({}).directory is None
+
+
+class TestTemplatesOption:
+    """Tests for the templates_dir option."""
+
+    def test_fragments_use_overrides(self, mock_env, tmp_path):
+        """Test that the macro output uses the templates of mkdocs.yml."""
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "implementations.html").write_text(
+            '<div class="api">{{ doc }}{% for text in overloads %}{{ text }}{% endfor %}</div>'
+        )
+        mock_env.conf = {"config_file_path": str(tmp_path / "mkdocs.yml")}
+        mock_env.variables = {"plumkdocs": {"templates_dir": "templates"}}
+        define_env(mock_env)
+
+        text = mod_to_string(MODULE, "simple_func")
+        assert text.startswith('<div class="api">')
+        assert "Concrete implementations" not in text
+        assert main.renderer.templates.directory == str(tmp_path / "templates")
@@ -0,0 +1,95 @@
+"""Tests for the tracing of the build stages."""
+
+import json
+import logging
+
+from plumkdocs import tracing
+from plumkdocs.main import define_env, on_post_build
+from plumkdocs.tracing import Tracer, report_path, span
+
+MODULE = "tests.fixtures.sample_functions"
+
+
+class TestTracer:
+    """Tests for the Tracer class."""
+
+    def test_disabled_by_default(self):
+        """Test that spans do nothing without a tracer."""
+        assert tracing.tracer is None
+        assert span("stage") is span("other", module="m")
+
+    def test_spans(self, monkeypatch):
+        """Test that spans are recorded with their arguments."""
+        tracer = Tracer()
+        monkeypatch.setattr(tracing, "tracer", tracer)
+        with span("outer", module="m"):
+            with span("inner"):
+                pass
+
+        names = [event[0] for event in tracer.events]
+        assert names == ["inner", "outer"]
+        inner, outer = tracer.events
+        assert outer[2] <= inner[2] and inner[3] <= outer[3]
+        assert outer[5] == {"module": "m"}
+
+    def test_chrome_trace(self, tmp_path):
+        """Test that the export is a Chrome trace of complete events."""
+        tracer = Tracer()
+        with tracer.span("stage", args={"function": "f"}):
+            pass
+        path = tmp_path / "out" / "trace.json"
+        tracer.export(path)
+
+        (event,) = json.loads(path.read_text())["traceEvents"]
+        assert event["ph"] == "X"
+        assert event["name"] == "stage"
+        assert event["args"] == {"function": "f"}
+        assert event["dur"] >= 0
+
+    def test_summary(self):
+        """Test that macro calls and stages are totalled and sorted."""
+        tracer = Tracer()
+        tracer.record("implementations", "macro", 0, 1_000_000, {"module": "a", "function": None})
+        tracer.record("implementations", "macro", 0, 3_000_000, {"module": "b", "function": "f"})
+        tracer.record("implementations", "macro", 0, 1_000_000, {"module": "a", "function": None})
+        tracer.record("import", "stage", 0, 5_000_000, {"module": "a"})
+
+        macros, stages = tracer.summary()
+        assert macros == [
+            ("implementations('b', 'f')", 0.003, 1),
+            ("implementations('a')", 0.002, 2),
+        ]
+        assert stages == [("import", 0.005, 1)]
+
+    def test_report_path(self, tmp_path):
+        """Test that reports are written next to the site directory."""
+        config = {"site_dir": str(tmp_path / "site")}
+        assert report_path(config, "report.json") == str(tmp_path / "report.json")
+
+
+class TestTraceOption:
+    """Tests for the trace option."""
+
+    def test_build_is_traced(self, mock_env, tmp_path, caplog):
+        """Test that the stages of the macros are traced and summarized."""
+        mock_env.conf = {"site_dir": str(tmp_path / "site")}
+        mock_env.variables = {"plumkdocs": {"trace": True}}
+        define_env(mock_env)
+        mock_env.macros["implementations"](MODULE, "simple_func")
+
+        with caplog.at_level(logging.INFO, logger="mkdocs.plugins.plumkdocs"):
+            on_post_build(mock_env)
+
+        events = json.loads((tmp_path / "plumkdocs-trace.json").read_text())["traceEvents"]
+        names = {event["name"] for event in events}
+        assert {"implementations", "import", "scan", "extract", "render"} <= names
+        assert {"parse_docs", "markdown", "highlight"} <= names
+        assert f"implementations('{MODULE}', 'simple_func')" in caplog.text
+
+    def test_trace_file(self, mock_env, tmp_path):
+        """Test that the trace is written to the configured file."""
+        path = tmp_path / "trace.json"
+        mock_env.variables = {"plumkdocs": {"trace": True, "trace_file": str(path)}}
+        define_env(mock_env)
+        on_post_build(mock_env)
+        assert json.loads(path.read_text())["traceEvents"] == []
@@ -0,0 +1,192 @@
+"""Tests for the discovery of the plum functions of a package tree."""
+
+import logging
+import os
+
+import pytest
+
+from plumkdocs import cli, main
+from plumkdocs.bundle import Bundle
+from plumkdocs.main import define_env, pkg_to_strings
+from plumkdocs.walker import discover, walk_modules
+
+FUNCTION = '''
+from plum import Dispatcher
+
+dispatch = Dispatcher()
+
+
+@dispatch
+def {name}(x: int):
+    """Documentation of {name}."""
+    return x
+'''
+
+PACKAGES = {
+    "walked_pkg": "from ._impl import f\nfrom .sub import g\nalias = f\n",
+    "walked_pkg.sub": "from .mod import g\n",
+    "walked_pkg.tests": "",
+}
+
+MODULES = {
+    "walked_pkg._impl": FUNCTION.format(name="f"),
+    "walked_pkg.broken": "raise ImportError('broken on purpose')\n",
+    "walked_pkg.sub.mod": FUNCTION.format(name="g"),
+    "walked_pkg.tests.test_h": FUNCTION.format(name="h"),
+}
+
+
+@pytest.fixture
+def package(write_module):
+    """Write a package re-exporting its functions, importable for the test."""
+    for name, source in PACKAGES.items():
+        write_module(name, source, package=True)
+    for name, source in MODULES.items():
+        write_module(name, source)
+    return "walked_pkg"
+
+
+class TestWalkModules:
+    """Tests for walk_modules."""
+
+    def test_all_modules(self, package):
+        """Test that the package and its submodules are listed recursively."""
+        assert walk_modules(package) == [
+            "walked_pkg",
+            "walked_pkg._impl",
+            "walked_pkg.broken",
+            "walked_pkg.sub",
+            "walked_pkg.sub.mod",
+            "walked_pkg.tests",
+            "walked_pkg.tests.test_h",
+        ]
+
+    def test_filters(self, package):
+        """Test that the patterns also match the submodules."""
+        modules = walk_modules(package, exclude=["walked_pkg.tests", "*.broken"])
+        assert modules == ["walked_pkg", "walked_pkg._impl", "walked_pkg.sub", "walked_pkg.sub.mod"]
+        assert walk_modules(package, include=["walked_pkg.sub"]) == [
+            "walked_pkg.sub",
+            "walked_pkg.sub.mod",
+        ]
+
+    def test_module(self):
+        """Test that a plain module is its only module."""
+        assert walk_modules("tests.fixtures.sample_functions") == [
+            "tests.fixtures.sample_functions"
+        ]
+
+
+class TestDiscover:
+    """Tests for discover."""
+
+    def test_functions_are_documented_once(self, package, caplog):
+        """Test that re-exports are dropped and broken modules skipped."""
+        with caplog.at_level(logging.WARNING, logger="mkdocs.plugins.plumkdocs"):
+            discovered = discover(package, exclude=["walked_pkg.tests"], workers=4)
+
+        names = {module: [name for name, _ in ops] for module, ops in discovered}
+        assert names == {"walked_pkg._impl": ["f"], "walked_pkg.sub.mod": ["g"]}
+        assert "skipping walked_pkg.broken" in caplog.text
+
+    def test_excluded_definition(self, package):
+        """Test that functions defined in excluded modules are kept where exported."""
+        discovered = discover(package, exclude=["*._impl", "*.broken", "*.tests"])
+        names = {module: [name for name, _ in ops] for module, ops in discovered}
+        # `alias` and `f` are the same function, documented under its first name
+        assert names == {"walked_pkg": ["alias"], "walked_pkg.sub.mod": ["g"]}
+
+    @pytest.mark.parametrize("mode", ["isolation", "static"])
+    def test_other_introspection_modes(self, package, mock_env, mode):
+        """Test that re-exports are dropped when each module describes its functions."""
+        mock_env.variables = {"plumkdocs": {mode: True}}
+        define_env(mock_env)
+        discovered = discover(package, exclude=["walked_pkg.tests", "*.broken"])
+        names = {module: [name for name, _ in ops] for module, ops in discovered}
+        assert names == {"walked_pkg._impl": ["f"], "walked_pkg.sub.mod": ["g"]}
+
+
+class TestPkgToStrings:
+    """Tests for pkg_to_strings and its macro."""
+
+    def test_each_function_is_rendered_once(self, package, monkeypatch):
+        """Test that the functions are rendered in a single batch, then cached."""
+        batches = []
+        render = main._render_functions
+
+        def record(operators):
+            batches.append([name for name, _ in operators])
+            return render(operators)
+
+        monkeypatch.setattr(main, "_render_functions", record)
+        fragments = pkg_to_strings(package, exclude=["walked_pkg.tests", "*.broken"])
+        assert list(fragments) == ["walked_pkg._impl", "walked_pkg.sub.mod"]
+        assert "Documentation of f." in fragments["walked_pkg._impl"]
+        assert batches == [["f", "g"]]
+
+        assert pkg_to_strings(package, exclude=["walked_pkg.tests", "*.broken"]) == fragments
+        assert len(batches) == 2 and batches[1] == []
+
+    def test_macro(self, mock_env, package):
+        """Test that the macro renders the whole package."""
+        define_env(mock_env)
+        text = mock_env.macros["package_implementations"](package, exclude=["*.broken"])
+        for name in "fgh":
+            assert f"Documentation of {name}." in text
+
+
+class TestRecursiveCli:
+    """Tests for the --recursive option of the plumkdocs command."""
+
+    def test_recursive(self, package, tmp_path, monkeypatch):
+        """Test that the submodules of the package are rendered to the bundle."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli, "_rendered", {})
+        output = tmp_path / "bundle.bin"
+        cli.main([package, "--recursive", "--exclude", "*.broken", "-o", str(output)])
+
+        loaded = Bundle.load(output)
+        try:
+            assert "Documentation of g." in loaded.get("walked_pkg.sub.mod", "g")
+            assert "Documentation of g." in loaded.get("walked_pkg", "g")
+            assert "walked_pkg.tests.test_h" in loaded.modules
+            assert loaded.package(package) is None
+            expected = pkg_to_strings(package, exclude=["*.broken"])
+            assert loaded.package(package, exclude=["*.broken"]) == expected
+        finally:
+            loaded.close()
+
+    def test_new_submodule_is_noticed(self, package, tmp_path, monkeypatch):
+        """Test that the package fragments are stale once a submodule is added."""
+        monkeypatch.chdir(tmp_path)
+        output = tmp_path / "bundle.bin"
+        cli.prerender(
+            ["walked_pkg", "walked_pkg._impl"], output, packages=[(package, ["*._impl"], None)]
+        )
+        loaded = Bundle.load(output)
+        assert list(loaded.package(package, ("*._impl",))) == ["walked_pkg._impl"]
+        loaded.close()
+
+        (tmp_path / "walked_pkg" / "new.py").write_text("")
+        os.utime(tmp_path / "walked_pkg", ns=(0, 0))
+        loaded = Bundle.load(output)
+        assert loaded.package(package, ("*._impl",)) is None
+        loaded.close()
+
+    def test_package_macro_is_served_from_bundle(self, package, mock_env, tmp_path, monkeypatch):
+        """Test that package_implementations is served from the bundle."""
+        monkeypatch.setattr(cli, "_rendered", {})
+        output = tmp_path / "bundle.bin"
+        cli.prerender(
+            walk_modules(package, exclude=["*.broken"]),
+            output,
+            packages=[(package, None, ["*.broken"])],
+        )
+        expected = "".join(Bundle.load(output).package(package, None, ["*.broken"]).values())
+
+        mock_env.variables = {"plumkdocs": {"bundle": str(output)}}
+        define_env(mock_env)
+        monkeypatch.setattr(main._walker, "discover", None)
+        assert mock_env.macros["package_implementations"](package, exclude=["*.broken"]) == (
+            expected
+        )